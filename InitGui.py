@@ -73,12 +73,27 @@ class Templater (Workbench):
         import TitleBlock_KG
         import TemplaterTemplateWikiCmd
         import TemplaterTemplateMultiCmd
+        import TemplaterFillCmd
+        import TemplaterChangeFormatCmd
+        import TemplaterZoneCmd
+        import TemplaterTemplatePack
+        import TemplaterSymbolLibrary
+        #- build the pack of standard templates if missing or outdated,
+        #  without blocking the start
+        TemplaterTemplatePack.startBuild()
+        #- index the symbol directories without blocking the start
+        TemplaterSymbolLibrary.startScan()
         #- a list of command names created in the line above
         self.list = [
             "Templater_AuxView",
             "Templater_ToleranceFrame",
             "Templater_NewTemplateWiki",
-            "Templater_NewTemplateMulti"
+            "Templater_NewTemplateMulti",
+            "Templater_ReplaceTemplate",
+            "Templater_ChangeFormat",
+            "Templater_FillTexts",
+            "Templater_AutofillTexts",
+            "Templater_ZoneReport"
             ]
         #- create a new toolbar with these commands
         self.appendToolbar(QT_TRANSLATE_NOOP("Workbench", "Templater"), self.list)
@@ -33,9 +33,9 @@ I have tried to follow this naming rule:
 """
 
 # imports and constants
-import time, os
+import time, os, re
+import collections, threading
 import FreeCAD
-from FreeCAD import Gui
 from PySide import QtCore
 from PySide.QtGui import QMessageBox
 
@@ -44,15 +44,18 @@ icons_path = os.path.join(mod_path, "Resources", "icons")
 symbols_path = os.path.join(mod_path, "Resources", "symbols")
 translations_path = os.path.join(mod_path, "Resources", "translations")
 
-#- Adds the translations folder path to the default search paths
-Gui.addLanguagePath(translations_path)
-Gui.updateLocale()
-
 def isGuiLoaded():
     if hasattr(FreeCAD, "GuiUp"):
         return FreeCAD.GuiUp
     return False
 
+#- Adds the translations folder path to the default search paths
+#  (only if there is a Gui, the svg methods also run in FreeCADCmd)
+if isGuiLoaded():
+    from FreeCAD import Gui
+    Gui.addLanguagePath(translations_path)
+    Gui.updateLocale()
+
 # Methods to write svg code:
 
 def levelOfIndentation(indent_level = 0):
@@ -149,11 +152,50 @@ def ediText(entry_name, x, y, str_value, str_angle="0"):
         EN = entry_name, AF = afk, X = x, Y = y, SV = str_value, SA = str_angle
         )
 
+def editableNames(svg):
+    """Returns the names of the editable texts in the order of the svg code"""
+    return re.findall(r"freecad:editable=\"([^\"]*)\"", svg)
+
+#- Read resource files {path: (mtime, size, content)}, most recently used
+#  last, and the number of files kept
+resource_cache = collections.OrderedDict()
+resource_lock = threading.Lock()
+RESOURCE_CACHE_SIZE = 32
+
+def readResource(file_path):
+    """
+    Returns the content of a text file, e.g. a symbol, read from disk
+    only if it is new or its modification time or size has changed
+    """
+    file_path = os.path.abspath(file_path)
+    stat = os.stat(file_path)
+    with resource_lock:
+        cached = resource_cache.get(file_path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            resource_cache.move_to_end(file_path)
+            return cached[2]
+    r = open(file_path, "r", encoding="utf-8")
+    content = r.read()
+    r.close()
+    with resource_lock:
+        resource_cache[file_path] = (stat.st_mtime_ns, stat.st_size, content)
+        resource_cache.move_to_end(file_path)
+        while len(resource_cache) > RESOURCE_CACHE_SIZE:
+            resource_cache.popitem(last = False)
+    return content
+
+def forgetResource(file_path):
+    """Drops a file from the resource cache, e.g. before it is rewritten"""
+    with resource_lock:
+        resource_cache.pop(os.path.abspath(file_path), None)
+
 def createSvgFile(file_path):
     """
     Creates a file and insert a header line
     (with t as the space saving variant of template)
     """
+    #- A rewritten file may keep its size and modification time
+    forgetResource(file_path)
     t = open(file_path, "w")  # w = write, overwrites existing files
     t.write("<?xml version=\"1.0\" encoding=\"UTF-8\" standalone=\"no\"?>")
     t.close
@@ -192,66 +234,41 @@ def endSvg(file_path):
 
 # Methods to calculate values:
 
+#- Sheet formats offered by the template tools and their sizes in mm
+SHEET_FORMATS = (
+    "ISO A0", "ISO A1", "ISO A2", "ISO A3", "ISO A4", "ISO A4-",
+    "ANSI A", "ANSI B", "ANSI C", "ANSI D", "ANSI E",
+    "Arch A", "Arch B", "Arch C", "Arch D", "Arch E", "Arch E1"
+    )
+SHEET_SIZES = {
+    "ISO A0":(1189, 841), "ISO A1":(841, 594), "ISO A2":(594, 420),
+    "ISO A3":(420, 297), "ISO A4":(210, 297), "ISO A4-":(297, 210),
+    "ANSI A":(216, 279), "ANSI B":(432, 279), "ANSI C":(559, 432),
+    "ANSI D":(864, 559), "ANSI E":(1118, 864),
+    "Arch A":(229, 305), "Arch B":(457, 305), "Arch C":(610, 457),
+    "Arch D":(914, 610), "Arch E":(1219, 914), "Arch E1":(1067, 762)
+    }
+
+def formatOfSize(width, height, tolerance = 1.0):
+    """
+    Returns the name of the sheet format with the given size in mm
+    or False if there is none
+    """
+    for format in SHEET_FORMATS:
+        format_width, format_height = SHEET_SIZES[format]
+        if (abs(format_width - float(width)) <= tolerance
+            and abs(format_height - float(height)) <= tolerance):
+            return format
+    return False
+
 def sheetDimensions(format):
     """
     Returns width and height acccording to a given format string
     """
-    if format.startswith("ANS"):
-        if format.endswith("A"):
-            width  = "216"
-            height = "279"
-        elif format.endswith("B"):
-            width  = "432"
-            height = "279"
-        elif format.endswith("C"):
-            width  = "559"
-            height = "432"
-        elif format.endswith("D"):
-            width  = "864"
-            height = "559"
-        else: # E
-            width  = "1118"
-            height = "864"
-    elif format.startswith("Arc"):
-        if format.endswith("A"):
-            width  = "229"
-            height = "305"
-        elif format.endswith("B"):
-            width  = "457"
-            height = "305"
-        elif format.endswith("C"):
-            width  = "610"
-            height = "457"
-        elif format.endswith("D"):
-            width  = "914"
-            height = "610"
-        elif format.endswith("E"):
-            width  = "1219"
-            height = "914"
-        else: # E1
-            width  = "1067"
-            height = "762"
-    else: # ISO
-        if format.endswith("4-"):
-            width  = "297"
-            height = "210"
-        elif format.endswith("4"):
-            width  = "210"
-            height = "297"
-        elif format.endswith("3"):
-            width  = "420"
-            height = "297"
-        elif format.endswith("2"):
-            width  = "594"
-            height = "420"
-        elif format.endswith("1"):
-            width  = "841"
-            height = "594"
-        else: # A0
-            width  = "1189"
-            height = "841"
+    #- Unknown formats fall back to ISO A0
+    width, height = SHEET_SIZES.get(format, SHEET_SIZES["ISO A0"])
     print(format, width, height)
-    return (width, height)
+    return (str(width), str(height))
 
 def drawingAreaOffsets(top = 10, bottom = 10, left = 20, right = 10):
     """
@@ -670,6 +687,28 @@ stroke-linecap:miter;stroke-miterlimit:4\">\n")
     t.write(loi + "</g>\n\n")
     t.close
 
+def indexCounts(sheet_width):
+    """
+    Returns the number of horizontal and vertical zone indices,
+    zones are 50 mm wide and centered on the drawing area
+    """
+    # this needs to be extended for American formats
+    if sheet_width == "420": # format == "DIN-A3":
+        return (8, 6)
+    elif sheet_width == "594": # format == "DIN-A2":
+        return (12, 8)
+    elif sheet_width == "841": # format == "DIN-A1":
+        return (16, 12)
+    elif sheet_width == "1189": # format == "DIN-A0":
+        return (24, 16)
+    return (0, 0)
+
+def indexLetter(number):
+    """Returns the letter of the n-th zone row from the top, J is left out"""
+    if number > 9:
+        return chr(64 + number + 1)
+    return chr(64 + number)
+
 def createDecorations(
     file_path, sheet_size, da_offsets, if_offsets, tilt = "0"
     ):
@@ -733,22 +772,7 @@ stroke-linecap:round\">\n")
     index_lower = str(int(frame_height) + da_top)
 
     #- set number of horizontal and vertical indices
-    # this needs to be extended for American formats
-    if sheet_width == "420": # format == "DIN-A3":
-        index_count_x = 8
-        index_count_y = 6
-    elif sheet_width == "594": # format == "DIN-A2":
-        index_count_x = 12
-        index_count_y = 8
-    elif sheet_width == "841": # format == "DIN-A1":
-        index_count_x = 16
-        index_count_y = 12
-    elif sheet_width == "1189": # format == "DIN-A0":
-        index_count_x = 24
-        index_count_y = 16
-    else :
-        index_count_x = 0
-        index_count_y = 0
+    index_count_x, index_count_y = indexCounts(sheet_width)
 
     #- index_center and index_middle contain strings but floating point
     #   numbers are needed to calculate
@@ -818,29 +842,14 @@ font-family:osifont\">\n")
         max = int(index_count_y / 2)
         for value in range(0, max):
             index_y = str(float_middle + value * 50 + 25)
-            if int(index_count_y / 2 + value + 1) > 9 :
-                # This avoids the letter J
-                t.write(loi + svgText(index_left, index_y,
-                    chr(64 + int(index_count_y / 2 + value + 2))) + "\n"
-                    )
-                t.write(loi + svgText(index_right, index_y,
-                    chr(64 + int(index_count_y / 2 + value + 2)), tilt) + "\n"
-                    )
-            else :
-                t.write(loi + svgText(index_left, index_y,
-                    chr(64 + int(index_count_y / 2 + value + 1))) + "\n"
-                    )
-                t.write(loi + svgText(index_right, index_y,
-                    chr(64 + int(index_count_y / 2 + value + 1)), tilt) + "\n"
-                    )
-            # no J expected below
+            # This avoids the letter J
+            letter = indexLetter(int(index_count_y / 2 + value + 1))
+            t.write(loi + svgText(index_left, index_y, letter) + "\n")
+            t.write(loi + svgText(index_right, index_y, letter, tilt) + "\n")
             index_y = str(float_middle - value * 50 - 25)
-            t.write(loi + svgText(index_left, index_y,
-                chr(64 + int(index_count_y / 2 - value))) + "\n"
-                )
-            t.write(loi + svgText(index_right, index_y,
-                chr(64 + int(index_count_y / 2 - value)), tilt) + "\n"
-                )
+            letter = indexLetter(int(index_count_y / 2 - value))
+            t.write(loi + svgText(index_left, index_y, letter) + "\n")
+            t.write(loi + svgText(index_right, index_y, letter, tilt) + "\n")
 
         loi = levelOfIndentation(2)
         t.write(loi + "</g>\n\n")
@@ -1068,11 +1077,8 @@ def existingPages(document):
     """
     Counts existing pages in the given document
     """
-    number_of_pages = 0
-    for item in document.Objects:
-        if item.Name.startswith("Page"):
-            number_of_pages += 1
-    return number_of_pages
+    import TemplaterPages
+    return TemplaterPages.countPages(document)
 
 def getDate():
     today = time.strftime("%Y-%m-%d") # %Y: YYYY, %y: YY
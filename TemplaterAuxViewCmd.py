@@ -41,6 +41,9 @@ import FreeCAD
 import os    # built-in modules
 import math  # to use some predefined conversions
 import SvgToolkit
+import TemplaterCommand
+import TemplaterLayout
+import TemplaterPages
 from TechDrawTools import TDToolsUtil
 from PySide import QtCore
 from PySide.QtCore import QT_TRANSLATE_NOOP
@@ -61,6 +64,23 @@ class TaskAuxView():
         self.dir_tag = dir_tag
         self.view_tag = view_tag
 
+        #- Orientation as created, the checkboxes are applied to it
+        self.initial_direction = FreeCAD.Vector(new_view.Direction)
+        self.initial_x_direction = FreeCAD.Vector(new_view.XDirection)
+        self.initial_rotation = float(new_view.Rotation)
+        self.initial_arrow = float(new_symbol.Rotation)
+        self.reverse = False
+        self.along = False
+        #- Checkbox states (reverse, along) the view was last placed with
+        self.applied = (False, False)
+        #- Changes are applied in one recompute once the input pauses
+        self.scheduler = TemplaterCommand.RedrawScheduler(
+            new_view.Document,
+            [TemplaterPages.getPageOfView(new_view)],
+            self.applyOrientation,
+            "Auxiliary view"
+            )
+
         self.setWindowTexts()
 
         #- Add a Box container to group widgets
@@ -128,47 +148,18 @@ class TaskAuxView():
 
     def onLineEditMarker(self, value):
         """Renames the view markers"""
-        self.dir_tag.Text = value
-        self.view_tag.Text = ("AuxView " + value)
+        self.scheduler.change(self.dir_tag, "Text", value)
+        self.scheduler.change(self.view_tag, "Text", ["AuxView " + value])
 
     def onCheckboxReverseChanged(self, value):
         """Reverses the direction and the view arrow"""
-        self.reverseDirection()
-        self.reverseArrow()
+        self.reverse = bool(value)
+        self.scheduler.schedule()
 
     def onCheckboxAlongChanged(self, value):
-        """Reverses the direction and the view arrow"""
-        if value:
-            self.alignDirection(90)
-            self.alignArrow(90)
-        else:
-            self.alignDirection(-90)
-            self.alignArrow(-90)
-
-    def reverseArrow(self):
-        """2D - Reverses the view arrow"""
-        angle = float(self.symbol.Rotation)
-        if angle >180:
-            angle -= 180
-        else:
-            angle += 180
-        self.symbol.Rotation = angle
-
-    def alignArrow(self, align_angle):
-        """2D - Aligns the view arrow by turning it 90°"""
-        angle = float(self.symbol.Rotation)
-        if align_angle > 0:
-            if angle < 270:
-                angle += 90
-            else:
-                angle -= 270
-        else:
-            if angle < 90:
-                angle += 270
-            else:
-                angle -= 90
-
-        self.symbol.Rotation = angle
+        """Aligns the direction and the view arrow with the edge"""
+        self.along = bool(value)
+        self.scheduler.schedule()
 
     def rotateVector(self, direction_vector, axis_vector, align_angle = 180):
         """
@@ -182,49 +173,51 @@ class TaskAuxView():
         #- Apply rotation
         return vector_rotation.multVec(direction_vector)
 
-    def reverseDirection(self):
-        """3D - Reverses the view direction"""
-        #- Rotate the view around its x axis:
-        self.view.Direction = self.rotateVector(
-            self.view.Direction,
-            self.view.XDirection
-            )
-        Gui.runCommand("TechDraw_RedrawPage",0)
-
-    def alignDirection(self, align_angle):
+    def applyOrientation(self):
         """
-        3D - Changes the alignment of the view direction (line of sight).
-        A positive align_angle value (90) changes from perpendicular (default)
-        to parallel while a negative value (-90) reverts to perpendicular.
-        The checkbox logic allows only one step forward and one back again.
+        Sets direction, x direction, rotation and arrow angle from the
+        initial orientation and the checkbox states.
+        Reversing and aligning commute, so the result does not depend on
+        the order or number of clicks. Nothing is changed unless a checkbox
+        state changed, a view moved by hand stays where it is.
         """
-        #- Tilt back the view around its x axis:
-        self.view.Direction = self.rotateVector(
-            self.view.Direction,
-            self.view.XDirection,
-            align_angle
-            )
-        #- Turn the view around the base view's z axis:
-        self.view.XDirection = self.rotateVector(
-            self.view.XDirection,
-            self.view.BaseView.Direction,
-            (align_angle * -1)
-            )
-        #- Tilt the view to its new alignment:
-        self.view.Direction = self.rotateVector(
-            self.view.Direction,
-            self.view.XDirection,
-            align_angle
-            )
-        #- Adapt the rotation of the view according to the page
-        self.view.Rotation = float(self.view.Rotation) + (align_angle * -1)
-        Gui.runCommand("TechDraw_RedrawPage",0)
+        if (self.reverse, self.along) == self.applied:
+            return
+        direction = FreeCAD.Vector(self.initial_direction)
+        x_direction = FreeCAD.Vector(self.initial_x_direction)
+        rotation = self.initial_rotation
+        arrow = self.initial_arrow
+        if self.along:
+            #- Tilt back the view around its x axis:
+            direction = self.rotateVector(direction, x_direction, 90)
+            #- Turn the view around the base view's z axis:
+            x_direction = self.rotateVector(
+                x_direction, self.view.BaseView.Direction, -90
+                )
+            #- Tilt the view to its new alignment:
+            direction = self.rotateVector(direction, x_direction, 90)
+            #- Adapt the rotation of the view according to the page
+            rotation -= 90
+            arrow += 90
+        if self.reverse:
+            #- Rotate the view around its x axis:
+            direction = self.rotateVector(direction, x_direction)
+            arrow += 180
+        self.view.XDirection = x_direction
+        self.view.Direction = direction
+        self.view.Rotation = rotation
+        self.symbol.Rotation = arrow % 360
+        #- The view follows its new line of sight
+        placeAuxView(self.view)
+        self.applied = (self.reverse, self.along)
 
     def accept(self):
         """slot: OK pressed"""
+        self.scheduler.flush()
         Gui.Control.closeDialog()
 
     def reject(self):
+        self.scheduler.cancel()
         return True
 
 def getActiveDocument():
@@ -236,21 +229,6 @@ def getActiveDocument():
     TDToolsUtil.displayMessage("AuxView", message)
     return False
 
-def getPageOfSelection(doc, b_view):
-    """Retrieves the Page that holds the selected elements"""
-    #- Find an object starting with 'Page' that contains the selected object
-    for each in doc.Objects:
-        if each.Name.startswith("Page"):
-            for item in each.OutList: # Search items belonging to a Page object
-                if item.Name.startswith("ProjGroup"): # Look into projection groups
-                    for view in item.OutList: # Search views belonging to a ProjGroup object
-                        if view.Name == b_view.Name:
-                            return each
-                else:
-                    if item.Name == b_view.Name:
-                        return each
-    return False
-
 def getCcwAngle(vertex1,vertex2,view_rotation):
     """
     Creates 3D vectors to calculate the 2D angle towards the x direction of the
@@ -295,6 +273,19 @@ def symbolAngle(vertex1,vertex2):
         angle_y *= -1  # switches angle orientation
     return angle_y
 
+def placeAuxView(view):
+    """
+    Places an auxiliary view next to its base view along its line of
+    sight, clear of the other views on the page
+    """
+    page = TemplaterPages.getPageOfView(view)
+    if not page or page.Template is None:
+        return False
+    return TemplaterLayout.placeAlong(
+        page, view, view.BaseView,
+        TemplaterLayout.auxViewDirection(view, view.BaseView)
+        )
+
 def mainSection():
     """
     The main section, no more, no less
@@ -319,80 +310,79 @@ def mainSection():
     else:
         return
     #- Retrieve the page that holds the view
-    work_page = getPageOfSelection(active_doc, base_view)
-    #- To see changes immediately
-    work_page.KeepUpdated = True
+    work_page = TemplaterPages.getPageOfView(base_view)
+    if not work_page:
+        return
     # At this point the input elements are gathered:
     #  active_doc, work_page, base_view, and vertices
 
-    #- Create a new view
-    new_view = active_doc.addObject("TechDraw::DrawViewPart", "AuxView")
-    #- Add the new view to the page
-    work_page.addView(new_view)
-    #- Add a BaseView property to the new view and link the BaseView object
-    #  to the BaseView property in one step
-    new_view.addProperty("App::PropertyLink", "BaseView", "AuxView",
-        "Base view of this auxiliary view"
-        ).BaseView = active_doc.getObject(base_view.Name)
-    #- Hand over the source objects
-    new_view.Source = new_view.BaseView.Source
-
-    #- 2D: Calculate the ccw angle between the x axes of base view and new view
-    turn_ccw = getCcwAngle(vertices[0],vertices[1],new_view.BaseView.Rotation)
-    # Returns a float value representing degrees
-
-    # 3D: Turn base_view.XDirection around base_view.Direction to get
-    #     new_view.XDirection
-    #- Create a rotation, angle input in float (for degrees), stored in rad
-    around_direction = FreeCAD.Rotation(new_view.BaseView.Direction, turn_ccw)
-    #- Apply rotation to the base_view.XDirection
-    new_view.XDirection = around_direction.multVec(new_view.BaseView.XDirection)
-    #- The cross-product of base view Z and new view X
-    #  gives new view Z direction
-    new_view.Direction = new_view.BaseView.Direction.cross(new_view.XDirection)
-
-    # 2D: Take base_view.Rotation into account, it has to be converted
-    #     to float since it is stored in deg
-    #- Add the rotation of the base view to the angle between the x axes
-    new_view.Rotation = turn_ccw + float(new_view.BaseView.Rotation)
-    # At this point the Auxiliary View is complete
-
-    #- Retrieve the view arrow
-    arrow_path = os.path.join(symbols_path, "ViewArrow.svg")
-    s = open(arrow_path, "r", encoding="utf-8")
-    svg = s.read()
-    s.close()
-
-    #- Create an arrow symbol
-    new_symbol = active_doc.addObject('TechDraw::DrawViewSymbol', 'ViewArrow')
-    new_symbol.Symbol = svg
-    new_symbol.Owner = base_view
-    new_symbol.Rotation = symbolAngle(vertices[0],vertices[1])
-    #- Add the new symbol to the page
-    work_page.addView(new_symbol)
-    #- Create a direction tag
-    dir_tag = active_doc.addObject('TechDraw::DrawViewAnnotation', 'AuxMarker')
-    dir_tag.Text = "X"
-    dir_tag.Owner = new_symbol
-    #- Add the new symbol to the page
-    work_page.addView(dir_tag)
-
-    #- Create a direction tag
-    view_tag = active_doc.addObject('TechDraw::DrawViewAnnotation', 'AuxHeader')
-    view_tag.Text = ["AuxView X"]
-    view_tag.Owner = new_view
-    #- Add the new symbol to the page
-    work_page.addView(view_tag)
-
-    Gui.runCommand("TechDraw_RedrawPage",0)
+    #- All objects are created in one undo step with a single redraw
+    with TemplaterCommand.commandTransaction(
+        active_doc, "Auxiliary view", [work_page]
+        ):
+        #- Create a new view
+        new_view = active_doc.addObject("TechDraw::DrawViewPart", "AuxView")
+        #- Add the new view to the page
+        work_page.addView(new_view)
+        #- Add a BaseView property to the new view and link the BaseView object
+        #  to the BaseView property in one step
+        new_view.addProperty("App::PropertyLink", "BaseView", "AuxView",
+            "Base view of this auxiliary view"
+            ).BaseView = active_doc.getObject(base_view.Name)
+        #- Hand over the source objects
+        new_view.Source = new_view.BaseView.Source
+
+        #- 2D: Calculate the ccw angle between the x axes of base view and new view
+        turn_ccw = getCcwAngle(vertices[0],vertices[1],new_view.BaseView.Rotation)
+        # Returns a float value representing degrees
+
+        # 3D: Turn base_view.XDirection around base_view.Direction to get
+        #     new_view.XDirection
+        #- Create a rotation, angle input in float (for degrees), stored in rad
+        around_direction = FreeCAD.Rotation(new_view.BaseView.Direction, turn_ccw)
+        #- Apply rotation to the base_view.XDirection
+        new_view.XDirection = around_direction.multVec(new_view.BaseView.XDirection)
+        #- The cross-product of base view Z and new view X
+        #  gives new view Z direction
+        new_view.Direction = new_view.BaseView.Direction.cross(new_view.XDirection)
+
+        # 2D: Take base_view.Rotation into account, it has to be converted
+        #     to float since it is stored in deg
+        #- Add the rotation of the base view to the angle between the x axes
+        new_view.Rotation = turn_ccw + float(new_view.BaseView.Rotation)
+        # At this point the Auxiliary View is complete
+
+        #- Retrieve the view arrow
+        arrow_path = os.path.join(symbols_path, "ViewArrow.svg")
+        svg = SvgToolkit.readResource(arrow_path)
+
+        #- Create an arrow symbol
+        new_symbol = active_doc.addObject('TechDraw::DrawViewSymbol', 'ViewArrow')
+        new_symbol.Symbol = svg
+        new_symbol.Owner = base_view
+        new_symbol.Rotation = symbolAngle(vertices[0],vertices[1])
+        #- Add the new symbol to the page
+        work_page.addView(new_symbol)
+        #- Create a direction tag
+        dir_tag = active_doc.addObject('TechDraw::DrawViewAnnotation', 'AuxMarker')
+        dir_tag.Text = "X"
+        dir_tag.Owner = new_symbol
+        #- Add the new symbol to the page
+        work_page.addView(dir_tag)
+
+        #- Create a direction tag
+        view_tag = active_doc.addObject('TechDraw::DrawViewAnnotation', 'AuxHeader')
+        view_tag.Text = ["AuxView X"]
+        view_tag.Owner = new_view
+        #- Add the new symbol to the page
+        work_page.addView(view_tag)
+
+        #- Move the view next to the base view, in the line of sight
+        placeAuxView(new_view)
 
     panel = TaskAuxView(new_view, new_symbol, dir_tag, view_tag)
     Gui.Control.showDialog(panel)
 
-    Gui.runCommand("TechDraw_RedrawPage",0)
-    #- To no longer see changes immediately
-    work_page.KeepUpdated = False
-
     return
 ##########################################################################################################
 # Gui code
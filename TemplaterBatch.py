@@ -0,0 +1,355 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2025 FBXL5 available on the forum:                      *
+# *   https://forum.freecad.org/memberlist.php?mode=viewprofile&u=26761     *
+# *                                                                         *
+# *   This file is part of FreeCAD.                                         *
+# *                                                                         *
+# *   FreeCAD is free software: you can redistribute it and/or modify it    *
+# *   under the terms of the GNU Lesser General Public License as           *
+# *   published by the Free Software Foundation, either version 3.0 of the  *
+# *   License, or (at your option) any later version.                       *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful, but        *
+# *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU      *
+# *   Lesser General Public License for more details.                       *
+# *                                                                         *
+# *   You should have received a copy of the GNU Lesser General Public      *
+# *   License along with FreeCAD. If not, see                               *
+# *   <https://www.gnu.org/licenses/>.                                      *
+# *                                                                         *
+# ***************************************************************************
+"""
+Headless batch re-templating of FCStd archives.
+Every page of every document gets a regenerated template, editable
+texts keep their values by name, and the document is saved.
+
+The driver runs with any python 3 and needs no FreeCAD:
+  python TemplaterBatch.py ARCHIVE [ARCHIVE ...] --options '{"ink":"#00d"}'
+      --workers 8 --log progress.jsonl --freecad FreeCADCmd --timeout 300
+ARCHIVE is an FCStd file or a folder searched recursively.
+It starts the given number of FreeCADCmd worker processes, each one
+re-templates documents handed to it one after the other.
+A worker that needs longer than the timeout for one document is killed,
+the document is logged as failed and a new worker takes over.
+Every finished document is appended to the progress log (JSON lines),
+a restarted run skips documents the log lists as done.
+At the end a timing report is printed.
+
+Options not given keep the values a page's template was created with,
+pages with foreign templates keep their sheet format.
+"""
+
+"""
+I have tried to follow this naming rule:
+ class names:    CamelCase
+ function names: mixedCase
+ constant names: ALL_CAPITAL + underscore
+ variable names: lower_case + underscore
+"""
+
+# imports and constants
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+#- Set in the environment of the worker processes
+WORKER_VARIABLE = "TEMPLATER_BATCH_WORKER"
+OPTIONS_VARIABLE = "TEMPLATER_BATCH_OPTIONS"
+#- Prefix of the result lines among FreeCAD's own console output
+RESULT_PREFIX = "TEMPLATER_RESULT "
+
+##########################################################################################################
+# Worker, runs inside FreeCADCmd
+##########################################################################################################
+
+def retemplateDocument(file_path, options, template_cache, template_dir):
+    """
+    Opens a document, replaces the templates of all pages and saves it.
+    Generated templates are cached per set of options for the next pages.
+    Returns the number of pages.
+    """
+    import FreeCAD
+    import TemplaterPages
+    import TemplaterTemplateMultiCmd
+    document = FreeCAD.openDocument(file_path, True)  # hidden
+    try:
+        pages = TemplaterPages.pagesOf(document)
+        for page in pages:
+            page_options = TemplaterTemplateMultiCmd.pageOptions(page, options)
+            key = json.dumps(page_options, sort_keys = True)
+            if key not in template_cache:
+                template_cache[key] = TemplaterTemplateMultiCmd.templateForSpec(
+                    page_options, template_dir
+                    )
+            TemplaterTemplateMultiCmd.regenerateTemplate(
+                page, page_options, template_cache[key]
+                )
+        if pages:
+            document.save()
+    finally:
+        FreeCAD.closeDocument(document.Name)
+    return len(pages)
+
+def runWorker():
+    """
+    Reads document paths from stdin, one per line, and writes one
+    result line per document to stdout
+    """
+    import shutil
+    import tempfile
+    options = json.loads(os.environ.get(OPTIONS_VARIABLE, "{}"))
+    template_cache = {}
+    template_dir = tempfile.mkdtemp(prefix = "Templater")
+    try:
+        for line in sys.stdin:
+            file_path = line.strip()
+            if not file_path:
+                continue
+            start = time.time()
+            result = {"file": file_path}
+            try:
+                result["pages"] = retemplateDocument(
+                    file_path, options, template_cache, template_dir
+                    )
+                result["status"] = "done"
+            except Exception as error:
+                result["status"] = "failed"
+                result["error"] = str(error)
+            result["seconds"] = round(time.time() - start, 3)
+            sys.stdout.write(RESULT_PREFIX + json.dumps(result) + "\n")
+            sys.stdout.flush()
+    finally:
+        shutil.rmtree(template_dir, ignore_errors = True)
+
+##########################################################################################################
+# Driver, runs with any python
+##########################################################################################################
+
+def findDocuments(archives):
+    """Returns the FCStd files given directly or found in folders"""
+    documents = []
+    for archive in archives:
+        if os.path.isdir(archive):
+            for folder, sub_folders, files in os.walk(archive):
+                sub_folders.sort()
+                for name in sorted(files):
+                    if name.lower().endswith(".fcstd"):
+                        documents.append(os.path.join(folder, name))
+        else:
+            documents.append(archive)
+    return [os.path.abspath(document) for document in documents]
+
+def readLog(log_path):
+    """Returns the documents the progress log lists as done"""
+    done = set()
+    if not os.path.exists(log_path):
+        return done
+    l = open(log_path, "r", encoding = "utf-8")
+    for line in l:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue  # a line cut off by an interrupted run
+        if entry.get("status") == "done":
+            done.add(entry["file"])
+    l.close()
+    return done
+
+class BatchDriver():
+    """
+    Hands documents to a pool of FreeCADCmd workers and logs the results
+    """
+    def __init__(self, freecad_cmd, options, log_path, workers = 4,
+        timeout = None):
+        self.freecad_cmd = freecad_cmd
+        self.options = options
+        self.log_path = log_path
+        self.workers = workers
+        self.timeout = timeout
+        self.log_lock = threading.Lock()
+        self.results = []
+
+    def startWorker(self):
+        """Starts a FreeCADCmd process running this file as worker"""
+        environment = dict(os.environ)
+        environment[WORKER_VARIABLE] = "1"
+        environment[OPTIONS_VARIABLE] = json.dumps(self.options)
+        return subprocess.Popen(
+            [self.freecad_cmd, os.path.abspath(__file__)],
+            stdin = subprocess.PIPE,
+            stdout = subprocess.PIPE,
+            env = environment,
+            universal_newlines = True,
+            bufsize = 1
+            )
+
+    def logResult(self, result):
+        """Appends a result to the progress log and the report"""
+        with self.log_lock:
+            l = open(self.log_path, "a", encoding = "utf-8")
+            l.write(json.dumps(result) + "\n")
+            l.close()
+            self.results.append(result)
+            print("{status:6} {seconds:8.2f} s  {file}".format(
+                status = result["status"], seconds = result["seconds"],
+                file = result["file"]
+                ))
+
+    def readLines(self, process, lines):
+        """
+        Hands the output lines of a worker over to a queue,
+        None marks the end of the output
+        """
+        for line in process.stdout:
+            lines.put(line)
+        lines.put(None)
+
+    def readResult(self, lines):
+        """
+        Returns the next result line of a worker, None if it died
+        or False if there is none within the timeout
+        """
+        deadline = None
+        if self.timeout:
+            deadline = time.time() + self.timeout
+        while True:
+            try:
+                if deadline is None:
+                    line = lines.get()
+                else:
+                    line = lines.get(timeout = max(0, deadline - time.time()))
+            except queue.Empty:
+                return False
+            if line is None:
+                return None
+            if line.startswith(RESULT_PREFIX):
+                return json.loads(line[len(RESULT_PREFIX):])
+
+    def serveWorker(self, documents):
+        """
+        Feeds one worker from the shared queue, a crashed or hung worker
+        is restarted and its document is logged as failed
+        """
+        process = None
+        while True:
+            try:
+                file_path = documents.get_nowait()
+            except queue.Empty:
+                break
+            if process is None:
+                process = self.startWorker()
+                lines = queue.Queue()
+                threading.Thread(
+                    target = self.readLines, args = (process, lines),
+                    daemon = True
+                    ).start()
+            start = time.time()
+            process.stdin.write(file_path + "\n")
+            process.stdin.flush()
+            result = self.readResult(lines)
+            if not result:
+                if result is False:
+                    process.kill()
+                    error = "timed out after " + str(self.timeout) + " s"
+                    process.wait()
+                else:
+                    error = "worker exited with " + str(process.wait())
+                result = {
+                    "file": file_path,
+                    "status": "failed",
+                    "error": error,
+                    "seconds": round(time.time() - start, 3)
+                    }
+                process = None
+            self.logResult(result)
+        if process is not None:
+            process.stdin.close()
+            process.wait()
+
+    def run(self, documents):
+        """Re-templates the documents that are not logged as done yet"""
+        done = readLog(self.log_path)
+        document_queue = queue.Queue()
+        for document in documents:
+            if document not in done:
+                document_queue.put(document)
+        skipped = len(documents) - document_queue.qsize()
+        if skipped:
+            print(skipped, "documents already done according to", self.log_path)
+        threads = []
+        for index in range(min(self.workers, document_queue.qsize())):
+            thread = threading.Thread(
+                target = self.serveWorker, args = (document_queue,)
+                )
+            thread.start()
+            threads.append(thread)
+        for thread in threads:
+            thread.join()
+        return self.results
+
+def timingReport(results, slowest = 10):
+    """Returns a text summarising the per-file timings"""
+    if not results:
+        return "Nothing to do"
+    done = [result for result in results if result["status"] == "done"]
+    failed = [result for result in results if result["status"] != "done"]
+    seconds = [result["seconds"] for result in results]
+    lines = [
+        "Documents: {} done, {} failed".format(len(done), len(failed)),
+        "Pages:     {}".format(sum(result.get("pages", 0) for result in done)),
+        "Time:      {:.1f} s in total, {:.2f} s per document".format(
+            sum(seconds), sum(seconds) / len(seconds)
+            ),
+        "Slowest documents:"
+        ]
+    for result in sorted(results, key = lambda r: r["seconds"])[::-1][:slowest]:
+        lines.append("  {:8.2f} s  {}".format(result["seconds"], result["file"]))
+    for result in failed:
+        lines.append("Failed: {}: {}".format(result["file"], result.get("error")))
+    return "\n".join(lines)
+
+def main():
+    """Reads the command line and runs the driver"""
+    import argparse
+    parser = argparse.ArgumentParser(
+        description = "Replaces the templates of all pages in FCStd files"
+        )
+    parser.add_argument("archives", nargs = "+",
+        help = "FCStd files or folders to search"
+        )
+    parser.add_argument("--options", default = "{}",
+        help = "template options as JSON, e.g. '{\"ink\":\"#00d\"}'"
+        )
+    parser.add_argument("--workers", type = int, default = os.cpu_count() or 4)
+    parser.add_argument("--log", default = "templater_batch.jsonl",
+        help = "progress log, a restarted run skips logged documents"
+        )
+    parser.add_argument("--freecad", default = "FreeCADCmd",
+        help = "FreeCAD command line executable"
+        )
+    parser.add_argument("--timeout", type = float, default = 600,
+        help = "seconds a worker may take for one document, 0 for no limit"
+        )
+    arguments = parser.parse_args()
+    driver = BatchDriver(
+        arguments.freecad, json.loads(arguments.options), arguments.log,
+        arguments.workers, arguments.timeout
+        )
+    results = driver.run(findDocuments(arguments.archives))
+    print(timingReport(results))
+
+if __name__ == "__main__":
+    if os.environ.get(WORKER_VARIABLE) == "1":
+        runWorker()
+    else:
+        main()
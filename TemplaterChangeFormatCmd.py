@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2025 FBXL5 available on the forum:                      *
+# *   https://forum.freecad.org/memberlist.php?mode=viewprofile&u=26761     *
+# *                                                                         *
+# *   This file is part of FreeCAD.                                         *
+# *                                                                         *
+# *   FreeCAD is free software: you can redistribute it and/or modify it    *
+# *   under the terms of the GNU Lesser General Public License as           *
+# *   published by the Free Software Foundation, either version 3.0 of the  *
+# *   License, or (at your option) any later version.                       *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful, but        *
+# *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU      *
+# *   Lesser General Public License for more details.                       *
+# *                                                                         *
+# *   You should have received a copy of the GNU Lesser General Public      *
+# *   License along with FreeCAD. If not, see                               *
+# *   <https://www.gnu.org/licenses/>.                                      *
+# *                                                                         *
+# ***************************************************************************
+"""
+Changes the sheet format of an existing page.
+The template is regenerated with its other options unchanged, the views
+move proportionally or keep their distance to the nearest corner of the
+drawing area, title block symbols move to the new lower right corner.
+The panel recommends the smallest sheet that holds the views, also
+while a scale factor for the views is changed.
+"""
+
+"""
+I have tried to follow this naming rule:
+ class names:    CamelCase
+ function names: mixedCase
+ constant names: ALL_CAPITAL + underscore
+ variable names: lower_case + underscore
+"""
+
+# imports and constants
+import FreeCAD
+import os     # built-in modules
+import shutil
+import tempfile
+import SvgToolkit
+import TemplaterCommand
+import TemplaterLayout
+import TemplaterPages
+import TemplaterTemplateMultiCmd
+from PySide.QtCore import QT_TRANSLATE_NOOP
+
+translate = FreeCAD.Qt.translate
+
+icons_path = SvgToolkit.icons_path
+
+#- Editable text of the title block that shows the format
+FORMAT_FIELD = "Format"
+
+def recommendationText(content_size, options):
+    """
+    Returns the smallest sheet of any format family that holds
+    content of the given size as a text for the panels
+    """
+    format = TemplaterLayout.recommendFormat(
+        content_size,
+        options["frame"] and options["title_block"],
+        options["bom_rows"]
+        )
+    if not format:
+        return translate("Templater", "Smallest fitting sheet: none")
+    return translate("Templater", "Smallest fitting sheet: ") + format
+
+def scaleViews(page, factor):
+    """Scales the part views and projection groups of a page by factor"""
+    for view in TemplaterLayout.placeableViews(page):
+        if (view.isDerivedFrom("TechDraw::DrawViewPart")
+            or view.isDerivedFrom("TechDraw::DrawProjGroup")
+            ):
+            if hasattr(view, "ScaleType"):
+                view.ScaleType = "Custom"
+            view.Scale = float(view.Scale) * factor
+
+def changeFormat(page, format, anchored = False, scale_factor = 1.0):
+    """
+    Replaces the template of a page by one of another format and moves
+    the views into the new drawing area, all in one recompute.
+    Optional scale_factor scales the part views as well.
+    Returns the new template object.
+    """
+    old_area = TemplaterLayout.pageArea(page)
+    new_area = TemplaterLayout.drawingArea(format)
+    old_format = TemplaterTemplateMultiCmd.pageOptions(page)["format"]
+    options = TemplaterTemplateMultiCmd.pageOptions(page, {"format":format})
+    #- The page keeps a copy of the generated file, see replaceTemplate
+    template_dir = tempfile.mkdtemp(prefix = "Templater")
+    try:
+        template_path = TemplaterTemplateMultiCmd.templateForSpec(
+            options, template_dir
+            )
+        with TemplaterCommand.commandTransaction(
+            page.Document, "Change format", [page]
+            ):
+            template = TemplaterPages.replaceTemplate(page, template_path)
+            TemplaterTemplateMultiCmd.storeOptions(template, options)
+            texts = template.EditableTexts
+            if texts.get(FORMAT_FIELD) == old_format:
+                texts[FORMAT_FIELD] = format
+                template.EditableTexts = texts
+            if scale_factor != 1.0:
+                scaleViews(page, scale_factor)
+            for view in TemplaterLayout.placeableViews(page):
+                symbol_size = False
+                if TemplaterLayout.isTitleBlock(view):
+                    symbol_size = TemplaterLayout.symbolSize(view.Symbol)
+                if symbol_size:
+                    view.X, view.Y = TemplaterLayout.titleBlockPosition(
+                        new_area, symbol_size
+                        )
+                else:
+                    view.X, view.Y = TemplaterLayout.mapPosition(
+                        float(view.X), float(view.Y), old_area, new_area,
+                        anchored
+                        )
+    finally:
+        shutil.rmtree(template_dir, ignore_errors = True)
+    return template
+
+##########################################################################################################
+# Gui code
+##########################################################################################################
+
+if SvgToolkit.isGuiLoaded():
+    from FreeCAD import Gui
+    from PySide.QtGui import QGroupBox, QMessageBox
+    from PySide.QtWidgets import (QGridLayout, QLabel, QComboBox, QCheckBox,
+        QDoubleSpinBox
+        )
+
+    ##########################################################################################################
+    # Task Panel
+    ##########################################################################################################
+
+    class ChangeFormatTaskPanel():
+        """Selects the new format and how the views are moved"""
+        def __init__(self, page):
+            self.page = page
+            self.options = TemplaterTemplateMultiCmd.pageOptions(page)
+            #- Measured once, a scale factor only multiplies the size
+            self.boxes = TemplaterLayout.viewBoxes(page)
+
+            self.setWindowTexts()
+
+            #- Add a Box container to group widgets
+            self.groupBox = QGroupBox(self.text_panel)
+            #- Add a grid to order widgets
+            self.grid = QGridLayout()
+            self.groupBox.setLayout(self.grid)
+
+            #- Add some labels to the grid
+            self.label_format = QLabel(self.text_format)
+            self.grid.addWidget(self.label_format, 0, 0)
+
+            #- Set up a ComboBox - Format
+            self.coBox_format = QComboBox()
+            self.coBox_format.setToolTip(self.tooltip_format)
+            self.coBox_format.addItems(SvgToolkit.SHEET_FORMATS)
+            self.coBox_format.setCurrentText(
+                TemplaterTemplateMultiCmd.pageOptions(page)["format"]
+                )
+            self.grid.addWidget(self.coBox_format, 0, 1)
+
+            #- Set up a CheckBox - Anchored
+            self.checkBox_anchored = QCheckBox(self.text_anchored)
+            self.checkBox_anchored.setToolTip(self.tooltip_anchored)
+            self.checkBox_anchored.setChecked(False)
+            self.grid.addWidget(self.checkBox_anchored, 1, 1)
+
+            #- Set up a DoubleSpinBox - Scale factor of the views
+            self.label_scale = QLabel(self.text_scale)
+            self.grid.addWidget(self.label_scale, 2, 0)
+            self.dsBox_scale = QDoubleSpinBox()
+            self.dsBox_scale.setToolTip(self.tooltip_scale)
+            self.dsBox_scale.setMinimum(0.01)
+            self.dsBox_scale.setMaximum(100)
+            self.dsBox_scale.setSingleStep(0.1)
+            self.dsBox_scale.setValue(1.0)
+            self.dsBox_scale.valueChanged.connect(self.updateRecommendation)
+            self.grid.addWidget(self.dsBox_scale, 2, 1)
+
+            #- Recommendation, updated with the scale factor
+            self.label_recommendation = QLabel()
+            self.grid.addWidget(self.label_recommendation, 3, 0, 1, -1)
+            self.updateRecommendation()
+
+            #- Show the QGroupBox
+            self.form = self.groupBox
+
+        def setWindowTexts(self):
+            """Supplies default texts or translations if available"""
+            self.text_panel    = translate("Templater", "Change the sheet format")
+            self.text_format   = translate("Templater", "New format: ")
+            self.text_anchored = translate("Templater", "Keep views at corners")
+            self.text_scale    = translate("Templater", "Scale views by: ")
+            self.tooltip_format   = translate("Templater",
+                "Selects the new sheet format of the page"
+                )
+            self.tooltip_scale    = translate("Templater",
+                "Multiplies the scale of all part views"
+                )
+            self.tooltip_anchored = translate("Templater",
+                "If checked views keep their distance to the nearest corner \n"
+                "instead of keeping their relative position"
+                )
+
+        def updateRecommendation(self, value = None):
+            """Shows the smallest sheet for the views at the scale factor"""
+            content_size = TemplaterLayout.contentSize(
+                self.boxes, self.dsBox_scale.value()
+                )
+            self.label_recommendation.setText(
+                recommendationText(content_size, self.options)
+                )
+
+        def accept(self):
+            """slot: OK pressed"""
+            Gui.Control.closeDialog()
+            changeFormat(
+                self.page,
+                self.coBox_format.currentText(),
+                self.checkBox_anchored.isChecked(),
+                self.dsBox_scale.value()
+                )
+
+        def reject(self):
+            Gui.Control.closeDialog()
+
+    ##########################################################################################################
+    # Command
+    ##########################################################################################################
+
+    class ChangeFormatCommandClass():
+        """Changes the sheet format of a page and rearranges its views"""
+
+        def GetResources(self):
+            return {
+                "Pixmap": os.path.join(
+                    icons_path, "Templater_ChangeFormat.svg"
+                    ),  # the name of a svg file available in the resources
+                "MenuText": QT_TRANSLATE_NOOP("Templater_ChangeFormat",
+                    "Change Format"
+                    ),
+                "ToolTip": QT_TRANSLATE_NOOP("Templater_ChangeFormat",
+                    "Changes the sheet format of the selected page\n"
+                    "and moves its views into the new drawing area",
+                    ),
+                }
+
+        def Activated(self):
+            page = TemplaterTemplateMultiCmd.selectedPage()
+            if not page or page.Template is None:
+                warning_text = translate("Templater",
+                    "Select a page or a view on a page first!"
+                    )
+                QMessageBox.warning(None, "", warning_text)
+                return
+            Gui.Control.showDialog(ChangeFormatTaskPanel(page))
+            # Further steps are launched from the OK option of the panel
+            return
+
+        def IsActive(self):
+            return FreeCAD.ActiveDocument is not None
+
+    Gui.addCommand("Templater_ChangeFormat", ChangeFormatCommandClass())
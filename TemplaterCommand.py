@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2025 FBXL5 available on the forum:                      *
+# *   https://forum.freecad.org/memberlist.php?mode=viewprofile&u=26761     *
+# *                                                                         *
+# *   This file is part of FreeCAD.                                         *
+# *                                                                         *
+# *   FreeCAD is free software: you can redistribute it and/or modify it    *
+# *   under the terms of the GNU Lesser General Public License as           *
+# *   published by the Free Software Foundation, either version 3.0 of the  *
+# *   License, or (at your option) any later version.                       *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful, but        *
+# *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU      *
+# *   Lesser General Public License for more details.                       *
+# *                                                                         *
+# *   You should have received a copy of the GNU Lesser General Public      *
+# *   License along with FreeCAD. If not, see                               *
+# *   <https://www.gnu.org/licenses/>.                                      *
+# *                                                                         *
+# ***************************************************************************
+"""
+Shared execution wrapper for the Templater commands.
+Everything a command creates is one undo step, recomputes and page
+updates are held back while objects are created and done once at the end.
+Interactive task panels collect their changes in a RedrawScheduler, which
+applies them the same way once the input pauses.
+
+    with commandTransaction(active_doc, "Auxiliary view", [work_page]):
+        ...create and add objects...
+
+    with commandTransaction(active_doc, "New template") as pages:
+        ...create a page and append it to pages...
+"""
+
+"""
+I have tried to follow this naming rule:
+ class names:    CamelCase
+ function names: mixedCase
+ constant names: ALL_CAPITAL + underscore
+ variable names: lower_case + underscore
+"""
+
+# imports and constants
+import contextlib
+import SvgToolkit
+from PySide import QtCore
+
+#- Pause of the input in ms before collected changes are applied
+DEBOUNCE_DELAY = 500
+
+def redrawPages(pages):
+    """Redraws each of the given pages once, if there is a Gui"""
+    if SvgToolkit.isGuiLoaded():
+        for page in pages:
+            page.requestPaint()
+
+@contextlib.contextmanager
+def commandTransaction(document, name, pages = ()):
+    """
+    Opens one undo transaction, freezes recomputes and suspends the
+    updates of the given pages. Yields the list of pages, a command can
+    append the pages it creates. On success the document is recomputed
+    once with the pages updating, the pages are redrawn once and the
+    transaction is committed. On an error, also one of the recompute,
+    the transaction is aborted. The pages and the document get their
+    previous settings back in any case.
+    """
+    given_pages = [page for page in pages if page]
+    pages = list(given_pages)
+    keep_updated = {}
+    recomputes_frozen = document.RecomputesFrozen
+    document.openTransaction(name)
+    document.RecomputesFrozen = True
+    for page in given_pages:
+        keep_updated[page.Name] = page.KeepUpdated
+        page.KeepUpdated = False
+    committed = False
+    try:
+        yield pages
+        document.RecomputesFrozen = recomputes_frozen
+        #- Pages have to update for this one recompute to show the new objects
+        for page in pages:
+            keep_updated.setdefault(page.Name, page.KeepUpdated)
+            page.KeepUpdated = True
+        document.recompute()
+        redrawPages(pages)
+        committed = True
+    finally:
+        document.RecomputesFrozen = recomputes_frozen
+        for page in pages:
+            if page.Name in keep_updated:
+                page.KeepUpdated = keep_updated[page.Name]
+        if committed:
+            document.commitTransaction()
+        else:
+            document.abortTransaction()
+
+class RedrawScheduler():
+    """
+    Collects pending property changes of a task panel and applies them in
+    one transaction, one recompute and one redraw once the input pauses
+    for DEBOUNCE_DELAY or when flush() is called, e.g. by OK.
+    An optional apply_changes callback computes further changes from
+    the panel's state right before they are applied.
+    """
+    def __init__(
+        self, document, pages, apply_changes = None, name = "Edit",
+        delay = DEBOUNCE_DELAY
+        ):
+        self.document = document
+        self.pages = pages
+        self.apply_changes = apply_changes
+        self.name = name
+        #- {(object name, property name): value}
+        self.changes = {}
+        self.pending = False
+        self.timer = QtCore.QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay)
+        self.timer.timeout.connect(self.flush)
+
+    def change(self, obj, prop, value):
+        """Collects a property change, the latest value wins"""
+        self.changes[(obj.Name, prop)] = value
+        self.schedule()
+
+    def schedule(self):
+        """Restarts the delay, pending changes wait for the input to pause"""
+        self.pending = True
+        self.timer.start()
+
+    def flush(self):
+        """Applies all pending changes now"""
+        self.timer.stop()
+        if not self.pending:
+            return
+        changes = self.changes
+        self.changes = {}
+        self.pending = False
+        with commandTransaction(self.document, self.name, self.pages):
+            for (obj_name, prop), value in changes.items():
+                obj = self.document.getObject(obj_name)
+                if obj is not None:
+                    setattr(obj, prop, value)
+            if self.apply_changes is not None:
+                self.apply_changes()
+
+    def cancel(self):
+        """Drops all pending changes"""
+        self.timer.stop()
+        self.changes = {}
+        self.pending = False
@@ -0,0 +1,404 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2025 FBXL5 available on the forum:                      *
+# *   https://forum.freecad.org/memberlist.php?mode=viewprofile&u=26761     *
+# *                                                                         *
+# *   This file is part of FreeCAD.                                         *
+# *                                                                         *
+# *   FreeCAD is free software: you can redistribute it and/or modify it    *
+# *   under the terms of the GNU Lesser General Public License as           *
+# *   published by the Free Software Foundation, either version 3.0 of the  *
+# *   License, or (at your option) any later version.                       *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful, but        *
+# *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU      *
+# *   Lesser General Public License for more details.                       *
+# *                                                                         *
+# *   You should have received a copy of the GNU Lesser General Public      *
+# *   License along with FreeCAD. If not, see                               *
+# *   <https://www.gnu.org/licenses/>.                                      *
+# *                                                                         *
+# ***************************************************************************
+"""
+Fills the editable texts of many pages at once from a CSV file or
+a spreadsheet. The first column holds page names or labels, the header
+row holds the names of the editable texts, e.g.:
+
+    Page,Title,PtNumber,Author
+    Page01,Housing,4711-01,FBXL5
+    Page02,Cover,4711-02,FBXL5
+
+Autofill takes Title, PtNumber, Material and Mass from the part shown
+in a page's main view. Masses are memoised per part and shape, so pages
+showing the same part share one computation.
+"""
+
+"""
+I have tried to follow this naming rule:
+ class names:    CamelCase
+ function names: mixedCase
+ constant names: ALL_CAPITAL + underscore
+ variable names: lower_case + underscore
+"""
+
+# imports and constants
+import csv
+import re
+import FreeCAD
+import SvgToolkit
+import TemplaterCommand
+import TemplaterPages
+import os     # built-in modules
+from PySide.QtCore import QT_TRANSLATE_NOOP
+
+translate = FreeCAD.Qt.translate
+
+icons_path = SvgToolkit.icons_path
+
+SYMBOL_TYPE = "TechDraw::DrawViewSymbol"
+PART_VIEW_TYPES = ("TechDraw::DrawProjGroup", "TechDraw::DrawViewPart")
+CELL_ADDRESS = re.compile(r"^([A-Z]+)(\d+)$")
+
+#- {(document name, object name): (shape key, density, mass)}
+mass_cache = {}
+
+def readCsv(csv_path):
+    """
+    Returns the rows of a CSV file as {page: {field: value}},
+    the delimiter is detected from the first lines
+    """
+    c = open(csv_path, "r", encoding = "utf-8-sig", newline = "")
+    sample = c.read(4096)
+    c.seek(0)
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters = ",;\t")
+    except csv.Error:
+        dialect = csv.excel
+    rows = list(csv.reader(c, dialect))
+    c.close()
+    return tableToRows(rows)
+
+def columnIndex(letters):
+    """Returns the 0-based index of a column, A -> 0, AA -> 26"""
+    index = 0
+    for letter in letters:
+        index = index * 26 + (ord(letter) - ord("A") + 1)
+    return index - 1
+
+def columnLetters(index):
+    """Returns the letters of a 0-based column index"""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+def readSpreadsheet(sheet, cell_range = None):
+    """
+    Returns the rows of a Spreadsheet::Sheet range like "A1:F40" as
+    {page: {field: value}}, without a range the used range is read
+    """
+    if cell_range is None:
+        first, last = sheet.getUsedRange()
+    else:
+        first, last = cell_range.upper().split(":")
+    first_column, first_row = CELL_ADDRESS.match(first).groups()
+    last_column, last_row = CELL_ADDRESS.match(last).groups()
+    rows = []
+    for row in range(int(first_row), int(last_row) + 1):
+        values = []
+        for column in range(columnIndex(first_column), columnIndex(last_column) + 1):
+            address = columnLetters(column) + str(row)
+            content = sheet.getContents(address)
+            if content == "":
+                values.append("")
+            else:
+                value = sheet.get(address)
+                values.append(getattr(value, "UserString", str(value)))
+        rows.append(values)
+    return tableToRows(rows)
+
+def tableToRows(table):
+    """
+    Converts a table with a header row into {page: {field: value}},
+    empty page cells are skipped
+    """
+    if not table:
+        return {}
+    header = [name.strip() for name in table[0]]
+    rows = {}
+    for values in table[1:]:
+        if not values or not values[0].strip():
+            continue
+        fields = {}
+        for name, value in zip(header[1:], values[1:]):
+            if name:
+                fields[name] = value
+        rows[values[0].strip()] = fields
+    return rows
+
+def pagesByKey(document):
+    """Returns the pages of a document by name and by label"""
+    pages = {}
+    for page in TemplaterPages.pagesOf(document):
+        pages[page.Label] = page
+    for page in TemplaterPages.pagesOf(document):
+        pages[page.Name] = page
+    return pages
+
+def pageSymbols(page):
+    """Returns the symbols on a page that have editable texts"""
+    return [
+        view for view in page.Views
+        if view.isDerivedFrom(SYMBOL_TYPE) and view.EditableTexts
+        ]
+
+def fillPage(page, fields):
+    """
+    Writes field values into the template and the symbols of a page,
+    each object gets a single assignment.
+    Returns the names of the fields that were used.
+    """
+    used = set()
+    template = page.Template
+    if template is not None:
+        texts = template.EditableTexts
+        for name in fields:
+            if name in texts:
+                texts[name] = fields[name]
+                used.add(name)
+        template.EditableTexts = texts
+    for symbol in pageSymbols(page):
+        names = SvgToolkit.editableNames(symbol.Symbol)
+        texts = list(symbol.EditableTexts)
+        if len(names) != len(texts):
+            continue
+        for name in fields:
+            if name in names:
+                texts[names.index(name)] = fields[name]
+                used.add(name)
+        symbol.EditableTexts = texts
+    return used
+
+def fillPages(document, rows):
+    """
+    Fills the pages listed in rows {page name or label: {field: value}}
+    in one transaction with one recompute.
+    Returns (filled pages, unknown pages, unknown fields).
+    """
+    pages = pagesByKey(document)
+    targets = []
+    unknown_pages = []
+    for key in rows:
+        if key in pages:
+            targets.append((pages[key], rows[key]))
+        else:
+            unknown_pages.append(key)
+    unknown_fields = set()
+    with TemplaterCommand.commandTransaction(
+        document, "Fill editable texts", [page for page, fields in targets]
+        ):
+        for page, fields in targets:
+            used = fillPage(page, fields)
+            unknown_fields.update(set(fields) - used)
+    return (len(targets), unknown_pages, sorted(unknown_fields))
+
+def mainPart(page):
+    """
+    Returns the first source object of the first part view or
+    projection group on a page, or False if there is none
+    """
+    for view in page.Views:
+        if any(view.isDerivedFrom(view_type) for view_type in PART_VIEW_TYPES):
+            sources = list(view.Source) + list(getattr(view, "XSource", []))
+            if sources:
+                return sources[0]
+    return False
+
+def partMaterial(part):
+    """
+    Returns (material name, density as Quantity) of a part,
+    from ShapeMaterial (FreeCAD 1.0 and later) or a Material map,
+    each is None if unknown
+    """
+    material = getattr(part, "ShapeMaterial", None)
+    if material is not None and material.Name:
+        density = None
+        if material.hasPhysicalProperty("Density"):
+            density = FreeCAD.Units.Quantity(
+                material.getPhysicalValue("Density")
+                )
+        return (material.Name, density)
+    material = getattr(part, "Material", None)
+    if isinstance(material, dict):
+        density = None
+        if material.get("Density"):
+            density = FreeCAD.Units.Quantity(material["Density"])
+        return (material.get("Name"), density)
+    return (None, None)
+
+def shapeKey(shape):
+    """
+    Returns a cheap key that changes when the geometry of a shape changes,
+    moving a part does not change its mass
+    """
+    #- hashCode() includes the placement, the key hashes the shape
+    #- at the origin so a moved part keeps its cached mass
+    unplaced = shape.located(FreeCAD.Placement())
+    return (unplaced.hashCode(), shape.ShapeType, len(shape.Faces))
+
+def partMass(part, density):
+    """
+    Returns the mass of a part in kg, memoised until its shape
+    or its density changes
+    """
+    shape = part.Shape
+    key = (part.Document.Name, part.Name)
+    shape_key = shapeKey(shape)
+    density_value = float(density.getValueAs("kg/mm^3"))
+    cached = mass_cache.get(key)
+    if cached and cached[0] == shape_key and cached[1] == density_value:
+        return cached[2]
+    mass = shape.Volume * density_value
+    mass_cache[key] = (shape_key, density_value, mass)
+    return mass
+
+def autofillFields(page):
+    """
+    Returns the fields {Title, PtNumber, Material, Mass} known from the
+    part shown in a page's main view, unknown fields are left out
+    """
+    part = mainPart(page)
+    if not part:
+        return {}
+    fields = {"Title": part.Label}
+    part_number = getattr(part, "Id", "")
+    if part_number:
+        fields["PtNumber"] = part_number
+    material_name, density = partMaterial(part)
+    if material_name:
+        fields["Material"] = material_name
+    if density is not None and hasattr(part, "Shape") and not part.Shape.isNull():
+        fields["Mass"] = FreeCAD.Units.Quantity(
+            partMass(part, density), FreeCAD.Units.Mass
+            ).UserString
+    return fields
+
+def autofillPages(document, pages):
+    """
+    Fills the model fields of the given pages in one transaction.
+    Returns the number of pages with a part view.
+    """
+    rows = {}
+    for page in pages:
+        fields = autofillFields(page)
+        if fields:
+            rows[page.Name] = fields
+    if rows:
+        fillPages(document, rows)
+    return len(rows)
+
+##########################################################################################################
+# Gui code
+##########################################################################################################
+
+if SvgToolkit.isGuiLoaded():
+    from FreeCAD import Gui
+    from PySide.QtGui import QMessageBox
+    from PySide.QtWidgets import QFileDialog
+
+    ##########################################################################################################
+    # Command
+    ##########################################################################################################
+
+    class FillTextsCommandClass():
+        """Fills editable texts of many pages from a CSV file or a spreadsheet"""
+
+        def GetResources(self):
+            return {
+                "Pixmap": os.path.join(
+                    icons_path, "Templater_FillTexts.svg"
+                    ),  # the name of a svg file available in the resources
+                "MenuText": QT_TRANSLATE_NOOP("Templater_FillTexts",
+                    "Fill Texts"
+                    ),
+                "ToolTip": QT_TRANSLATE_NOOP("Templater_FillTexts",
+                    "Fills the editable texts of many pages at once\n"
+                    "from the selected spreadsheet or from a CSV file.\n"
+                    "First column: page names, first row: text names",
+                    ),
+                }
+
+        def Activated(self):
+            active_doc = FreeCAD.activeDocument()
+            rows = None
+            for obj in Gui.Selection.getSelection():
+                if obj.isDerivedFrom("Spreadsheet::Sheet"):
+                    rows = readSpreadsheet(obj)
+                    break
+            if rows is None:
+                csv_path = QFileDialog.getOpenFileName(
+                    None,
+                    translate("Templater", "Select a CSV file"),
+                    "",
+                    "CSV (*.csv *.txt)"
+                    )[0]
+                if not csv_path:
+                    return
+                rows = readCsv(csv_path)
+            filled, unknown_pages, unknown_fields = fillPages(active_doc, rows)
+            message = translate("Templater", "Pages filled: ") + str(filled)
+            if unknown_pages:
+                message += ("\n" + translate("Templater", "Unknown pages: ")
+                    + ", ".join(unknown_pages))
+            if unknown_fields:
+                message += ("\n" + translate("Templater", "Unknown texts: ")
+                    + ", ".join(unknown_fields))
+            QMessageBox.information(None, "", message)
+            return
+
+        def IsActive(self):
+            return FreeCAD.ActiveDocument is not None
+
+    Gui.addCommand("Templater_FillTexts", FillTextsCommandClass())
+
+    class AutofillTextsCommandClass():
+        """Fills title block texts from the parts shown on the pages"""
+
+        def GetResources(self):
+            return {
+                "Pixmap": os.path.join(
+                    icons_path, "Templater_AutofillTexts.svg"
+                    ),  # the name of a svg file available in the resources
+                "MenuText": QT_TRANSLATE_NOOP("Templater_AutofillTexts",
+                    "Autofill Texts"
+                    ),
+                "ToolTip": QT_TRANSLATE_NOOP("Templater_AutofillTexts",
+                    "Fills title, part number, material and mass\n"
+                    "from the part shown in the main view.\n"
+                    "Works on the selected pages or on all pages",
+                    ),
+                }
+
+        def Activated(self):
+            active_doc = FreeCAD.activeDocument()
+            pages = [
+                obj for obj in Gui.Selection.getSelection()
+                if obj.isDerivedFrom(TemplaterPages.PAGE_TYPE)
+                ]
+            if not pages:
+                pages = TemplaterPages.pagesOf(active_doc)
+            filled = autofillPages(active_doc, pages)
+            FreeCAD.Console.PrintMessage(
+                translate("Templater", "Pages filled: ") + str(filled) + "\n"
+                )
+            return
+
+        def IsActive(self):
+            return FreeCAD.ActiveDocument is not None
+
+    Gui.addCommand("Templater_AutofillTexts", AutofillTextsCommandClass())
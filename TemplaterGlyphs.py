@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2025 FBXL5 available on the forum:                      *
+# *   https://forum.freecad.org/memberlist.php?mode=viewprofile&u=26761     *
+# *                                                                         *
+# *   This file is part of FreeCAD.                                         *
+# *                                                                         *
+# *   FreeCAD is free software: you can redistribute it and/or modify it    *
+# *   under the terms of the GNU Lesser General Public License as           *
+# *   published by the Free Software Foundation, either version 3.0 of the  *
+# *   License, or (at your option) any later version.                       *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful, but        *
+# *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU      *
+# *   Lesser General Public License for more details.                       *
+# *                                                                         *
+# *   You should have received a copy of the GNU Lesser General Public      *
+# *   License along with FreeCAD. If not, see                               *
+# *   <https://www.gnu.org/licenses/>.                                      *
+# *                                                                         *
+# ***************************************************************************
+"""
+Converts non-editable texts of a template into paths, so the result
+no longer depends on the fonts installed on the viewing machine.
+Glyph outlines are taken from the osifont TechDraw ships with FreeCAD,
+or a font set in the preferences, and cached per (font, glyph), the
+conversion cost is paid once per glyph.
+"""
+
+"""
+I have tried to follow this naming rule:
+ class names:    CamelCase
+ function names: mixedCase
+ constant names: ALL_CAPITAL + underscore
+ variable names: lower_case + underscore
+"""
+
+# imports and constants
+import os
+import threading
+import xml.etree.ElementTree as ET
+import FreeCAD
+
+SVG_NS = "http://www.w3.org/2000/svg"
+FREECAD_NS = "https://wiki.freecad.org/Svg_Namespace"
+FONT_NAME = "osifont-lgpl3fe.ttf"
+#- Glyphs are read at this size and scaled down to 1 (em units)
+REFERENCE_SIZE = 100.0
+#- Maximum deviation of the discretised outlines in reference units
+DEFLECTION = 0.5
+
+#- {(font path, character): (path data, advance)}, both in em units
+glyph_cache = {}
+glyph_lock = threading.Lock()
+
+def fontPath():
+    """
+    Returns the font used for text conversion: a font set with the
+    string parameter PathFont in the preferences, or the osifont
+    TechDraw ships with FreeCAD
+    """
+    parameter_path = FreeCAD.ParamGet(
+        "User parameter:BaseApp/Preferences/Mod/Templater"
+        )
+    font_path = parameter_path.GetString("PathFont")
+    if font_path and os.path.exists(font_path):
+        return font_path
+    return os.path.join(
+        FreeCAD.getResourceDir(), "Mod", "TechDraw", "Resources", "fonts",
+        FONT_NAME
+        )
+
+def wiresXMin(wires):
+    """Returns the smallest x value of a list of wires or None"""
+    x_min = None
+    for wire in wires:
+        if x_min is None or wire.BoundBox.XMin < x_min:
+            x_min = wire.BoundBox.XMin
+    return x_min
+
+def wiresToPathData(wires):
+    """
+    Converts wires at reference size into svg path data in em units,
+    y is flipped since svg y points down
+    """
+    path_data = []
+    for wire in wires:
+        points = wire.discretize(Deflection = DEFLECTION)
+        if len(points) < 2:
+            continue
+        segments = []
+        for point in points:
+            segments.append("{:.4f},{:.4f}".format(
+                point.x / REFERENCE_SIZE, -point.y / REFERENCE_SIZE
+                ))
+        path_data.append("M " + " L ".join(segments) + " Z")
+    return " ".join(path_data)
+
+def readGlyph(font_path, character):
+    """
+    Reads the outline and the advance of one glyph from the font.
+    The advance is measured by the shift of a following reference glyph.
+    """
+    import Part
+    glyphs = Part.makeWireString(character + "H", font_path, REFERENCE_SIZE, 0)
+    reference = Part.makeWireString("H", font_path, REFERENCE_SIZE, 0)
+    path_data = ""
+    if glyphs:
+        path_data = wiresToPathData(glyphs[0])
+    if len(glyphs) > 1 and glyphs[1] and reference and reference[0]:
+        advance = (wiresXMin(glyphs[1]) - wiresXMin(reference[0]))
+    elif glyphs and glyphs[0]:
+        advance = max(wire.BoundBox.XMax for wire in glyphs[0])
+    else:
+        advance = REFERENCE_SIZE / 3
+    return (path_data, advance / REFERENCE_SIZE)
+
+def glyphOutline(font_path, character):
+    """
+    Returns the cached (path data, advance) of a glyph in em units
+    """
+    key = (font_path, character)
+    glyph = glyph_cache.get(key)
+    if glyph is None:
+        with glyph_lock:
+            glyph = glyph_cache.get(key)
+            if glyph is None:
+                glyph = readGlyph(font_path, character)
+                glyph_cache[key] = glyph
+    return glyph
+
+def textWidth(text, font_path, font_size):
+    """Returns the advance width of a text in mm"""
+    width = 0.0
+    for character in text:
+        width += glyphOutline(font_path, character)[1]
+    return width * font_size
+
+def parseStyle(style_string):
+    """Returns the declarations of a style attribute as a dictionary"""
+    style = {}
+    for declaration in style_string.split(";"):
+        if ":" in declaration:
+            name, value = declaration.split(":", 1)
+            style[name.strip()] = value.strip()
+    return style
+
+def styleOf(element, inherited):
+    """Adds the element's own style and attributes to the inherited style"""
+    style = dict(inherited)
+    for name in ("font-size", "text-anchor", "fill", "font-family"):
+        if element.get(name) is not None:
+            style[name] = element.get(name)
+    style.update(parseStyle(element.get("style", "")))
+    return style
+
+def fontSize(style):
+    """Returns the font size of a style in svg units"""
+    value = style.get("font-size", "3.5").strip()
+    for unit in ("px", "mm"):
+        if value.endswith(unit):
+            value = value[:-len(unit)]
+    return float(value)
+
+def textToPath(element, style, font_path):
+    """
+    Returns a group of glyph paths replacing a non-editable text element
+    """
+    text = "".join(element.itertext()).strip()
+    size = fontSize(style)
+    x = float(element.get("x", "0"))
+    y = float(element.get("y", "0"))
+    anchor = style.get("text-anchor", "start")
+    if anchor in ("middle", "end"):
+        width = textWidth(text, font_path, size)
+        if anchor == "middle":
+            x -= width / 2
+        else:
+            x -= width
+    group = ET.Element("{" + SVG_NS + "}g")
+    group.set("style", "fill:" + style.get("fill", "#000") +
+        ";fill-rule:evenodd;stroke:none"
+        )
+    if element.get("transform"):
+        group.set("transform", element.get("transform"))
+    group.text = element.text if not text else None
+    group.tail = element.tail
+    pen_x = x
+    for character in text:
+        path_data, advance = glyphOutline(font_path, character)
+        if path_data:
+            glyph = ET.SubElement(group, "{" + SVG_NS + "}path")
+            glyph.set("transform", "translate({:.3f},{:.3f}) scale({})".format(
+                pen_x, y, size
+                ))
+            glyph.set("d", path_data)
+        pen_x += advance * size
+    return group
+
+def replaceTexts(parent, inherited, font_path):
+    """
+    Walks the tree and replaces texts without a freecad:editable
+    attribute by glyph paths
+    """
+    for index, child in enumerate(list(parent)):
+        if not isinstance(child.tag, str):
+            continue  # comments
+        style = styleOf(child, inherited)
+        if child.tag == "{" + SVG_NS + "}text":
+            if child.get("{" + FREECAD_NS + "}editable") is None:
+                parent[index] = textToPath(child, style, font_path)
+        else:
+            replaceTexts(child, style, font_path)
+
+def convertTextsToPaths(svg_path, font_path = None):
+    """
+    Rewrites an svg file, every non-editable text becomes a group of
+    glyph paths. Editable texts stay texts to be filled in TechDraw.
+    """
+    if font_path is None:
+        font_path = fontPath()
+    ET.register_namespace("", SVG_NS)
+    ET.register_namespace("freecad", FREECAD_NS)
+    parser = ET.XMLParser(target = ET.TreeBuilder(insert_comments = True))
+    tree = ET.parse(svg_path, parser)
+    root = tree.getroot()
+    replaceTexts(root, styleOf(root, {}), font_path)
+    tree.write(svg_path, encoding = "UTF-8", xml_declaration = True)
+    return svg_path
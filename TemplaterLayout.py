@@ -0,0 +1,705 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2025 FBXL5 available on the forum:                      *
+# *   https://forum.freecad.org/memberlist.php?mode=viewprofile&u=26761     *
+# *                                                                         *
+# *   This file is part of FreeCAD.                                         *
+# *                                                                         *
+# *   FreeCAD is free software: you can redistribute it and/or modify it    *
+# *   under the terms of the GNU Lesser General Public License as           *
+# *   published by the Free Software Foundation, either version 3.0 of the  *
+# *   License, or (at your option) any later version.                       *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful, but        *
+# *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU      *
+# *   Lesser General Public License for more details.                       *
+# *                                                                         *
+# *   You should have received a copy of the GNU Lesser General Public      *
+# *   License along with FreeCAD. If not, see                               *
+# *   <https://www.gnu.org/licenses/>.                                      *
+# *                                                                         *
+# ***************************************************************************
+"""
+Geometry of the drawing area and positions of views on a page.
+Positions are page coordinates as TechDraw uses them: mm, origin at the
+lower left corner of the sheet, y pointing up.
+"""
+
+"""
+I have tried to follow this naming rule:
+ class names:    CamelCase
+ function names: mixedCase
+ constant names: ALL_CAPITAL + underscore
+ variable names: lower_case + underscore
+"""
+
+# imports and constants
+import heapq
+import math
+import re
+import SvgToolkit
+import TemplaterPages
+
+#- Drawing area offsets according to ISO 7200 (top, bottom, left, right)
+DRAWING_AREA_OFFSETS = (10, 10, 20, 10)
+#- Views positioned relative to another view, they move with it
+RELATIVE_TYPES = (
+    "TechDraw::DrawViewDimension",
+    "TechDraw::DrawViewDimExtent",
+    "TechDraw::DrawViewBalloon",
+    "TechDraw::DrawLeaderLine",
+    "TechDraw::DrawWeldSymbol"
+    )
+SYMBOL_TYPE = "TechDraw::DrawViewSymbol"
+#- Width and height of a zone in mm, see SvgToolkit.createDecorations
+ZONE_SIZE = 50
+#- {(sheet width, sheet height): ZoneGrid}
+zone_grids = {}
+#- Title block and BOM sizes of TitleBlock_KG
+TITLE_BLOCK_SIZE = (180, 35)
+BOM_HEADER_HEIGHT = 8
+BOM_ROW_HEIGHT = 6
+#- {(shape keys, direction, x direction): (width, height)} at scale 1
+projection_cache = {}
+#- Cell size in mm of the occupancy grids, about a feature frame's height
+OCCUPANCY_CELL = 10.0
+#- Gap in mm kept between a placed symbol and anything else
+PLACEMENT_MARGIN = 2.0
+#- {(document name, page name): (view states, sheet, OccupancyGrid)}
+occupancy_grids = {}
+#- Gap in mm between an auxiliary view and its base view
+AUX_VIEW_CLEARANCE = 15.0
+#- Name of the title block symbols inserted by Templater
+TITLE_BLOCK_NAME = "TitleBlock"
+#- Base type of everything placed on a page
+VIEW_TYPE = "TechDraw::DrawView"
+VIEW_BOX = re.compile(
+    r"viewBox\s*=\s*\"\s*([-\d.]+)[\s,]+([-\d.]+)[\s,]+([\d.]+)[\s,]+([\d.]+)"
+    )
+
+def drawingAreaOfSize(sheet_x, sheet_y):
+    """Returns (x_min, y_min, x_max, y_max) of the drawing area of a sheet"""
+    top, bottom, left, right = DRAWING_AREA_OFFSETS
+    return (left, bottom, float(sheet_x) - right, float(sheet_y) - top)
+
+def drawingArea(format):
+    """Returns (x_min, y_min, x_max, y_max) of the drawing area of a format"""
+    sheet_x, sheet_y = SvgToolkit.sheetDimensions(format)
+    return drawingAreaOfSize(sheet_x, sheet_y)
+
+def mapPosition(x, y, old_area, new_area, anchored = False):
+    """
+    Maps a position from one drawing area into another.
+    Proportional keeps the relative position, anchored keeps the
+    distances to the nearest corner of the drawing area.
+    """
+    old_x_min, old_y_min, old_x_max, old_y_max = old_area
+    new_x_min, new_y_min, new_x_max, new_y_max = new_area
+    if anchored:
+        if x - old_x_min <= old_x_max - x:
+            new_x = new_x_min + (x - old_x_min)
+        else:
+            new_x = new_x_max - (old_x_max - x)
+        if y - old_y_min <= old_y_max - y:
+            new_y = new_y_min + (y - old_y_min)
+        else:
+            new_y = new_y_max - (old_y_max - y)
+        return (new_x, new_y)
+    new_x = new_x_min + (x - old_x_min) / (old_x_max - old_x_min) * (
+        new_x_max - new_x_min
+        )
+    new_y = new_y_min + (y - old_y_min) / (old_y_max - old_y_min) * (
+        new_y_max - new_y_min
+        )
+    return (new_x, new_y)
+
+def symbolSize(svg):
+    """Returns (width, height) of a symbol's viewBox or False"""
+    match = VIEW_BOX.search(svg)
+    if match is None:
+        return False
+    return (float(match.group(3)), float(match.group(4)))
+
+def titleBlockPosition(area, symbol_size):
+    """
+    Returns the X/Y of a title block symbol placed into the lower right
+    corner of a drawing area, X/Y is the center of the symbol
+    """
+    x_min, y_min, x_max, y_max = area
+    return (x_max - symbol_size[0] / 2, y_min + symbol_size[1] / 2)
+
+def isTitleBlock(view):
+    """Returns True for title block symbols inserted by Templater"""
+    return (view.isDerivedFrom(SYMBOL_TYPE)
+        and view.Name.startswith(TITLE_BLOCK_NAME)
+        )
+
+def isPlaceable(view):
+    """
+    Returns True for views positioned on the page itself, not relative
+    to another view, an owner view or inside a projection group or clip
+    """
+    if view.TypeId in RELATIVE_TYPES:
+        return False
+    if getattr(view, "AnnoParent", None) is not None:
+        return False
+    if ownerView(view) is not None:
+        return False
+    for parent in view.InList:
+        if parent.TypeId in TemplaterPages.CONTAINER_TYPES:
+            return False
+    return True
+
+def placeableViews(page):
+    """Returns the views of a page that have their own position"""
+    return [view for view in page.Views if isPlaceable(view)]
+
+def ownerView(view):
+    """
+    Returns the view a symbol is positioned relative to or None,
+    an owner that is no view, e.g. the page of a title block, is not one
+    """
+    owner = getattr(view, "Owner", None)
+    if owner is None or not owner.isDerivedFrom(VIEW_TYPE):
+        return None
+    return owner
+
+def pagePosition(view):
+    """
+    Returns the X/Y of a view on the page, views inside a projection
+    group or a clip and symbols with an owner view are positioned
+    relative to it
+    """
+    x = float(view.X)
+    y = float(view.Y)
+    owner = ownerView(view)
+    if owner is not None:
+        owner_x, owner_y = pagePosition(owner)
+        return (owner_x + x, owner_y + y)
+    for parent in view.InList:
+        if parent.TypeId in TemplaterPages.CONTAINER_TYPES:
+            parent_x, parent_y = pagePosition(parent)
+            return (parent_x + x, parent_y + y)
+    return (x, y)
+
+class ZoneGrid():
+    """
+    Zone indices of a sheet as drawn by SvgToolkit.createDecorations:
+    numbered columns from the left, lettered rows from the top, each
+    50 mm and centered on the drawing area. zoneAt() is a direct lookup.
+    """
+    def __init__(self, sheet_x, sheet_y):
+        self.sheet_y = float(sheet_y)
+        self.count_x, self.count_y = SvgToolkit.indexCounts(
+            str(int(round(float(sheet_x))))
+            )
+        top, bottom, left, right = DRAWING_AREA_OFFSETS
+        #- Svg coordinates, y points down like the indices are drawn
+        self.x_min = left
+        self.x_max = float(sheet_x) - right
+        self.y_min = top
+        self.y_max = self.sheet_y - bottom
+        self.center = (self.x_min + self.x_max) / 2
+        self.middle = (self.y_min + self.y_max) / 2
+        self.columns = [str(number) for number in range(1, self.count_x + 1)]
+        self.rows = [
+            SvgToolkit.indexLetter(number)
+            for number in range(1, self.count_y + 1)
+            ]
+
+    def zoneAt(self, x, y):
+        """
+        Returns the zone reference like "C4" of a point in page
+        coordinates or False if the sheet has no zones or the point is
+        outside the drawing area
+        """
+        if not self.count_x:
+            return False
+        svg_y = self.sheet_y - y
+        if not (self.x_min <= x <= self.x_max and self.y_min <= svg_y <= self.y_max):
+            return False
+        #- Outer zones reach the frame, even if narrower than 50 mm
+        column = int(math.floor((x - self.center) / ZONE_SIZE)) + self.count_x // 2
+        row = int(math.floor((svg_y - self.middle) / ZONE_SIZE)) + self.count_y // 2
+        column = min(max(column, 0), self.count_x - 1)
+        row = min(max(row, 0), self.count_y - 1)
+        return self.rows[row] + self.columns[column]
+
+def zoneGrid(page):
+    """Returns the zone grid of a page's template, shared by equal sizes"""
+    template = page.Template
+    size = (
+        float(getattr(template.Width, "Value", template.Width)),
+        float(getattr(template.Height, "Value", template.Height))
+        )
+    if size not in zone_grids:
+        zone_grids[size] = ZoneGrid(*size)
+    return zone_grids[size]
+
+def hasZones(page):
+    """
+    Returns True if the page's template was generated by Templater with
+    zone indices, foreign templates may have other frames or none
+    """
+    import TemplaterTemplateMultiCmd
+    options = TemplaterTemplateMultiCmd.storedOptions(page.Template)
+    return bool(options and options["frame"] and options["indices"])
+
+def zoneReport(page):
+    """
+    Returns [(view, zone)] for the views and symbols of a page,
+    zone is False outside the zones. Pages without zone indices
+    return an empty list.
+    """
+    if not hasZones(page):
+        return []
+    grid = zoneGrid(page)
+    report = []
+    for view in page.Views:
+        if view.TypeId in RELATIVE_TYPES:
+            continue
+        if getattr(view, "AnnoParent", None) is not None:
+            continue
+        report.append((view, grid.zoneAt(*pagePosition(view))))
+    return report
+
+def sheetCandidates():
+    """
+    Returns the sheets the template tools can create as
+    (width, height, format), smallest area first
+    """
+    candidates = []
+    for format in SvgToolkit.SHEET_FORMATS:
+        width, height = SvgToolkit.SHEET_SIZES[format]
+        candidates.append((width, height, format))
+    candidates.sort(key = lambda candidate: candidate[0] * candidate[1])
+    return candidates
+
+SHEET_CANDIDATES = sheetCandidates()
+
+def titleBlockClearance(title_block = True, bom_rows = 0):
+    """Returns (width, height) reserved in the lower right corner"""
+    if not title_block:
+        return (0, 0)
+    height = TITLE_BLOCK_SIZE[1]
+    if bom_rows:
+        height += BOM_HEADER_HEIGHT + BOM_ROW_HEIGHT * int(bom_rows)
+    return (TITLE_BLOCK_SIZE[0], height)
+
+def recommendFormat(
+    content_size, title_block = True, bom_rows = 0, families = None
+    ):
+    """
+    Returns the format of the smallest sheet of SvgToolkit.SHEET_FORMATS
+    whose drawing area holds content of the given (width, height) in mm
+    beside or above the title block. All of ISO, ANSI and Arch are
+    searched unless families limits the search, e.g. ("ISO",).
+    Returns False if even the largest sheet is too small.
+    """
+    content_x, content_y = content_size
+    clearance_x, clearance_y = titleBlockClearance(title_block, bom_rows)
+    top, bottom, left, right = DRAWING_AREA_OFFSETS
+    for width, height, format in SHEET_CANDIDATES:
+        if families and format.split()[0] not in families:
+            continue
+        area_x = width - left - right
+        area_y = height - top - bottom
+        if content_x > area_x or content_y > area_y:
+            continue
+        #- Above the title block, or beside it
+        if (content_y + clearance_y <= area_y
+            or content_x + clearance_x <= area_x
+            ):
+            return format
+    return False
+
+def projectedSize(view):
+    """
+    Returns (width, height) of a part view's source at scale 1,
+    the bounding box corners are projected onto the view plane
+    """
+    import FreeCAD
+    shapes = [
+        source.Shape for source in view.Source
+        if hasattr(source, "Shape") and not source.Shape.isNull()
+        ]
+    if not shapes:
+        return (0.0, 0.0)
+    direction = FreeCAD.Vector(view.Direction)
+    x_direction = FreeCAD.Vector(view.XDirection)
+    key = (
+        tuple(shape.hashCode() for shape in shapes),
+        tuple(direction), tuple(x_direction)
+        )
+    if key not in projection_cache:
+        bound_box = shapes[0].BoundBox
+        for shape in shapes[1:]:
+            bound_box.add(shape.BoundBox)
+        direction.normalize()
+        if x_direction.Length < 1e-9:
+            x_direction = FreeCAD.Vector(1, 0, 0)
+        x_direction.normalize()
+        y_direction = direction.cross(x_direction)
+        xs = []
+        ys = []
+        for index in range(8):
+            point = bound_box.getPoint(index)
+            xs.append(point.dot(x_direction))
+            ys.append(point.dot(y_direction))
+        projection_cache[key] = (max(xs) - min(xs), max(ys) - min(ys))
+    return projection_cache[key]
+
+def viewSize(view):
+    """
+    Returns (width, height) of a view on the page in mm or False if
+    it has no size of its own
+    """
+    if view.isDerivedFrom("TechDraw::DrawViewPart"):
+        width, height = projectedSize(view)
+        scale = float(view.Scale)
+        width *= scale
+        height *= scale
+    elif view.isDerivedFrom(SYMBOL_TYPE):
+        size = symbolSize(view.Symbol)
+        if not size:
+            return False
+        width = size[0] * float(view.Scale)
+        height = size[1] * float(view.Scale)
+    elif hasattr(view, "Width") and hasattr(view, "Height"):
+        width = float(getattr(view.Width, "Value", view.Width))
+        height = float(getattr(view.Height, "Value", view.Height))
+    else:
+        return False
+    angle = math.radians(float(getattr(view, "Rotation", 0)))
+    if angle:
+        width, height = (
+            abs(width * math.cos(angle)) + abs(height * math.sin(angle)),
+            abs(width * math.sin(angle)) + abs(height * math.cos(angle))
+            )
+    return (width, height)
+
+def boxAround(x, y, size):
+    """Returns (x_min, y_min, x_max, y_max) of a size centered at x, y"""
+    return (x - size[0] / 2, y - size[1] / 2, x + size[0] / 2, y + size[1] / 2)
+
+def viewBox(view):
+    """Returns the box of a view in page coordinates or False"""
+    size = viewSize(view)
+    if not size:
+        return False
+    x, y = pagePosition(view)
+    return boxAround(x, y, size)
+
+def viewBoxes(page):
+    """
+    Returns (x_min, y_min, x_max, y_max) of the views on a page in page
+    coordinates, title block symbols are left out
+    """
+    boxes = []
+    for view in page.Views:
+        if view.TypeId in RELATIVE_TYPES or isTitleBlock(view):
+            continue
+        if view.isDerivedFrom(TemplaterPages.CONTAINER_TYPES[0]):
+            continue  # its items are listed on their own
+        box = viewBox(view)
+        if box:
+            boxes.append(box)
+    return boxes
+
+def contentSize(boxes, factor = 1.0):
+    """
+    Returns (width, height) of the union of boxes, scaled by factor
+    as if all views were scaled together
+    """
+    if not boxes:
+        return (0.0, 0.0)
+    width = max(box[2] for box in boxes) - min(box[0] for box in boxes)
+    height = max(box[3] for box in boxes) - min(box[1] for box in boxes)
+    return (width * factor, height * factor)
+
+def boxesOverlap(box1, box2):
+    """Returns True if two boxes overlap"""
+    return (box1[0] < box2[2] and box2[0] < box1[2]
+        and box1[1] < box2[3] and box2[1] < box1[3]
+        )
+
+def boxGap(box1, box2):
+    """Returns the distance between two boxes, 0 if they overlap"""
+    gap_x = max(box2[0] - box1[2], box1[0] - box2[2], 0)
+    gap_y = max(box2[1] - box1[3], box1[1] - box2[3], 0)
+    return math.hypot(gap_x, gap_y)
+
+class OccupancyGrid():
+    """
+    Uniform grid of the boxes occupied on a page. Each box is listed in
+    the cells it touches, so a test only looks at the boxes nearby.
+    Boxes can be added one by one while symbols are placed.
+    """
+    def __init__(self, area, cell = OCCUPANCY_CELL):
+        self.area = area
+        self.cell = cell
+        #- {(column, row): [box index]}
+        self.cells = {}
+        self.boxes = []
+
+    def cellRange(self, box):
+        """Returns the keys of the cells a box touches"""
+        cell = self.cell
+        for column in range(int(math.floor(box[0] / cell)),
+            int(math.floor(box[2] / cell)) + 1
+            ):
+            for row in range(int(math.floor(box[1] / cell)),
+                int(math.floor(box[3] / cell)) + 1
+                ):
+                yield (column, row)
+
+    def add(self, box):
+        """Marks a box as occupied"""
+        index = len(self.boxes)
+        self.boxes.append(box)
+        for key in self.cellRange(box):
+            self.cells.setdefault(key, []).append(index)
+
+    def isFree(self, box):
+        """Returns True if a box is inside the area and overlaps nothing"""
+        x_min, y_min, x_max, y_max = self.area
+        if box[0] < x_min or box[1] < y_min or box[2] > x_max or box[3] > y_max:
+            return False
+        for key in self.cellRange(box):
+            for index in self.cells.get(key, ()):
+                if boxesOverlap(self.boxes[index], box):
+                    return False
+        return True
+
+    def nearestFree(self, size, anchor_box, margin = PLACEMENT_MARGIN):
+        """
+        Returns the center of the free spot for a box of size that is
+        nearest to anchor_box, or False if the area is full.
+        Candidates on a half cell lattice are visited by their gap to the
+        anchor, the first free one is the nearest.
+        """
+        step = self.cell / 2
+        start_x = (anchor_box[0] + anchor_box[2]) / 2
+        start_y = (anchor_box[1] + anchor_box[3]) / 2
+        padded = (size[0] + 2 * margin, size[1] + 2 * margin)
+        x_min, y_min, x_max, y_max = self.area
+        heap = [(0.0, 0, 0)]
+        visited = {(0, 0)}
+        while heap:
+            gap, column, row = heapq.heappop(heap)
+            x = start_x + column * step
+            y = start_y + row * step
+            if self.isFree(boxAround(x, y, padded)):
+                return (x, y)
+            for next_column, next_row in (
+                (column + 1, row), (column - 1, row),
+                (column, row + 1), (column, row - 1)
+                ):
+                if (next_column, next_row) in visited:
+                    continue
+                visited.add((next_column, next_row))
+                next_x = start_x + next_column * step
+                next_y = start_y + next_row * step
+                if not (x_min <= next_x <= x_max and y_min <= next_y <= y_max):
+                    continue
+                heapq.heappush(heap, (
+                    boxGap(boxAround(next_x, next_y, size), anchor_box),
+                    next_column, next_row
+                    ))
+        return False
+
+def viewState(view):
+    """Returns the properties that decide where a view is and how big"""
+    return (
+        float(view.X), float(view.Y), float(getattr(view, "Scale", 1)),
+        float(getattr(view, "Rotation", 0))
+        )
+
+def titleBlockBox(page):
+    """Returns the box of the template's title block or False"""
+    import TemplaterTemplateMultiCmd
+    import TemplaterSymbolLibrary
+    options = TemplaterTemplateMultiCmd.pageOptions(page)
+    if not options["frame"]:
+        return False
+    if options["title_block"]:
+        size = titleBlockClearance(True, options["bom_rows"])
+    elif options["merged_symbol"]:
+        size = TemplaterSymbolLibrary.symbolSize(
+            TemplaterTemplateMultiCmd.TITLE_BLOCKS[options["merged_symbol"]]
+            )
+        if not size:
+            size = (180, TemplaterTemplateMultiCmd.SYMBOL_HEIGHTS[
+                options["merged_symbol"]
+                ])
+    else:
+        return False
+    area = pageArea(page)
+    return (area[2] - size[0], area[1], area[2], area[1] + size[1])
+
+def pageArea(page):
+    """Returns the drawing area of a page's template"""
+    template = page.Template
+    return drawingAreaOfSize(
+        getattr(template.Width, "Value", template.Width),
+        getattr(template.Height, "Value", template.Height)
+        )
+
+def occupancyGrid(page, ignore = ()):
+    """
+    Returns the occupancy grid of a page, rebuilt only if a view was
+    added, removed, moved, scaled or turned since it was built, or if
+    the sheet size or the title block changed, e.g. by Change Format.
+    Views in ignore, e.g. a symbol about to be placed, are left out.
+    """
+    key = (page.Document.Name, page.Name)
+    ignored = set(view.Name for view in ignore)
+    views = [
+        view for view in page.Views
+        if view.TypeId not in RELATIVE_TYPES and view.Name not in ignored
+        ]
+    states = {}
+    for view in views:
+        states[view.Name] = viewState(view)
+    #- The drawing area and the title block box follow the template
+    area = pageArea(page)
+    title_block_box = titleBlockBox(page)
+    sheet = (area, title_block_box)
+    cached = occupancy_grids.get(key)
+    if cached is not None and cached[0] == states and cached[1] == sheet:
+        return cached[2]
+    grid = OccupancyGrid(area)
+    if title_block_box:
+        grid.add(title_block_box)
+    for view in views:
+        if view.isDerivedFrom(TemplaterPages.CONTAINER_TYPES[0]):
+            continue  # its items are added on their own
+        box = viewBox(view)
+        if box:
+            grid.add(box)
+    occupancy_grids[key] = (states, sheet, grid)
+    return grid
+
+def placeNear(page, symbol, owner):
+    """
+    Moves a symbol to the nearest free spot next to its owner view and
+    adds it to the page's occupancy grid. The symbol has to be on the
+    page already. Returns True if a free spot was found.
+    """
+    grid = occupancyGrid(page, [symbol])
+    size = viewSize(symbol)
+    owner_box = viewBox(owner)
+    if not size:
+        return False
+    if not owner_box:
+        owner_x, owner_y = pagePosition(owner)
+        owner_box = (owner_x, owner_y, owner_x, owner_y)
+    spot = grid.nearestFree(size, owner_box)
+    if not spot:
+        return False
+    #- X/Y of a symbol with an owner are relative to the owner
+    base_x, base_y = (0.0, 0.0)
+    if ownerView(symbol) is not None:
+        base_x, base_y = pagePosition(ownerView(symbol))
+    symbol.X = spot[0] - base_x
+    symbol.Y = spot[1] - base_y
+    grid.add(boxAround(spot[0], spot[1], size))
+    #- The grid stays valid, it already knows the new position
+    occupancy_grids[(page.Document.Name, page.Name)][0][symbol.Name] = (
+        viewState(symbol)
+        )
+    return True
+
+def pageDirection(view, base_view):
+    """
+    Returns the unit vector (x, y) on the page of a view's Direction as
+    seen in its base view, or False if it points out of the page
+    """
+    import FreeCAD
+    x_base = FreeCAD.Vector(base_view.XDirection)
+    z_base = FreeCAD.Vector(base_view.Direction)
+    x_base.normalize()
+    z_base.normalize()
+    y_base = z_base.cross(x_base)
+    direction = FreeCAD.Vector(view.Direction)
+    x = direction.dot(x_base)
+    y = direction.dot(y_base)
+    length = math.hypot(x, y)
+    if length < 1e-6:
+        return False
+    angle = math.radians(float(base_view.Rotation))
+    return (
+        (x * math.cos(angle) - y * math.sin(angle)) / length,
+        (x * math.sin(angle) + y * math.cos(angle)) / length
+        )
+
+def auxViewDirection(view, base_view):
+    """
+    Returns the unit vector on the page from the base view towards the
+    place of an auxiliary view: the side of the viewer for third angle
+    projection, the far side for first angle projection
+    """
+    direction = pageDirection(view, base_view)
+    if not direction:
+        return False
+    if SvgToolkit.projectionGroupAngle() == 1:
+        return direction
+    return (-direction[0], -direction[1])
+
+def clearanceDistance(base_size, size, direction, clearance):
+    """
+    Returns the distance between the centers of two boxes along a unit
+    direction at which they are clearance apart
+    """
+    distances = []
+    if abs(direction[0]) > 1e-9:
+        distances.append(
+            ((base_size[0] + size[0]) / 2 + clearance) / abs(direction[0])
+            )
+    if abs(direction[1]) > 1e-9:
+        distances.append(
+            ((base_size[1] + size[1]) / 2 + clearance) / abs(direction[1])
+            )
+    return min(distances)
+
+def placeAlong(
+    page, view, base_view, direction, clearance = AUX_VIEW_CLEARANCE
+    ):
+    """
+    Moves a view next to its base view along a page direction, clearance
+    apart, and further out along that line if the spot is taken.
+    If the line leaves the drawing area the nearest free spot is used.
+    Returns True if the view was placed.
+    """
+    #- Symbols owned by the view, e.g. its label, move along with it
+    owned = [item for item in page.Views if ownerView(item) == view]
+    grid = occupancyGrid(page, [view] + owned)
+    size = viewSize(view)
+    base_box = viewBox(base_view)
+    if not direction or not size or not base_box:
+        return False
+    base_size = (base_box[2] - base_box[0], base_box[3] - base_box[1])
+    base_x = (base_box[0] + base_box[2]) / 2
+    base_y = (base_box[1] + base_box[3]) / 2
+    distance = clearanceDistance(base_size, size, direction, clearance)
+    padded = (size[0] + 2 * PLACEMENT_MARGIN, size[1] + 2 * PLACEMENT_MARGIN)
+    ideal = (base_x + distance * direction[0], base_y + distance * direction[1])
+    spot = False
+    x_min, y_min, x_max, y_max = grid.area
+    x, y = ideal
+    while x_min <= x <= x_max and y_min <= y <= y_max:
+        if grid.isFree(boxAround(x, y, padded)):
+            spot = (x, y)
+            break
+        distance += grid.cell / 2
+        x = base_x + distance * direction[0]
+        y = base_y + distance * direction[1]
+    if not spot:
+        spot = grid.nearestFree(size, boxAround(ideal[0], ideal[1], size))
+    if not spot:
+        return False
+    view.X, view.Y = spot
+    return True
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2025 FBXL5 available on the forum:                      *
+# *   https://forum.freecad.org/memberlist.php?mode=viewprofile&u=26761     *
+# *                                                                         *
+# *   This file is part of FreeCAD.                                         *
+# *                                                                         *
+# *   FreeCAD is free software: you can redistribute it and/or modify it    *
+# *   under the terms of the GNU Lesser General Public License as           *
+# *   published by the Free Software Foundation, either version 3.0 of the  *
+# *   License, or (at your option) any later version.                       *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful, but        *
+# *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU      *
+# *   Lesser General Public License for more details.                       *
+# *                                                                         *
+# *   You should have received a copy of the GNU Lesser General Public      *
+# *   License along with FreeCAD. If not, see                               *
+# *   <https://www.gnu.org/licenses/>.                                      *
+# *                                                                         *
+# ***************************************************************************
+"""
+Advance widths of the proportional fonts used by templates and feature
+frames, estimated per character class in em. A text width is a sum of
+dictionary lookups and needs neither Qt nor a GUI, so cells are sized
+the same with or without a GUI. The advances are not measured from a
+font file, no measured table ships with the workbench.
+"""
+
+"""
+I have tried to follow this naming rule:
+ class names:    CamelCase
+ function names: mixedCase
+ constant names: ALL_CAPITAL + underscore
+ variable names: lower_case + underscore
+"""
+
+# imports and constants
+
+#- Estimated advances in em of character classes
+ADVANCE_GROUPS = (
+    (" ", 0.30),
+    ("ijlI.,:;'!|`", 0.25),
+    ("ftr()[]{}\"-", 0.35),
+    ("mwMW", 0.80),
+    ("⌀×±%@", 0.70),
+    ("0123456789", 0.55),
+    ("ABCDEFGHJKLNOPQRSTUVXYZÄÖÜ", 0.60),
+    )
+#- Advance of all other characters
+DEFAULT_ADVANCE = 0.50
+
+def advanceTable():
+    """Returns the advances {character: advance} of ADVANCE_GROUPS"""
+    table = {}
+    for characters, advance in ADVANCE_GROUPS:
+        for character in characters:
+            table[character] = advance
+    return table
+
+#- Built once, looked up per character
+advance_table = advanceTable()
+
+def textWidth(text, font_size):
+    """Returns the advance width of a text in svg units (mm)"""
+    width = 0.0
+    for character in text:
+        width += advance_table.get(character, DEFAULT_ADVANCE)
+    return width * float(font_size)
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2025 FBXL5 available on the forum:                      *
+# *   https://forum.freecad.org/memberlist.php?mode=viewprofile&u=26761     *
+# *                                                                         *
+# *   This file is part of FreeCAD.                                         *
+# *                                                                         *
+# *   FreeCAD is free software: you can redistribute it and/or modify it    *
+# *   under the terms of the GNU Lesser General Public License as           *
+# *   published by the Free Software Foundation, either version 3.0 of the  *
+# *   License, or (at your option) any later version.                       *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful, but        *
+# *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU      *
+# *   Lesser General Public License for more details.                       *
+# *                                                                         *
+# *   You should have received a copy of the GNU Lesser General Public      *
+# *   License along with FreeCAD. If not, see                               *
+# *   <https://www.gnu.org/licenses/>.                                      *
+# *                                                                         *
+# ***************************************************************************
+"""
+An index of the TechDraw pages of each document.
+Pages are found by their TypeId, the index is built once per document
+and kept up to date by a document observer. New pages get the lowest
+free number, so deleted pages leave no colliding names behind.
+The page of a view is found by walking up its InList, results are
+memoised until the document's views change.
+"""
+
+"""
+I have tried to follow this naming rule:
+ class names:    CamelCase
+ function names: mixedCase
+ constant names: ALL_CAPITAL + underscore
+ variable names: lower_case + underscore
+"""
+
+# imports and constants
+import bisect
+import os
+import re
+import FreeCAD
+
+PAGE_TYPE = "TechDraw::DrawPage"
+TEMPLATE_TYPE = "TechDraw::DrawSVGTemplate"
+#- Views that hold other views, a view's page is found through them
+CONTAINER_TYPES = ("TechDraw::DrawProjGroup", "TechDraw::DrawViewClip")
+PAGE_NAME = re.compile(r"^Page(\d+)$")
+
+#- {document name: {"pages": {page name}, "numbers": [sorted numbers]}}
+page_indices = {}
+#- {document name: revision}, counts changes of the view structure
+document_revisions = {}
+#- {document name: (revision, {view name: page name})}
+page_of_view = {}
+
+def pageNames(number):
+    """
+    Returns the names of a page and its template,
+    two digits at least, e.g. Page07/Template07 or Page123/Template123
+    """
+    return ("Page%02d" % number, "Template%02d" % number)
+
+def pageNumber(name):
+    """Returns the number of a page name like Page07 or None"""
+    match = PAGE_NAME.match(name)
+    if match is None:
+        return None
+    return int(match.group(1))
+
+def newRevision(document_name):
+    """Invalidates the memoised view pages of a document"""
+    document_revisions[document_name] = (
+        document_revisions.get(document_name, 0) + 1
+        )
+
+class PageIndexObserver():
+    """
+    Keeps the page indices up to date, undo, redo and restore
+    drop the index of the document to rebuild it on the next lookup.
+    Every change of the view structure starts a new revision.
+    """
+    def slotCreatedObject(self, obj):
+        newRevision(obj.Document.Name)
+        index = page_indices.get(obj.Document.Name)
+        if index is not None and obj.TypeId == PAGE_TYPE:
+            addToIndex(index, obj.Name)
+
+    def slotDeletedObject(self, obj):
+        newRevision(obj.Document.Name)
+        index = page_indices.get(obj.Document.Name)
+        if index is not None and obj.TypeId == PAGE_TYPE:
+            removeFromIndex(index, obj.Name)
+
+    def slotChangedObject(self, obj, prop):
+        if prop == "Views":
+            newRevision(obj.Document.Name)
+
+    def slotDeletedDocument(self, doc):
+        page_indices.pop(doc.Name, None)
+        page_of_view.pop(doc.Name, None)
+
+    def slotUndoDocument(self, doc):
+        page_indices.pop(doc.Name, None)
+        newRevision(doc.Name)
+
+    def slotRedoDocument(self, doc):
+        page_indices.pop(doc.Name, None)
+        newRevision(doc.Name)
+
+    def slotFinishRestoreDocument(self, doc):
+        page_indices.pop(doc.Name, None)
+        newRevision(doc.Name)
+
+#- The observer is registered with the first lookup
+page_observer = None
+
+def addToIndex(index, page_name):
+    """Adds a page to an index, its number is kept sorted"""
+    if page_name in index["pages"]:
+        return
+    index["pages"].add(page_name)
+    number = pageNumber(page_name)
+    if number is not None and number > 0:
+        bisect.insort(index["numbers"], number)
+
+def removeFromIndex(index, page_name):
+    """Removes a page from an index"""
+    if page_name not in index["pages"]:
+        return
+    index["pages"].discard(page_name)
+    number = pageNumber(page_name)
+    if number is not None and number > 0:
+        position = bisect.bisect_left(index["numbers"], number)
+        if (position < len(index["numbers"])
+            and index["numbers"][position] == number):
+            del index["numbers"][position]
+
+def registerObserver():
+    """Registers the document observer once"""
+    global page_observer
+    if page_observer is None:
+        page_observer = PageIndexObserver()
+        FreeCAD.addDocumentObserver(page_observer)
+
+def pageIndex(document):
+    """
+    Returns the page index of a document, scanning the objects only
+    if there is no index yet
+    """
+    registerObserver()
+    index = page_indices.get(document.Name)
+    if index is None:
+        index = {"pages": set(), "numbers": []}
+        for obj in document.findObjects(Type = PAGE_TYPE):
+            addToIndex(index, obj.Name)
+        page_indices[document.Name] = index
+    return index
+
+def pagesOf(document):
+    """Returns the page objects of a document"""
+    return [
+        document.getObject(name) for name in sorted(pageIndex(document)["pages"])
+        ]
+
+def countPages(document):
+    """Returns the number of pages in a document"""
+    return len(pageIndex(document)["pages"])
+
+def firstFreeNumber(numbers):
+    """
+    Returns the lowest positive number missing in a sorted list of
+    distinct positive numbers by binary search:
+    numbers[i] == i + 1 holds up to the first gap
+    """
+    low = 0
+    high = len(numbers)
+    while low < high:
+        middle = (low + high) // 2
+        if numbers[middle] == middle + 1:
+            low = middle + 1
+        else:
+            high = middle
+    return low + 1
+
+def nextPageNumber(document):
+    """
+    Returns the lowest page number whose page and template names
+    are both unused in the document
+    """
+    number = firstFreeNumber(pageIndex(document)["numbers"])
+    while True:
+        page_name, template_name = pageNames(number)
+        if (document.getObject(page_name) is None
+            and document.getObject(template_name) is None):
+            return number
+        number += 1
+
+def addPage(document, template_path):
+    """
+    Adds a page with a template loaded from template_path. The template
+    embeds the svg file in its PageResult, so the file may be removed
+    afterwards. Returns the page number, the page and the template object.
+    """
+    number = nextPageNumber(document)
+    page_name, template_name = pageNames(number)
+    page_object = document.addObject(PAGE_TYPE, page_name)
+    template_object = document.addObject(TEMPLATE_TYPE, template_name)
+    template_object.Template = template_path
+    page_object.Template = template_object
+    addToIndex(pageIndex(document), page_object.Name)
+    return (number, page_object, template_object)
+
+def findPageOfView(view):
+    """
+    Walks up the InList of a view to its page, passing through
+    projection groups and clip groups only
+    """
+    visited = set()
+    parents = list(view.InList)
+    while parents:
+        parent = parents.pop()
+        if parent.Name in visited:
+            continue
+        visited.add(parent.Name)
+        if parent.isDerivedFrom(PAGE_TYPE):
+            return parent
+        if parent.TypeId in CONTAINER_TYPES:
+            parents.extend(parent.InList)
+    return False
+
+def getPageOfView(view):
+    """
+    Returns the page that holds a view or False,
+    memoised per document revision
+    """
+    registerObserver()
+    document = view.Document
+    revision = document_revisions.get(document.Name, 0)
+    memo = page_of_view.get(document.Name)
+    if memo is None or memo[0] != revision:
+        memo = (revision, {})
+        page_of_view[document.Name] = memo
+    page_name = memo[1].get(view.Name)
+    if page_name is not None:
+        page = document.getObject(page_name)
+        if page is not None:
+            return page
+    page = findPageOfView(view)
+    if page:
+        memo[1][view.Name] = page.Name
+    return page
+
+def replaceTemplate(page, template_path):
+    """
+    Loads another svg file into the template of a page in place, the
+    file is embedded and may be removed afterwards. Editable texts keep
+    their values wherever the new template has a text of the same name.
+    Returns the template object.
+    """
+    template = page.Template
+    if template is None or not template.isDerivedFrom(TEMPLATE_TYPE):
+        number = pageNumber(page.Name)
+        template_name = pageNames(number)[1] if number else "Template"
+        template = page.Document.addObject(TEMPLATE_TYPE, template_name)
+        template.Template = template_path
+        page.Template = template
+        return template
+    old_texts = dict(template.EditableTexts)
+    template.Template = template_path
+    #- Assigned in one step to recompute only once
+    texts = template.EditableTexts
+    for name in texts:
+        if name in old_texts:
+            texts[name] = old_texts[name]
+    template.EditableTexts = texts
+    return template
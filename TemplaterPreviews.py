@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2025 FBXL5 available on the forum:                      *
+# *   https://forum.freecad.org/memberlist.php?mode=viewprofile&u=26761     *
+# *                                                                         *
+# *   This file is part of FreeCAD.                                         *
+# *                                                                         *
+# *   FreeCAD is free software: you can redistribute it and/or modify it    *
+# *   under the terms of the GNU Lesser General Public License as           *
+# *   published by the Free Software Foundation, either version 3.0 of the  *
+# *   License, or (at your option) any later version.                       *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful, but        *
+# *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU      *
+# *   Lesser General Public License for more details.                       *
+# *                                                                         *
+# *   You should have received a copy of the GNU Lesser General Public      *
+# *   License along with FreeCAD. If not, see                               *
+# *   <https://www.gnu.org/licenses/>.                                      *
+# *                                                                         *
+# ***************************************************************************
+"""
+Previews of svg files for the task panels.
+Images are rendered in a worker thread and kept for the whole session,
+the Gui thread only turns finished images into pixmaps.
+A sheet preview renders svg code built from options, following the
+changes of a panel.
+"""
+
+"""
+I have tried to follow this naming rule:
+ class names:    CamelCase
+ function names: mixedCase
+ constant names: ALL_CAPITAL + underscore
+ variable names: lower_case + underscore
+"""
+
+# imports and constants
+import os
+import threading
+import SvgToolkit
+import TemplaterLayout
+import TemplaterSymbolLibrary
+from PySide import QtCore
+from PySide.QtGui import QImage, QPainter, QPixmap
+from PySide.QtSvg import QSvgRenderer
+
+#- Width of a title block preview in pixels
+PREVIEW_WIDTH = 400
+#- Size of the square a sheet preview fits into, in pixels
+SHEET_PREVIEW_SIZE = 400
+#- Time in ms after the last change before a sheet preview is rendered
+SHEET_PREVIEW_DELAY = 150
+
+#- Rendered images {(path, mtime, width, height): QImage}
+preview_images = {}
+preview_lock = threading.Lock()
+#- Pixmaps of the rendered images, only used in the Gui thread
+preview_pixmaps = {}
+
+def previewKey(svg_path, width = PREVIEW_WIDTH):
+    """
+    Returns the cache key of a file's preview, the height follows from
+    the aspect ratio of its viewBox
+    """
+    svg_path = os.path.abspath(svg_path)
+    size = TemplaterSymbolLibrary.symbolSize(svg_path)
+    if size and size[0] > 0:
+        height = max(1, int(round(width * size[1] / size[0])))
+    else:
+        height = width // 4
+    return (svg_path, os.stat(svg_path).st_mtime_ns, width, height)
+
+def renderImage(svg_code, width, height):
+    """
+    Rasterises svg code into a white QImage, unlike a QPixmap this is
+    possible outside the Gui thread
+    """
+    image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+    image.fill(QtCore.Qt.white)
+    renderer = QSvgRenderer(QtCore.QByteArray(svg_code.encode("utf-8")))
+    painter = QPainter(image)
+    renderer.render(painter)
+    painter.end()
+    return image
+
+def renderPreview(key):
+    """Renders the preview of a key unless it is cached already"""
+    with preview_lock:
+        if key in preview_images:
+            return
+    image = renderImage(SvgToolkit.readResource(key[0]), key[2], key[3])
+    with preview_lock:
+        preview_images[key] = image
+
+def previewPixmap(key):
+    """
+    Returns the pixmap of a rendered preview or None if it isn't
+    rendered yet, to be called in the Gui thread
+    """
+    pixmap = preview_pixmaps.get(key)
+    if pixmap is None:
+        with preview_lock:
+            image = preview_images.get(key)
+        if image is None:
+            return None
+        pixmap = QPixmap.fromImage(image)
+        preview_pixmaps[key] = pixmap
+    return pixmap
+
+class PreviewLoader(QtCore.QObject):
+    """
+    Renders previews in a worker thread, finished is emitted in the Gui
+    thread for every rendered key
+    """
+    finished = QtCore.Signal(object)
+
+    def load(self, keys):
+        """Starts rendering the keys that are not cached yet"""
+        with preview_lock:
+            missing = [key for key in keys if key not in preview_images]
+        if missing:
+            threading.Thread(
+                target = self.run, args = (missing,), daemon = True
+                ).start()
+        return missing
+
+    def run(self, keys):
+        for key in keys:
+            try:
+                renderPreview(key)
+            except (OSError, ValueError):
+                continue
+            self.finished.emit(key)
+
+class SheetPreview(QtCore.QObject):
+    """
+    Shows a live preview of a sheet in a label. Changes within
+    SHEET_PREVIEW_DELAY are collected into one request, a single worker
+    thread renders only the latest request and results of outdated
+    requests are dropped. build returns the svg code for the options.
+    """
+    rendered = QtCore.Signal(int, object)
+
+    def __init__(self, build, label, size = SHEET_PREVIEW_SIZE):
+        super().__init__()
+        self.build = build
+        self.label = label
+        self.size = size
+        self.options = None
+        self.generation = 0
+        #- (generation, options) waiting for the worker
+        self.pending = None
+        self.condition = threading.Condition()
+        self.worker = None
+        self.timer = QtCore.QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(SHEET_PREVIEW_DELAY)
+        self.timer.timeout.connect(self.start)
+        self.rendered.connect(self.show)
+
+    def request(self, options):
+        """Schedules a preview of the options, restarting the delay"""
+        self.options = dict(options)
+        self.timer.start()
+
+    def start(self):
+        """slot: hands the latest options over to the worker"""
+        self.generation += 1
+        with self.condition:
+            self.pending = (self.generation, self.options)
+            self.condition.notify()
+        if self.worker is None:
+            self.worker = threading.Thread(
+                target = self.run, name = "TemplaterSheetPreview", daemon = True
+                )
+            self.worker.start()
+
+    def stop(self):
+        """Ends the worker, e.g. when the panel is closed"""
+        self.timer.stop()
+        with self.condition:
+            self.pending = (None, None)
+            self.condition.notify()
+
+    def run(self):
+        while True:
+            with self.condition:
+                while self.pending is None:
+                    self.condition.wait()
+                generation, options = self.pending
+                self.pending = None
+            if generation is None:
+                return
+            try:
+                svg = self.build(options)
+            except (OSError, ValueError, KeyError):
+                continue
+            sheet_size = TemplaterLayout.symbolSize(svg)
+            if not sheet_size:
+                continue
+            scale = min(self.size / sheet_size[0], self.size / sheet_size[1])
+            image = renderImage(
+                svg,
+                max(1, int(round(sheet_size[0] * scale))),
+                max(1, int(round(sheet_size[1] * scale)))
+                )
+            self.rendered.emit(generation, image)
+
+    def show(self, generation, image):
+        """slot: shows a rendered preview unless it is outdated"""
+        if generation != self.generation:
+            return
+        try:
+            self.label.setFixedSize(image.width(), image.height())
+            self.label.setPixmap(QPixmap.fromImage(image))
+        except RuntimeError:
+            pass  # the panel was closed meanwhile
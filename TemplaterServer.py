@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2025 FBXL5 available on the forum:                      *
+# *   https://forum.freecad.org/memberlist.php?mode=viewprofile&u=26761     *
+# *                                                                         *
+# *   This file is part of FreeCAD.                                         *
+# *                                                                         *
+# *   FreeCAD is free software: you can redistribute it and/or modify it    *
+# *   under the terms of the GNU Lesser General Public License as           *
+# *   published by the Free Software Foundation, either version 3.0 of the  *
+# *   License, or (at your option) any later version.                       *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful, but        *
+# *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU      *
+# *   Lesser General Public License for more details.                       *
+# *                                                                         *
+# *   You should have received a copy of the GNU Lesser General Public      *
+# *   License along with FreeCAD. If not, see                               *
+# *   <https://www.gnu.org/licenses/>.                                      *
+# *                                                                         *
+# ***************************************************************************
+"""
+A long-running render server for the svg generating methods.
+It speaks JSON-RPC 2.0, one request per line, either over stdin/stdout
+or over a Unix socket, and serves requests concurrently.
+
+Start it with FreeCAD's python, e.g.:
+  FreeCADCmd TemplaterServer.py
+  python TemplaterServer.py --socket /tmp/templater.sock
+(the second variant needs FreeCAD's lib folder on the PYTHONPATH)
+
+Methods:
+  createTemplate  params: format, frame, indices, tilt, title_block, ink,
+                          bom_rows, locale, text_to_path, merged_symbol,
+                          output (all optional)
+  createSymbol    params: tolerance, value, reference1, reference2,
+                          reference3, output (all optional)
+  ping            no params
+
+In stdio mode, anything printed by the svg methods goes to stderr.
+Translation tables exported by TemplaterTranslations.exportTables() can be
+preloaded with --translations, so localised templates need no Qt translator.
+Without "output" the svg code is returned as "svg", otherwise the file is
+written to the given path and its path is returned as "path".
+Templates are assembled from the fragments the Multi template tool keeps
+for its live preview, so the frame, indices and title block of a format
+are rendered once and reused by later requests. Templates with a merged
+symbol or texts converted to paths are generated as a whole.
+"""
+
+"""
+I have tried to follow this naming rule:
+ class names:    CamelCase
+ function names: mixedCase
+ constant names: ALL_CAPITAL + underscore
+ variable names: lower_case + underscore
+"""
+
+# imports and constants
+import json
+import os
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import SvgToolkit
+import TemplaterTranslations
+# The template generator and its fragments stay loaded (warm)
+import TemplaterTemplateMultiCmd
+
+PARSE_ERROR      = -32700
+INVALID_REQUEST  = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS   = -32602
+SERVER_ERROR     = -32000
+
+SYMBOL_OPTIONS = {
+    "tolerance":"Position",
+    "value":"⌀ 0,1",
+    "reference1":"A",
+    "reference2":"B",
+    "reference3":"C"
+    }
+
+def mergeOptions(defaults, params):
+    """
+    Returns the default options updated by the given parameters,
+    unknown parameter names raise a KeyError
+    """
+    options = dict(defaults)
+    for key in params:
+        if key == "output":
+            continue
+        if key not in defaults:
+            raise KeyError(key)
+        options[key] = params[key]
+    return options
+
+def renderToFile(render_method, options, output):
+    """
+    Runs a render method either into the requested output file
+    or into a temporary file that is read back and removed
+    """
+    if output:
+        render_method(output, options)
+        return {"path": output}
+    handle, temp_path = tempfile.mkstemp(suffix = ".svg", prefix = "Templater")
+    os.close(handle)
+    try:
+        render_method(temp_path, options)
+        s = open(temp_path, "r", encoding = "utf-8")
+        svg = s.read()
+        s.close()
+    finally:
+        os.remove(temp_path)
+    return {"svg": svg}
+
+def svgResult(svg, output):
+    """Returns svg code as the result or writes it to the output file"""
+    if output:
+        s = open(output, "w", encoding = "utf-8")
+        s.write(svg)
+        s.close()
+        return {"path": output}
+    return {"svg": svg}
+
+def renderTemplate(template_path, options):
+    """Calls the template generator of the Multi template tool"""
+    TemplaterTemplateMultiCmd.createTemplate(
+        template_path = template_path, **options
+        )
+
+def renderSymbol(symbol_path, options):
+    """Calls the symbol generator of the tolerance frame tool"""
+    #- Imported here, the tool pulls in TechDrawTools from the Gui side
+    import TemplaterToleranceFrameCmd
+    TemplaterToleranceFrameCmd.writeSymbol(symbol_path, **options)
+
+class RenderServer():
+    """
+    Dispatches JSON-RPC requests to the svg generating methods.
+    Requests are handled in a thread pool, replies are sent
+    in the order they are finished, matching requests by their id.
+    """
+    def __init__(self, workers = 4):
+        self.executor = ThreadPoolExecutor(max_workers = workers)
+        self.methods = {
+            "createTemplate": self.createTemplate,
+            "createSymbol": self.createSymbol,
+            "ping": self.ping
+            }
+
+    def createTemplate(self, params):
+        options = mergeOptions(
+            TemplaterTemplateMultiCmd.DEFAULT_OPTIONS, params
+            )
+        #- sheetDimensions() would render an unknown format as ISO A0
+        if options["format"] not in SvgToolkit.SHEET_SIZES:
+            raise KeyError("format " + str(options["format"]))
+        if options["merged_symbol"] or options["text_to_path"]:
+            return renderToFile(renderTemplate, options, params.get("output"))
+        return svgResult(
+            TemplaterTemplateMultiCmd.previewSvg(options), params.get("output")
+            )
+
+    def createSymbol(self, params):
+        options = mergeOptions(SYMBOL_OPTIONS, params)
+        return renderToFile(renderSymbol, options, params.get("output"))
+
+    def ping(self, params):
+        return "pong"
+
+    def errorReply(self, request_id, code, message):
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": {"code": code, "message": message}
+            }
+
+    def dispatch(self, request):
+        """Runs one request object and returns the reply object or None"""
+        if not isinstance(request, dict) or "method" not in request:
+            return self.errorReply(None, INVALID_REQUEST, "Invalid request")
+        request_id = request.get("id")
+        method = self.methods.get(request["method"])
+        if method is None:
+            reply = self.errorReply(
+                request_id, METHOD_NOT_FOUND, "Unknown method"
+                )
+        else:
+            params = request.get("params", {})
+            try:
+                if not isinstance(params, dict):
+                    raise KeyError("params")
+                reply = {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "result": method(params)
+                    }
+            except (KeyError, TypeError) as error:
+                reply = self.errorReply(
+                    request_id, INVALID_PARAMS,
+                    "Invalid parameter: " + str(error)
+                    )
+            except Exception as error:
+                reply = self.errorReply(request_id, SERVER_ERROR, str(error))
+        if "id" not in request:
+            return None  # a notification does not get a reply
+        return reply
+
+    def handleLine(self, line, send):
+        """
+        Parses one line and hands the request(s) over to the thread pool.
+        send() is called with each reply object.
+        """
+        line = line.strip()
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+        except ValueError:
+            send(self.errorReply(None, PARSE_ERROR, "Parse error"))
+            return
+        if isinstance(request, list):
+            # A batch is answered with one list once all members are done
+            def runBatch():
+                replies = [self.dispatch(item) for item in request]
+                replies = [reply for reply in replies if reply is not None]
+                if replies:
+                    send(replies)
+            self.executor.submit(runBatch)
+        else:
+            def runSingle():
+                reply = self.dispatch(request)
+                if reply is not None:
+                    send(reply)
+            self.executor.submit(runSingle)
+
+    def serveStdio(self, input_stream = None, output_stream = None):
+        """Serves requests read from stdin, replies go to stdout"""
+        input_stream = input_stream or sys.stdin
+        output_stream = output_stream or sys.stdout
+        # The svg methods print some debug output, keep it off the channel
+        sys.stdout = sys.stderr
+        lock = threading.Lock()
+
+        def send(reply):
+            with lock:
+                output_stream.write(json.dumps(reply) + "\n")
+                output_stream.flush()
+
+        for line in input_stream:
+            self.handleLine(line, send)
+        self.executor.shutdown(wait = True)
+
+    def serveSocket(self, socket_path):
+        """Serves requests on a Unix socket, one thread per connection"""
+        import socketserver
+        server = self
+
+        class RequestHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                lock = threading.Lock()
+
+                def send(reply):
+                    data = (json.dumps(reply) + "\n").encode("utf-8")
+                    with lock:
+                        self.wfile.write(data)
+                        self.wfile.flush()
+
+                for raw_line in self.rfile:
+                    server.handleLine(raw_line.decode("utf-8"), send)
+
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        socket_server = socketserver.ThreadingUnixStreamServer(
+            socket_path, RequestHandler
+            )
+        try:
+            socket_server.serve_forever()
+        finally:
+            socket_server.server_close()
+            os.remove(socket_path)
+            self.executor.shutdown(wait = True)
+
+def main():
+    """
+    Reads the command line, FreeCADCmd passes its own arguments,
+    so the socket path and the number of workers can also be set by
+    the environment variables TEMPLATER_SOCKET, TEMPLATER_WORKERS and
+    TEMPLATER_TRANSLATIONS
+    """
+    import argparse
+    parser = argparse.ArgumentParser(description = "Templater render server")
+    parser.add_argument("--socket", default = os.environ.get("TEMPLATER_SOCKET"))
+    parser.add_argument("--workers", type = int,
+        default = int(os.environ.get("TEMPLATER_WORKERS", "4"))
+        )
+    parser.add_argument("--translations",
+        default = os.environ.get("TEMPLATER_TRANSLATIONS")
+        )
+    arguments = parser.parse_known_args()[0]
+    if arguments.translations:
+        TemplaterTranslations.loadTables(arguments.translations)
+    server = RenderServer(arguments.workers)
+    if arguments.socket:
+        server.serveSocket(arguments.socket)
+    else:
+        server.serveStdio()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2025 FBXL5 available on the forum:                      *
+# *   https://forum.freecad.org/memberlist.php?mode=viewprofile&u=26761     *
+# *                                                                         *
+# *   This file is part of FreeCAD.                                         *
+# *                                                                         *
+# *   FreeCAD is free software: you can redistribute it and/or modify it    *
+# *   under the terms of the GNU Lesser General Public License as           *
+# *   published by the Free Software Foundation, either version 3.0 of the  *
+# *   License, or (at your option) any later version.                       *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful, but        *
+# *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU      *
+# *   Lesser General Public License for more details.                       *
+# *                                                                         *
+# *   You should have received a copy of the GNU Lesser General Public      *
+# *   License along with FreeCAD. If not, see                               *
+# *   <https://www.gnu.org/licenses/>.                                      *
+# *                                                                         *
+# ***************************************************************************
+"""
+An index of the svg symbols in the bundled and the configured symbol
+directories. Each symbol's name, viewBox size, editable text names and
+content hash are kept in a JSON file in the user data directory, a scan
+reads only files whose modification time or size has changed.
+Further directories are set with the string parameter
+SymbolDirectories in BaseApp/Preferences/Mod/Templater, separated by ";".
+"""
+
+"""
+I have tried to follow this naming rule:
+ class names:    CamelCase
+ function names: mixedCase
+ constant names: ALL_CAPITAL + underscore
+ variable names: lower_case + underscore
+"""
+
+# imports and constants
+import hashlib
+import json
+import os
+import threading
+import FreeCAD
+import SvgToolkit
+import TemplaterLayout
+
+BUNDLED_SYMBOLS = os.path.join(SvgToolkit.mod_path, "Resources", "symbols")
+INDEX_NAME = "symbol_index.json"
+#- Increase if the entries change, to rescan existing indices
+INDEX_VERSION = 1
+DIRECTORIES_SEPARATOR = ";"
+
+#- The index {svg path: entry}, read from the file once per session
+loaded_index = {"loaded":False, "symbols":{}}
+index_lock = threading.Lock()
+#- The background scan started by startScan
+scan_thread = None
+
+def indexPath():
+    """Returns the path of the index file in the user data directory"""
+    return os.path.join(FreeCAD.getUserAppDataDir(), "Templater", INDEX_NAME)
+
+def symbolDirectories():
+    """Returns the bundled and the configured symbol directories"""
+    parameter_path = FreeCAD.ParamGet(
+        "User parameter:BaseApp/Preferences/Mod/Templater"
+        )
+    directories = [BUNDLED_SYMBOLS]
+    for directory in parameter_path.GetString("SymbolDirectories").split(
+        DIRECTORIES_SEPARATOR
+        ):
+        directory = os.path.expanduser(directory.strip())
+        if directory and os.path.isdir(directory):
+            directories.append(os.path.abspath(directory))
+    return directories
+
+def svgFiles(directories):
+    """Returns the paths of all svg files in and below the directories"""
+    svg_paths = []
+    for directory in directories:
+        for dir_path, dir_names, file_names in os.walk(directory):
+            dir_names.sort()
+            for file_name in sorted(file_names):
+                if file_name.lower().endswith(".svg"):
+                    svg_paths.append(os.path.join(dir_path, file_name))
+    return svg_paths
+
+def readSymbol(svg_path, stat):
+    """
+    Returns the index entry of a symbol file or False if it can't be
+    read, stat is the file's os.stat result
+    """
+    try:
+        s = open(svg_path, "rb")
+        content = s.read()
+        s.close()
+        svg = content.decode("utf-8")
+    except (OSError, UnicodeDecodeError):
+        return False
+    size = TemplaterLayout.symbolSize(svg)
+    return {
+        "path":svg_path,
+        "name":os.path.splitext(os.path.basename(svg_path))[0],
+        "mtime":stat.st_mtime_ns,
+        "bytes":stat.st_size,
+        "width":size[0] if size else None,
+        "height":size[1] if size else None,
+        "fields":SvgToolkit.editableNames(svg),
+        "hash":hashlib.sha1(content).hexdigest()
+        }
+
+def isCurrent(entry, stat):
+    """Checks if an index entry still describes a file"""
+    return (entry["mtime"] == stat.st_mtime_ns
+        and entry["bytes"] == stat.st_size
+        )
+
+def loadIndex():
+    """Reads the index file once, a missing or outdated file is ignored"""
+    with index_lock:
+        if loaded_index["loaded"]:
+            return
+        loaded_index["loaded"] = True
+        try:
+            j = open(indexPath(), "r", encoding = "utf-8")
+            data = json.load(j)
+            j.close()
+        except (OSError, ValueError):
+            return
+        if data.get("version") == INDEX_VERSION:
+            loaded_index["symbols"] = data.get("symbols", {})
+
+def saveIndex(symbols):
+    """
+    Writes the index file, a read-only user directory just goes
+    without a persisted index
+    """
+    index_path = indexPath()
+    temporary_path = index_path + ".tmp"
+    try:
+        index_dir = os.path.dirname(index_path)
+        if not os.path.isdir(index_dir):
+            os.makedirs(index_dir)
+        j = open(temporary_path, "w", encoding = "utf-8")
+        json.dump(
+            {"version":INDEX_VERSION, "symbols":symbols},
+            j, indent = 1, sort_keys = True
+            )
+        j.close()
+        os.replace(temporary_path, index_path)
+    except OSError:
+        return False
+    return True
+
+def scanLibrary(directories = None):
+    """
+    Updates the index with the symbols of the directories, only new and
+    changed files are read. Writes the index file if anything changed.
+    Returns the index.
+    """
+    if directories is None:
+        directories = symbolDirectories()
+    loadIndex()
+    with index_lock:
+        old_symbols = dict(loaded_index["symbols"])
+    symbols = {}
+    changed = False
+    for svg_path in svgFiles(directories):
+        try:
+            stat = os.stat(svg_path)
+        except OSError:
+            continue
+        entry = old_symbols.get(svg_path)
+        if entry is None or not isCurrent(entry, stat):
+            entry = readSymbol(svg_path, stat)
+            changed = True
+            if not entry:
+                continue
+        symbols[svg_path] = entry
+    if set(symbols) != set(old_symbols):
+        changed = True
+    with index_lock:
+        loaded_index["symbols"] = symbols
+    if changed:
+        saveIndex(symbols)
+    return symbols
+
+def startScan():
+    """
+    Scans the symbol directories in a background thread, once at a time.
+    Returns the thread.
+    """
+    global scan_thread
+    if scan_thread is None or not scan_thread.is_alive():
+        scan_thread = threading.Thread(
+            target = scanLibrary, name = "TemplaterSymbolScan", daemon = True
+            )
+        scan_thread.start()
+    return scan_thread
+
+def symbols():
+    """
+    Returns the entries of all indexed symbols sorted by name, without
+    waiting for a running scan
+    """
+    loadIndex()
+    with index_lock:
+        entries = list(loaded_index["symbols"].values())
+    return sorted(entries, key = lambda entry: (entry["name"], entry["path"]))
+
+def symbolEntry(svg_path):
+    """
+    Returns the index entry of a symbol file, a missing or outdated
+    entry is read at once. Returns False if the file can't be read.
+    """
+    svg_path = os.path.abspath(svg_path)
+    loadIndex()
+    try:
+        stat = os.stat(svg_path)
+    except OSError:
+        return False
+    with index_lock:
+        entry = loaded_index["symbols"].get(svg_path)
+    if entry is not None and isCurrent(entry, stat):
+        return entry
+    entry = readSymbol(svg_path, stat)
+    if entry:
+        with index_lock:
+            loaded_index["symbols"][svg_path] = entry
+    return entry
+
+def symbolSize(svg_path):
+    """Returns (width, height) of a symbol file's viewBox or False"""
+    entry = symbolEntry(svg_path)
+    if not entry or entry["width"] is None:
+        return False
+    return (entry["width"], entry["height"])
@@ -35,12 +35,24 @@ I have tried to follow this naming rule:
 # imports and constants
 import FreeCAD
 import FreeCADGui
+import collections
+import json
 import os
+import shutil
+import tempfile
+import threading
+import xml.etree.ElementTree as ET
 import SvgToolkit
+import TemplaterCommand
+import TemplaterGlyphs
+import TemplaterLayout
+import TemplaterPages
+import TemplaterSymbolLibrary
+import TemplaterTranslations
 import TitleBlock_KG
 from PySide import QtCore
 from PySide.QtCore import QT_TRANSLATE_NOOP
-from PySide.QtGui import (QAction, QGroupBox, QMessageBox, QPixmap)
+from PySide.QtGui import (QAction, QGroupBox, QMessageBox)
 from PySide.QtWidgets import (QGridLayout, QLabel, QComboBox,
     QDoubleSpinBox, QCheckBox, QRadioButton, QButtonGroup
     )
@@ -59,6 +71,41 @@ TITLE_BLOCKS = {
     "BM_4":os.path.join(symbols_path, "Titleblock_BM_4.svg"),
     "BM_5_max":os.path.join(symbols_path, "Titleblock_BM_5_max.svg")
     }
+#- Heights of the title block symbols, all of them are 180 mm wide,
+#  used if a symbol file can't be measured
+SYMBOL_HEIGHTS = {
+    "BM_1_min":36,
+    "BM_2":36,
+    "BM_3_adv":48,
+    "BM_4":48,
+    "BM_5_max":60
+    }
+#- Property of a template object that records its options as JSON
+OPTIONS_PROPERTY = "TemplaterOptions"
+#- Editable texts that receive the sheet number of a drawing set,
+#  templates with a merged title block symbol use the symbol's name
+TEMPLATE_SHEET_FIELDS = ("Sheets", "sheet_number")
+SYMBOL_SHEET_FIELDS = ("sheet_number",)
+
+#- Svg code of template fragments {(method, arguments): code}, most
+#  recently used last, for the live preview and the render server
+preview_fragments = collections.OrderedDict()
+preview_fragments_lock = threading.Lock()
+PREVIEW_FRAGMENTS_SIZE = 64
+
+#- Default options of createTemplate, the same as the task panel's defaults
+DEFAULT_OPTIONS = {
+    "format":"ISO A4",
+    "frame":True,
+    "indices":True,
+    "tilt":True,
+    "title_block":True,
+    "ink":"#000",
+    "bom_rows":0,
+    "text_to_path":False,
+    "merged_symbol":None,
+    "locale":None
+    }
 
 def getActiveDocument():
     """
@@ -70,17 +117,6 @@ def getActiveDocument():
         QMessageBox.warning(None, "", warning_text)
     return ado
 
-def existingPages(document):
-    """
-    Counts existing pages in the active document
-    """
-    number_of_pages = 0
-    for item in document.Objects:
-        if item.Name.startswith("Page"):
-        #if item.Name[:4] == "Page":
-            number_of_pages += 1
-    return number_of_pages
-
 def insertSymbol(active_doc, work_page, format, symbol_path, symbol_height):
     """
     Inserts a symbol in the active document
@@ -90,80 +126,283 @@ def insertSymbol(active_doc, work_page, format, symbol_path, symbol_height):
     #- Load svg content into the symbol
     #symbol_name = "Titleblock_BM_1_minimal.svg"
     #symbol_path = os.path.join(mod_path, "Resources", "symbols", symbol_name)
-    s = open(symbol_path, "r", encoding="utf-8")
-    svg = s.read()
-    s.close()
-    sym.Symbol = svg
+    sym.Symbol = SvgToolkit.readResource(symbol_path)
     #- insert the symbol into a page
     work_page.addView(sym)
     sym.Owner = work_page
-    # Its bounding box center is placed at the lower left corner of the page
-    sheet_size = SvgToolkit.sheetDimensions(format)
-    sheet_x = sheet_size[0]
-    sheet_y = sheet_size[1]
-    title_x = 180
-    title_y = symbol_height
-    #- Symbol center offsets from lower left corner
-    sym.X = float(sheet_x) - 10 - (title_x / 2)
-    sym.Y = 10 + title_y /2
-
-    work_page.ViewObject.doubleClicked()
+    #- Its bounding box center is placed at the lower right corner
+    #  of the drawing area, sized by the symbol's measured viewBox
+    symbol_size = TemplaterSymbolLibrary.symbolSize(symbol_path)
+    if not symbol_size:
+        symbol_size = (180, symbol_height)
+    sym.X, sym.Y = TemplaterLayout.titleBlockPosition(
+        TemplaterLayout.drawingArea(format), symbol_size
+        )
+
+    return sym
+
+def mergeSymbol(template_path, sheet_size, symbol_path):
+    """
+    Splices a title block symbol into a template file, placed into the
+    lower right corner of the drawing area like insertSymbol does.
+    The graphics are moved by a transformation, editable texts get
+    absolute coordinates and their inherited style, since TechDraw
+    places the clickable fields by the text coordinates only.
+    """
+    SVG_NS = TemplaterGlyphs.SVG_NS
+    FREECAD_NS = TemplaterGlyphs.FREECAD_NS
+    ET.register_namespace("", SVG_NS)
+    ET.register_namespace("freecad", FREECAD_NS)
+    parser = ET.XMLParser(target = ET.TreeBuilder(insert_comments = True))
+    tree = ET.parse(template_path, parser)
+    root = tree.getroot()
+    symbol_root = ET.fromstring(SvgToolkit.readResource(symbol_path))
+    #- The symbol's viewBox is 180 mm wide and as high as the title block
+    view_box = symbol_root.get("viewBox").split()
+    offset_x = float(sheet_size[0]) - 10 - float(view_box[2])
+    offset_y = float(sheet_size[1]) - 10 - float(view_box[3])
+
+    graphics = ET.SubElement(root, "{" + SVG_NS + "}g")
+    graphics.set("id", "title-block-symbol")
+    graphics.set("transform", "translate({:g},{:g})".format(offset_x, offset_y))
+    editables = ET.SubElement(root, "{" + SVG_NS + "}g")
+    editables.set("id", "title-block-symbol-editable")
+
+    def spliceChildren(parent, target, inherited):
+        """Copies the children, moving editable texts out of the group"""
+        for child in list(parent):
+            style = TemplaterGlyphs.styleOf(child, inherited)
+            attributes = {}
+            editable = False
+            for name, value in child.attrib.items():
+                #- Any FreeCAD namespace becomes the template's one
+                if name.startswith("{") and name.split("}")[0].endswith(
+                    "Svg_Namespace"
+                    ):
+                    name = "{" + FREECAD_NS + "}" + name.split("}")[1]
+                    editable = editable or name.endswith("}editable")
+                attributes[name] = value
+            if editable:
+                text = ET.SubElement(editables, child.tag, attributes)
+                text.set("x", "{:g}".format(float(child.get("x", "0")) + offset_x))
+                text.set("y", "{:g}".format(float(child.get("y", "0")) + offset_y))
+                text.set("style", ";".join(
+                    name + ":" + value for name, value in style.items()
+                    ))
+                text.text = child.text
+                text.extend(list(child))
+                continue
+            copy = ET.SubElement(target, child.tag, attributes)
+            copy.text = child.text
+            copy.tail = child.tail
+            spliceChildren(child, copy, style)
+
+    spliceChildren(symbol_root, graphics, {})
+    tree.write(template_path, encoding = "UTF-8", xml_declaration = True)
+    return template_path
+
+def storeOptions(template, options):
+    """Records the options a template was generated with"""
+    if OPTIONS_PROPERTY not in template.PropertiesList:
+        template.addProperty("App::PropertyString", OPTIONS_PROPERTY,
+            "Templater", "Options the template was generated with"
+            )
+        template.setEditorMode(OPTIONS_PROPERTY, 2)  # hidden
+    setattr(template, OPTIONS_PROPERTY, json.dumps(options, sort_keys = True))
 
-    return
+def storedOptions(template):
+    """
+    Returns the options a template was generated with
+    or None if it was not generated by Templater
+    """
+    if template is None or OPTIONS_PROPERTY not in template.PropertiesList:
+        return None
+    options = dict(DEFAULT_OPTIONS)
+    options.update(json.loads(getattr(template, OPTIONS_PROPERTY)))
+    return options
 
-def insertTemplate(format, symbol, symbol_path, symbol_height):
+def pageOptions(page, changes = None):
     """
-    Inserts a page and a template in the active document
+    Returns the options for a page: the stored options of its template,
+    or its sheet format for foreign templates, updated by changes
+    """
+    options = storedOptions(page.Template)
+    if options is None:
+        options = dict(DEFAULT_OPTIONS)
+        if page.Template is not None:
+            format = SvgToolkit.formatOfSize(
+                getattr(page.Template.Width, "Value", page.Template.Width),
+                getattr(page.Template.Height, "Value", page.Template.Height)
+                )
+            if format:
+                options["format"] = format
+    if changes:
+        options.update(changes)
+    return options
+
+def insertTemplate(
+    format, symbol, symbol_path, symbol_height, template_path = file_path,
+    options = None
+    ):
+    """
+    Inserts a page and a template in the active document.
+    Optional options are recorded on the template for later replacement.
     """
     active_doc = getActiveDocument()
     if not active_doc:
         return
-    #- Count existing pages and add one for the new page number
-    page_mumber = existingPages(active_doc) + 1
-    #- Define the new page's name and the new template's name
-    #  (with only 2 trailing digits starting with 01)
-    if page_mumber < 10:
-        # insert leading zero
-        next = ("0" + str(page_mumber))
-    else:
-        next = str(page_mumber)
-    new_page = ("Page" + next)
-    new_template = ("Template" + next)
-    # add a page object to the active document
-    page_object = active_doc.addObject("TechDraw::DrawPage", new_page)
-    # add a template object to the active document
-    active_doc.addObject("TechDraw::DrawSVGTemplate", new_template)
-    # load the svg template into the template object
-    active_doc.getObject(new_template).Template = file_path
-    # add the template object to the page's object list
-    active_doc.getObject(new_page).Template = active_doc.getObject(new_template)
-    # At this point the document received a new page with a new template
-
-    if symbol:
-        insertSymbol(
-            active_doc, page_object, format, symbol_path, symbol_height
+    #- Page, template and symbol are one undo step with a single redraw
+    with TemplaterCommand.commandTransaction(
+        active_doc, "New template"
+        ) as pages:
+        #- Add a page with the lowest free number, e.g. Page03 and Template03
+        page_mumber, page_object, template_object = TemplaterPages.addPage(
+            active_doc, template_path
             )
-        # edit symbol text entries
-        return
-    # edit template text entries
+        pages.append(page_object)
+        if options is not None:
+            storeOptions(template_object, options)
+        # At this point the document received a new page with a new template
+
+        if symbol:
+            insertSymbol(
+                active_doc, page_object, format, symbol_path, symbol_height
+                )
 
     # open the page object for editing
-    active_doc.getObject(new_page).ViewObject.doubleClicked()
+    page_object.ViewObject.doubleClicked()
 
-    result = [page_mumber, new_page]
+    result = [page_mumber, page_object.Name]
     return result
 
-def insertGroups(
+def fillSheetNumber(template, symbol, sheet_text):
+    """
+    Writes e.g. "3 / 12" into the sheet fields of a template and
+    a title block symbol, each with a single assignment
+    """
+    texts = template.EditableTexts
+    for name in TEMPLATE_SHEET_FIELDS:
+        if name in texts:
+            texts[name] = sheet_text
+    template.EditableTexts = texts
+    if symbol is not None:
+        names = SvgToolkit.editableNames(symbol.Symbol)
+        texts = list(symbol.EditableTexts)
+        if len(names) == len(texts):
+            for name in SYMBOL_SHEET_FIELDS:
+                if name in names:
+                    texts[names.index(name)] = sheet_text
+            symbol.EditableTexts = texts
+
+def templateForSpec(options, template_dir):
+    """
+    Returns a prebuilt template matching the options or generates one
+    into template_dir
+    """
+    import TemplaterTemplatePack
+    template_path = TemplaterTemplatePack.findPrebuilt(options)
+    if template_path is None:
+        template_path = os.path.join(template_dir, templateFileName(options))
+        createTemplate(template_path = template_path, **options)
+    return template_path
+
+def createDrawingSet(sheet_specs):
+    """
+    Creates one page per sheet spec in the active document.
+    A spec holds template options (see DEFAULT_OPTIONS) and optionally
+    "symbol", the key of a title block symbol in TITLE_BLOCKS.
+    Each distinct spec gets one template, all pages and symbols are
+    created in one transaction, sheet fields are filled with "i / n" and
+    only the first page is opened at the end.
+    Returns the list of pages.
+    """
+    active_doc = getActiveDocument()
+    if not active_doc or not sheet_specs:
+        return []
+    #- The templates embed the generated files, see addPage
+    template_dir = tempfile.mkdtemp(prefix = "Templater")
+    try:
+        #- {canonical spec: template path}, one template per distinct spec
+        template_paths = {}
+        sheets = []
+        for spec in sheet_specs:
+            options = dict(DEFAULT_OPTIONS)
+            options.update(
+                (key, value) for key, value in spec.items() if key != "symbol"
+                )
+            key = json.dumps(options, sort_keys = True)
+            if key not in template_paths:
+                template_paths[key] = templateForSpec(options, template_dir)
+            sheets.append((options, spec.get("symbol"), template_paths[key]))
+
+        number_of_sheets = len(sheets)
+        with TemplaterCommand.commandTransaction(
+            active_doc, "New drawing set"
+            ) as pages:
+            for sheet_number, (options, symbol_key, template_path) in enumerate(
+                sheets, 1
+                ):
+                page_mumber, page_object, template_object = TemplaterPages.addPage(
+                    active_doc, template_path
+                    )
+                pages.append(page_object)
+                storeOptions(template_object, options)
+                symbol = None
+                if symbol_key:
+                    symbol = insertSymbol(
+                        active_doc,
+                        page_object,
+                        options["format"],
+                        TITLE_BLOCKS[symbol_key],
+                        SYMBOL_HEIGHTS[symbol_key]
+                        )
+                fillSheetNumber(
+                    template_object,
+                    symbol,
+                    str(sheet_number) + " / " + str(number_of_sheets)
+                    )
+            drawing_set = list(pages)
+    finally:
+        shutil.rmtree(template_dir, ignore_errors = True)
+    #- Open the first page once everything is done
+    if SvgToolkit.isGuiLoaded():
+        drawing_set[0].ViewObject.doubleClicked()
+    return drawing_set
+
+def regenerateTemplate(page, options, template_path = None):
+    """
+    Generates a template with new options for an existing page and
+    swaps it in place, editable texts keep their values by name.
+    Optional template_path is an already generated template to use.
+    The page is recomputed once. Returns the template object.
+    """
+    #- The page keeps a copy of the generated file, see replaceTemplate
+    template_dir = tempfile.mkdtemp(prefix = "Templater")
+    try:
+        if template_path is None:
+            template_path = templateForSpec(options, template_dir)
+        with TemplaterCommand.commandTransaction(
+            page.Document, "Replace template", [page]
+            ):
+            template = TemplaterPages.replaceTemplate(page, template_path)
+            storeOptions(template, options)
+    finally:
+        shutil.rmtree(template_dir, ignore_errors = True)
+    return template
+
+def groupWriters(
     format,
     sheet_size,
     indices,
     tilt,
     title_block,
     ink,
-    bom_rows
+    bom_rows,
+    locale = None
     ):
     """
-    Calls external methods to embed groups between the outer body tags.
+    Returns the external methods that embed groups between the outer body
+    tags as (method, arguments), each is called with the file path first.
     (<g>...</g> to set common attributes and transformations
     for grouped elements)
     """
@@ -183,30 +422,62 @@ def insertGroups(
     if_left   = 5
     if_right  = 5
     if_offsets = (if_top, if_bottom, if_left, if_right)
-    SvgToolkit.createFrames(file_path, sheet_size, da_offsets, if_offsets)
+    #- Each writing method appends a fragment of svg code to the file
+    writers = [(SvgToolkit.createFrames, (sheet_size, da_offsets, if_offsets))]
     if indices:
         if tilt:
-            SvgToolkit.createDecorations(
-                file_path, sheet_size, da_offsets, if_offsets, "-90"
-                )
+            writers.append((
+                SvgToolkit.createDecorations,
+                (sheet_size, da_offsets, if_offsets, "-90")
+                ))
         else:
-            SvgToolkit.createDecorations(
-                file_path, sheet_size, da_offsets, if_offsets
-                )
+            writers.append((
+                SvgToolkit.createDecorations,
+                (sheet_size, da_offsets, if_offsets)
+                ))
     if title_block:
-        tb_offsets = TitleBlock_KG.createTitleBlock(
-            file_path, sheet_size, da_offsets
-            )
-        TitleBlock_KG.createEditableText(file_path, sheet_x, sheet_y, ink)
-        logo_position = tb_offsets[0]
-        proj_symb_position = tb_offsets[1]
-        Title_block_height = tb_offsets[2]
-        SvgToolkit.createFreecadLogo(file_path, logo_position)
-        SvgToolkit.createProjectionSymbol(file_path, proj_symb_position)
-        if bom_rows == 0:
-            return
-        TitleBlock_KG.createBOMLines(file_path, sheet_x, sheet_y, bom_rows, ink)
-    return
+        writers.append((writeTitleBlock, (sheet_size, da_offsets, ink, locale)))
+        if bom_rows != 0:
+            writers.append((
+                TitleBlock_KG.createBOMLines,
+                (sheet_x, sheet_y, bom_rows, ink, locale)
+                ))
+    return writers
+
+def writeTitleBlock(template_path, sheet_size, da_offsets, ink, locale = None):
+    """
+    Writes the title block with its editable texts, the FreeCAD logo and
+    the projection symbol at the places it leaves for them
+    """
+    tb_offsets = TitleBlock_KG.createTitleBlock(
+        template_path, sheet_size, da_offsets, locale
+        )
+    TitleBlock_KG.createEditableText(
+        template_path, sheet_size[0], sheet_size[1], ink
+        )
+    logo_position = tb_offsets[0]
+    proj_symb_position = tb_offsets[1]
+    SvgToolkit.createFreecadLogo(template_path, logo_position)
+    SvgToolkit.createProjectionSymbol(template_path, proj_symb_position)
+
+def insertGroups(
+    format,
+    sheet_size,
+    indices,
+    tilt,
+    title_block,
+    ink,
+    bom_rows,
+    template_path = file_path,
+    locale = None
+    ):
+    """
+    Calls external methods to embed groups between the outer body tags.
+    """
+    for writer, arguments in groupWriters(
+        format, sheet_size, indices, tilt, title_block, ink, bom_rows, locale
+        ):
+        writer(template_path, *arguments)
 
 def createTemplate(
     format,
@@ -215,18 +486,27 @@ def createTemplate(
     tilt,
     title_block,
     ink,
-    bom_rows
+    bom_rows,
+    template_path = file_path,
+    locale = None,
+    text_to_path = False,
+    merged_symbol = None
     ):
     """
     Calls external methods to build head and outer body tags.
     (<svg>...</svg> to embed grouped elements)
     The result is an empty sheet for other than technical drafting purposes.
+    Optional template_path redirects the output, e.g. for the render server.
+    Optional locale selects a cached translation table for fixed texts.
+    Optional text_to_path converts non-editable texts into glyph paths.
+    Optional merged_symbol, a key of TITLE_BLOCKS, is spliced into the
+    template instead of being inserted as a separate symbol view.
     """
     sheet_size = SvgToolkit.sheetDimensions(format)
     sheet_x = sheet_size[0]
     sheet_y = sheet_size[1]
-    SvgToolkit.createSvgFile(file_path)
-    SvgToolkit.startSvg(file_path, sheet_x, sheet_y)
+    SvgToolkit.createSvgFile(template_path)
+    SvgToolkit.startSvg(template_path, sheet_x, sheet_y)
     if frame:
         insertGroups(
             format,
@@ -235,17 +515,134 @@ def createTemplate(
             tilt,
             title_block,
             ink,
-            bom_rows
+            bom_rows,
+            template_path,
+            locale
             )
-    SvgToolkit.endSvg(file_path)
+    SvgToolkit.endSvg(template_path)
+    if merged_symbol:
+        mergeSymbol(template_path, sheet_size, TITLE_BLOCKS[merged_symbol])
+    if text_to_path:
+        TemplaterGlyphs.convertTextsToPaths(template_path)
     return
 
+def writeHead(template_path, sheet_x, sheet_y):
+    """Writes the xml declaration and the opening svg tag"""
+    SvgToolkit.createSvgFile(template_path)
+    SvgToolkit.startSvg(template_path, sheet_x, sheet_y)
+
+def renderFragment(writer, arguments):
+    """
+    Returns the svg code a writing method appends to a file, the code is
+    remembered for the same method and arguments
+    """
+    key = (writer.__module__, writer.__name__, repr(arguments))
+    with preview_fragments_lock:
+        fragment = preview_fragments.get(key)
+        if fragment is not None:
+            preview_fragments.move_to_end(key)
+            return fragment
+    #- The writing methods append to files, each call gets its own
+    work_dir = tempfile.mkdtemp(prefix = "Templater")
+    fragment_path = os.path.join(work_dir, "fragment.svg")
+    try:
+        open(fragment_path, "w", encoding = "utf-8").close()
+        writer(fragment_path, *arguments)
+        f = open(fragment_path, "r", encoding = "utf-8")
+        fragment = f.read()
+        f.close()
+    finally:
+        if os.path.exists(fragment_path):
+            os.remove(fragment_path)
+        os.rmdir(work_dir)
+    with preview_fragments_lock:
+        preview_fragments[key] = fragment
+        while len(preview_fragments) > PREVIEW_FRAGMENTS_SIZE:
+            preview_fragments.popitem(last = False)
+    return fragment
+
+def previewSvg(options):
+    """
+    Returns the svg code of a template with the options, assembled from
+    remembered fragments, so a changed option only renders the fragments
+    it affects. A merged symbol and texts converted to paths are left out.
+    """
+    complete = dict(DEFAULT_OPTIONS)
+    complete.update(options)
+    sheet_size = SvgToolkit.sheetDimensions(complete["format"])
+    fragments = [renderFragment(writeHead, (sheet_size[0], sheet_size[1]))]
+    if complete["frame"]:
+        for writer, arguments in groupWriters(
+            complete["format"],
+            sheet_size,
+            complete["indices"],
+            complete["tilt"],
+            complete["title_block"],
+            complete["ink"],
+            int(complete["bom_rows"]),
+            complete["locale"]
+            ):
+            fragments.append(renderFragment(writer, arguments))
+    fragments.append(SvgToolkit.levelOfIndentation(0) + "</svg>")
+    return "".join(fragments)
+
+def templateFileName(options, locale = None):
+    """
+    Returns a file name that tells the template options apart,
+    e.g. ISO_A3_indices_tilted_titleblock_de.svg
+    """
+    name = options["format"].replace(" ", "_")
+    if not options["frame"]:
+        name += "_blank"
+    else:
+        if options["indices"]:
+            name += "_indices"
+            if options["tilt"]:
+                name += "_tilted"
+        if options["title_block"]:
+            name += "_titleblock"
+            if options["ink"] != "#000":
+                name += "_ink"
+            if int(options["bom_rows"]) > 0:
+                name += "_bom" + str(int(options["bom_rows"]))
+    if options.get("merged_symbol"):
+        name += "_" + options["merged_symbol"]
+    if options.get("text_to_path"):
+        name += "_paths"
+    if locale:
+        name += "_" + locale
+    return name + ".svg"
+
+def createTemplateSet(output_dir, locales, option_sets):
+    """
+    Renders the same set of templates once per locale into output_dir.
+    Each locale's translation table is resolved once up front and
+    reused for every template of the set.
+    Returns the paths of the written files.
+    """
+    written = []
+    for locale in locales:
+        TemplaterTranslations.translationTable(locale)
+    for locale in locales:
+        for option_set in option_sets:
+            options = dict(DEFAULT_OPTIONS)
+            options.update(option_set)
+            options["locale"] = locale
+            template_path = os.path.join(
+                output_dir, templateFileName(options, locale)
+                )
+            createTemplate(template_path = template_path, **options)
+            written.append(template_path)
+    return written
+
 ##########################################################################################################
 # Gui code
 ##########################################################################################################
 
 if SvgToolkit.isGuiLoaded():
     from FreeCAD import Gui
+    import TemplaterPreviews
+    import TemplaterTemplatePack
 
     ##########################################################################################################
     # View Provider
@@ -255,485 +652,684 @@ if SvgToolkit.isGuiLoaded():
     # Task Panel
     ##########################################################################################################
 
-class TemplateTaskPanel():
-    """
-    Creates a task panel to select template options.
-    """
-    def __init__(self):
-        self.initUI()
-
-    def initUI(self):
-        """Sets some default values and places the widgets"""
-
-        self.setWindowTexts()
-
-        #- Add a Box container to group widgets
-        self.groupBox = QGroupBox(self.text_panel)
-        #- Add a grid to order widgets
-        self.grid = QGridLayout() # instantiates a QGridLayout
-        self.groupBox.setLayout(self.grid) # puts the grid inside the groupBox
-        #- Add some labels to the grid
-        self.label_format = QLabel(self.text_format)
-        self.grid.addWidget(self.label_format, 0, 0)
-        self.label_frame = QLabel(self.text_frame)
-        self.grid.addWidget(self.label_frame, 1, 0)
-        self.label_indices = QLabel(self.text_indices)
-        self.grid.addWidget(self.label_indices, 2, 0)
-        self.label_tilt = QLabel(self.text_tilt)
-        self.grid.addWidget(self.label_tilt, 3, 0)
-        self.label_title_block = QLabel(self.text_title_block)
-        self.grid.addWidget(self.label_title_block, 4, 0)
-        self.label_ink = QLabel(self.text_ink)
-        self.grid.addWidget(self.label_ink, 5, 0)
-        self.label_BOM_rows = QLabel(self.text_bom)
-        self.grid.addWidget(self.label_BOM_rows, 6, 0)
-        self.label_page = QLabel(self.text_page)
-        self.grid.addWidget(self.label_page, 7, 0)
-        self.label_symbol = QLabel(self.text_symbol)
-        self.label_symbol.hide()
-        self.grid.addWidget(self.label_symbol, 8, 0)
-
-        self.label_warning = QLabel(self.text_warning)
-        self.grid.addWidget(self.label_warning, 20, 0, 1, -1)
-
-        #- Create some result containers and set default values
-        self.result_button = "BM_1_min"
-        self.result_format = "ISO A4"
-        self.result_ink = "#000"
-
-        # Add some input widgets
-
-        #- Set up a ComboBox - Format
-        self.coBox_format = QComboBox()
-        format_list = ("ISO A0","ISO A1","ISO A2","ISO A3","ISO A4",\
-            "ISO A4-","ANSI A","ANSI B","ANSI C","ANSI D","ANSI E",\
-            "Arch A","Arch B","Arch C","Arch D","Arch E","Arch E1"
-            )
-        self.coBox_format.setToolTip(self.tooltip_format)
-        self.coBox_format.addItems(format_list)
-        self.coBox_format.setCurrentIndex(format_list.index("ISO A4"))
-        self.coBox_format.currentTextChanged.connect(self.onCoBoxFormat)
-        self.grid.addWidget(self.coBox_format, 0, 1)
-
-        #- Set up a CheckBox - Frame
-        self.checkBox_frame = QCheckBox(self.label_cb_frame)
-        self.checkBox_frame.setToolTip(self.tooltip_frame)
-        self.checkBox_frame.setChecked(True)
-        self.checkBox_frame.stateChanged.connect(
-            self.on_checkbox_frame_changed
-            )
-        self.grid.addWidget(self.checkBox_frame, 1, 1)
-
-        #- Set up a CheckBox - Indices
-        self.checkBox_indices = QCheckBox(self.label_cb_indices)
-        self.checkBox_indices.setToolTip(self.tooltip_indices)
-        self.checkBox_indices.setChecked(True)
-        self.checkBox_indices.stateChanged.connect(
-            self.on_checkbox_indices_changed
-            )
-        self.grid.addWidget(self.checkBox_indices, 2, 1)
-
-        #- Set up a CheckBox - Tilt indices
-        self.checkBox_tilt = QCheckBox(self.label_cb_tilt)
-        self.checkBox_tilt.setToolTip(self.tooltip_tilt)
-        self.checkBox_tilt.setChecked(True)
-        self.checkBox_tilt.stateChanged.connect(
-            self.on_checkbox_tilt_changed
-            )
-        self.grid.addWidget(self.checkBox_tilt, 3, 1)
-
-        #- Set up a CheckBox - TitleBlock
-        self.checkBox_title_block = QCheckBox(self.label_cb_title_block)
-        self.checkBox_title_block.setToolTip(self.tooltip_title_block)
-        self.checkBox_title_block.setChecked(True)
-        self.checkBox_title_block.stateChanged.connect(
-            self.on_checkbox_title_block_changed
-            )
-        self.grid.addWidget(self.checkBox_title_block, 4, 1)
-
-        #- Set up a CheckBox - Ink
-        self.checkBox_ink = QCheckBox(self.label_cb_ink)
-        self.checkBox_ink.setToolTip(self.tooltip_ink)
-        self.checkBox_ink.setChecked(False)
-        self.checkBox_ink.stateChanged.connect(self.on_checkbox_ink_changed)
-        self.grid.addWidget(self.checkBox_ink, 5, 1)
-
-        #- Set up a DoubleSpinBox - Number of BOM rows
-        self.dsBox_BOM_rows = QDoubleSpinBox()
-        self.dsBox_BOM_rows.setToolTip(self.tooltip_bom)
-        self.dsBox_BOM_rows.setMinimum(0)
-        self.dsBox_BOM_rows.setMaximum(34) # default value for ISO A4
-        self.dsBox_BOM_rows.setDecimals(0) # no decimals
-        self.dsBox_BOM_rows.setValue(0)    # no BOM as default
-        self.grid.addWidget(self.dsBox_BOM_rows, 6, 1)
-        # Set contextual menu options for the DoubleSpinBox
-        #- Reset text field to default value (0)
-        self.BOM_action1 = QAction()
-        self.BOM_action1.setText(self.text_none)
-        self.BOM_action1.triggered.connect(self.onBOMAction1)
-        #- Set text field to maximum value
-        self.BOM_action2 = QAction()
-        self.BOM_action2.setText(self.text_maximum)
-        self.BOM_action2.triggered.connect(self.onBOMAction2)
-        #- Define RMB-menu and add options
-        self.dsBox_BOM_rows.setContextMenuPolicy(QtCore.Qt.ActionsContextMenu)
-        self.dsBox_BOM_rows.addAction(self.BOM_action1)
-        self.dsBox_BOM_rows.addAction(self.BOM_action2)
-
-        #- Set up a CheckBox - Page
-        self.checkBox_page = QCheckBox(self.label_cb_page)
-        self.checkBox_page.setToolTip(self.tooltip_page)
-        self.checkBox_page.setChecked(True)
-        self.checkBox_page.stateChanged.connect(self.on_checkbox_page_changed)
-        self.grid.addWidget(self.checkBox_page, 7, 1)
-
-        #- Set up a CheckBox - Symbol
-        self.checkBox_symbol = QCheckBox(self.label_cb_symbol)
-        self.checkBox_symbol.setToolTip(self.tooltip_symbol)
-        self.checkBox_symbol.setChecked(False)
-        self.checkBox_symbol.hide()
-        self.checkBox_symbol.stateChanged.connect(self.on_checkbox_symbol_changed)
-        self.grid.addWidget(self.checkBox_symbol, 8, 1)
-
-        #- Set up radio buttons - Title blocks
-        self.radio_button_BM_1 = QRadioButton("BM_1_min")
-        self.radio_button_BM_1.setToolTip(self.tool_tip_buttons)
-        self.radio_button_BM_1.setChecked(True)
-        self.radio_button_BM_1.hide()
-        self.radio_button_BM_1.toggled.connect(
-            self.on_radio_button_toggled
-            )
-        self.grid.addWidget(self.radio_button_BM_1, 9, 0)
-
-        self.radio_button_BM_2 = QRadioButton("BM_2")
-        self.radio_button_BM_2.setToolTip(self.tool_tip_buttons)
-        self.radio_button_BM_2.setChecked(False)
-        self.radio_button_BM_2.hide()
-        self.radio_button_BM_2.toggled.connect(
-            self.on_radio_button_toggled
-            )
-        self.grid.addWidget(self.radio_button_BM_2, 10, 0)
-
-        self.radio_button_BM_3 = QRadioButton("BM_3_adv")
-        self.radio_button_BM_3.setToolTip(self.tool_tip_buttons)
-        self.radio_button_BM_3.setChecked(False)
-        self.radio_button_BM_3.hide()
-        self.radio_button_BM_3.toggled.connect(
-            self.on_radio_button_toggled
-            )
-        self.grid.addWidget(self.radio_button_BM_3, 11, 0)
-
-        self.radio_button_BM_4 = QRadioButton("BM_4")
-        self.radio_button_BM_4.setToolTip(self.tool_tip_buttons)
-        self.radio_button_BM_4.setChecked(False)
-        self.radio_button_BM_4.hide()
-        self.radio_button_BM_4.toggled.connect(
-            self.on_radio_button_toggled
-            )
-        self.grid.addWidget(self.radio_button_BM_4, 12, 0)
-
-        self.radio_button_BM_5 = QRadioButton("BM_5_max")
-        self.radio_button_BM_5.setToolTip(self.tool_tip_buttons)
-        self.radio_button_BM_5.setChecked(False)
-        self.radio_button_BM_5.hide()
-        self.radio_button_BM_5.toggled.connect(
-            self.on_radio_button_toggled
-            )
-        self.grid.addWidget(self.radio_button_BM_5, 13, 0)
-
-        # Group the buttons
-        self.group = QButtonGroup()
-        self.group.addButton(self.radio_button_BM_1)
-        self.group.addButton(self.radio_button_BM_2)
-        self.group.addButton(self.radio_button_BM_3)
-        self.group.addButton(self.radio_button_BM_4)
-        self.group.addButton(self.radio_button_BM_5)
-
-        self.label_image = QLabel()
-        self.image_path = TITLE_BLOCKS["BM_1_min"]
-        image = QPixmap(self.image_path)
-        # only geometry within the ViewBox will be shown in a QPixmap
-        self.label_image.setPixmap(image)
-        self.label_image.setScaledContents(True) #(False)
-        self.label_image.setFixedSize(400, 75)
-        self.label_image.hide()
-        self.Symbol_size = (180, 36)
-        self.grid.addWidget(self.label_image, 19, 0, 1, -1)
-
-        # Show the QGroupBox
-        self.form = self.groupBox
-
-    def setWindowTexts(self):
-
-        self.text_panel       = translate("Templater", "Template settings")
-        self.text_format      = translate("Templater",
-            "Select the desired \n"
-            "sheet format",
-            )
-        self.text_frame       = translate("Templater",
-            "Does the drawing need a Frame?",
-            )
-        self.text_indices     = translate("Templater",
-            "Does the frame require zone indices?",
-            )
-        self.text_tilt        = translate("Templater",
-            "Should the upper and right indices be tilted?",
-            )
-        self.text_title_block = translate("Templater",
-            "Should the template integrate a title block?"
-            )
-        self.text_ink         = translate("Templater",
-            "Do text entries require a different color?"
-            )
-        self.text_bom         = translate("Templater",
-            "Enter the number of rows if the template \n"
-            "requires a bill of material?"
-            )
-        self.text_page        = translate("Templater",
-            "Should the created template be inserted in \n"
-            "the active document to add a new page?"
-            )
-        self.text_symbol      = translate("Templater",
-            "Should a symbol containing a title block \n"
-            "be added to the new page?"
-            )
-        self.text_warning     = translate("Templater",
-            "Don't forget to save, close and reopen the file \n"
-            "before insering another template!"
-            )
-        self.tooltip_format   = translate("Templater",
-            "Selects a sheet format for the new page and\n"
-            "resets the number of BOM rows to 0, if changed"
-            )
-        self.label_cb_frame   = translate("Templater","Draw a Frame")
-        self.tooltip_frame    = translate("Templater",
-            "Adds a frame to the new page"
-            )
-        self.label_cb_indices = translate("Templater","Place zone indices")
-        self.tooltip_indices  = translate("Templater",
-            "Adds zone indices and separators to the frame"
-            )
-        self.label_cb_tilt    = translate("Templater","Tilt indices 90° ccw")
-        self.tooltip_tilt     = translate("Templater",
-            "Tilts upper and right indices to be readable from the right"
-            )
-        self.label_cb_title_block = translate("Templater","Add a title block")
-        self.tooltip_title_block  = translate("Templater",
-            "Adds a titleblock with some editable texts to the new page"
-            )
-        self.label_cb_ink     = translate("Templater","Change to ink-blue")
-        self.tooltip_ink      = translate("Templater",
-            "Colors editable texts in ink-blue"
-            )
-        self.tooltip_bom      = translate("Templater",
-            "Enter the number \n"
-            "of BOM rows or use \n"
-            "right mouse buton \n"
-            "to select \"None\" or \n\"Maximum\""
-            )
-        self.text_none        = translate("Templater", "None")
-        self.text_default     = translate("Templater", "Standard (2)")
-        self.text_maximum     = translate("Templater", "Maximum")
-        self.label_cb_page    = translate("Templater","Insert template")
-        self.tooltip_page     = translate("Templater",
-            "Inserts the saved template into the active document \n"
-            "to create a new page"
-            )
-        self.label_cb_symbol  = translate("Templater",
-            "Insert title block symbol"
-            )
-        self.tooltip_symbol   = translate("Templater",
-            "Inserts a title block as a symbols into the new page"
-            )
-        self.tool_tip_buttons = translate("Templater",
-            "Selects a template coded after one of Benjamin May's proposals"
-            )
-        self.text_cancel      = translate("Templater", "Cancel")
-        self.text_ok          = translate("Templater", "OK")
-
-    def onBOMAction1(self):
-        # Resets the number of BOM rows to 0
-        self.dsBox_BOM_rows.setValue(0)
-
-    def onBOMAction2(self):
-        # Sets the number of BOM rows to maximum
-        self.dsBox_BOM_rows.setValue(self.dsBox_BOM_rows.maximum())
-
-    def onCoBoxFormat(self, selected_text):
-        # Sets the format result and the number of BOM rows
-        self.result_format = selected_text
-        format_dict = {"ISO A0":125, "ISO A1":83, "ISO A2":54,
-            "ISO A3":34, "ISO A4":34, "ISO A4-":18, "ANSI A":31,
-            "ANSI B":31, "ANSI C":56, "ANSI D":78, "ANSI E":128,
-            "Arch A":35, "Arch B":35, "Arch C":61, "Arch D":86,
-            "Arch E":137, "Arch E1":111}
-        max_row = format_dict[selected_text]
-        self.dsBox_BOM_rows.setMaximum(max_row) # max. value for selected format
-        self.dsBox_BOM_rows.setValue(0)         # reset default value
-
-    def on_checkbox_frame_changed(self, value):
-        """Hides following options if no frame is needed (empty page)"""
-        if value:
-            self.label_indices.show()
-            self.checkBox_indices.show()
-            self.label_tilt.show()
-            self.checkBox_tilt.show()
-            self.label_title_block.show()
-            self.checkBox_title_block.show()
-            self.label_ink.show()
-            self.checkBox_ink.show()
-            self.label_BOM_rows.show()
-            self.dsBox_BOM_rows.show()
-            self.label_page.show()
-            self.checkBox_page.show()
-            self.result_frame = True
-        else:
-            self.label_indices.hide()
-            self.checkBox_indices.hide()
-            self.label_tilt.hide()
-            self.checkBox_tilt.hide()
-            self.label_title_block.hide()
-            self.checkBox_title_block.hide()
-            self.label_ink.hide()
-            self.checkBox_ink.hide()
-            self.label_BOM_rows.hide()
-            self.dsBox_BOM_rows.hide()
-            self.label_page.hide()
-            self.checkBox_page.hide()
-            self.result_ink = False
-
-    def on_checkbox_indices_changed(self, value):
-        """Hides the tilt option if no zone indices are needed"""
-        if value:
-            self.label_tilt.show()
-            self.checkBox_tilt.show()
-            self.result_indices = True
-        else:
-            self.label_tilt.hide()
-            self.checkBox_tilt.hide()
-            self.result_indices = False
-
-    def on_checkbox_tilt_changed(self, value):
-        """Toggles the tilt value"""
-        if value:
-            self.result_tilt = True
-        else:
-            self.result_tilt = False
-
-    def on_checkbox_title_block_changed(self, value):
-        """Hides ink and BOM options if no title block will be integrated"""
-        if value:
-            self.label_ink.show()
-            self.checkBox_ink.show()
-            self.label_BOM_rows.show()
-            self.dsBox_BOM_rows.show()
+    class TemplateTaskPanel():
+        """
+        Creates a task panel to select template options.
+        With replace_page the options of the page's template are shown
+        and OK replaces that template instead of adding a page.
+        """
+        def __init__(self, replace_page = None):
+            self.replace_page = replace_page
+            self.initUI()
+            if replace_page is not None:
+                self.setReplaceMode(replace_page)
+
+        def initUI(self):
+            """Sets some default values and places the widgets"""
+
+            self.setWindowTexts()
+
+            #- Add a Box container to group widgets
+            self.groupBox = QGroupBox(self.text_panel)
+            #- Add a grid to order widgets
+            self.grid = QGridLayout() # instantiates a QGridLayout
+            self.groupBox.setLayout(self.grid) # puts the grid inside the groupBox
+            #- Add some labels to the grid
+            self.label_format = QLabel(self.text_format)
+            self.grid.addWidget(self.label_format, 0, 0)
+            self.label_frame = QLabel(self.text_frame)
+            self.grid.addWidget(self.label_frame, 1, 0)
+            self.label_indices = QLabel(self.text_indices)
+            self.grid.addWidget(self.label_indices, 2, 0)
+            self.label_tilt = QLabel(self.text_tilt)
+            self.grid.addWidget(self.label_tilt, 3, 0)
+            self.label_title_block = QLabel(self.text_title_block)
+            self.grid.addWidget(self.label_title_block, 4, 0)
+            self.label_ink = QLabel(self.text_ink)
+            self.grid.addWidget(self.label_ink, 5, 0)
+            self.label_BOM_rows = QLabel(self.text_bom)
+            self.grid.addWidget(self.label_BOM_rows, 6, 0)
+            self.label_page = QLabel(self.text_page)
+            self.grid.addWidget(self.label_page, 7, 0)
+            self.label_symbol = QLabel(self.text_symbol)
             self.label_symbol.hide()
-            self.checkBox_symbol.hide()
-            self.checkBox_symbol.setChecked(False)
-            self.radio_button_BM_1.hide()
-            self.radio_button_BM_2.hide()
-            self.radio_button_BM_3.hide()
-            self.radio_button_BM_4.hide()
-            self.radio_button_BM_5.hide()
-            self.label_image.hide()
-            self.result_title_block = True
-        else:
-            self.label_ink.hide()
-            self.checkBox_ink.hide()
-            self.label_BOM_rows.hide()
-            self.dsBox_BOM_rows.hide()
-            self.label_symbol.show()
-            self.checkBox_symbol.show()
-            self.result_title_block = False
-
-    def on_checkbox_ink_changed(self, value):
-        """Toggles the color of the editable text entries"""
-        if value:
-            self.result_ink = "#00d"
-        else:
+            self.grid.addWidget(self.label_symbol, 8, 0)
+            self.label_text_to_path = QLabel(self.text_text_to_path)
+            self.grid.addWidget(self.label_text_to_path, 14, 0)
+            self.label_sheets = QLabel(self.text_sheets)
+            self.grid.addWidget(self.label_sheets, 15, 0)
+            self.label_recommendation = QLabel()
+            self.label_recommendation.hide()
+            self.grid.addWidget(self.label_recommendation, 16, 0, 1, -1)
+
+            self.label_warning = QLabel(self.text_warning)
+            self.grid.addWidget(self.label_warning, 20, 0, 1, -1)
+
+            #- Live preview of the whole sheet
+            self.label_sheet_preview = QLabel()
+            self.label_sheet_preview.setToolTip(self.tooltip_sheet_preview)
+            self.grid.addWidget(self.label_sheet_preview, 21, 0, 1, -1)
+
+            #- Create some result containers and set default values
+            self.result_button = "BM_1_min"
+            self.result_format = "ISO A4"
             self.result_ink = "#000"
 
-    def on_checkbox_page_changed(self, value):
-        """Toggles if the created temlate will be inserted to create a page"""
-        if value:
-            self.result_page = True
-        else:
-            self.result_page = False
-
-    def on_checkbox_symbol_changed(self, value):
-        """Toggles if a symbol will be inserted into the created page"""
-        if value:
-            self.radio_button_BM_1.show()
-            self.radio_button_BM_2.show()
-            self.radio_button_BM_3.show()
-            self.radio_button_BM_4.show()
-            self.radio_button_BM_5.show()
-            self.label_image.show()
-            self.result_symbol = True
-        else:
+            # Add some input widgets
+
+            #- Set up a ComboBox - Format
+            self.coBox_format = QComboBox()
+            format_list = ("ISO A0","ISO A1","ISO A2","ISO A3","ISO A4",\
+                "ISO A4-","ANSI A","ANSI B","ANSI C","ANSI D","ANSI E",\
+                "Arch A","Arch B","Arch C","Arch D","Arch E","Arch E1"
+                )
+            self.coBox_format.setToolTip(self.tooltip_format)
+            self.coBox_format.addItems(format_list)
+            self.coBox_format.setCurrentIndex(format_list.index("ISO A4"))
+            self.coBox_format.currentTextChanged.connect(self.onCoBoxFormat)
+            self.grid.addWidget(self.coBox_format, 0, 1)
+
+            #- Set up a CheckBox - Frame
+            self.checkBox_frame = QCheckBox(self.label_cb_frame)
+            self.checkBox_frame.setToolTip(self.tooltip_frame)
+            self.checkBox_frame.setChecked(True)
+            self.checkBox_frame.stateChanged.connect(
+                self.on_checkbox_frame_changed
+                )
+            self.grid.addWidget(self.checkBox_frame, 1, 1)
+
+            #- Set up a CheckBox - Indices
+            self.checkBox_indices = QCheckBox(self.label_cb_indices)
+            self.checkBox_indices.setToolTip(self.tooltip_indices)
+            self.checkBox_indices.setChecked(True)
+            self.checkBox_indices.stateChanged.connect(
+                self.on_checkbox_indices_changed
+                )
+            self.grid.addWidget(self.checkBox_indices, 2, 1)
+
+            #- Set up a CheckBox - Tilt indices
+            self.checkBox_tilt = QCheckBox(self.label_cb_tilt)
+            self.checkBox_tilt.setToolTip(self.tooltip_tilt)
+            self.checkBox_tilt.setChecked(True)
+            self.checkBox_tilt.stateChanged.connect(
+                self.on_checkbox_tilt_changed
+                )
+            self.grid.addWidget(self.checkBox_tilt, 3, 1)
+
+            #- Set up a CheckBox - TitleBlock
+            self.checkBox_title_block = QCheckBox(self.label_cb_title_block)
+            self.checkBox_title_block.setToolTip(self.tooltip_title_block)
+            self.checkBox_title_block.setChecked(True)
+            self.checkBox_title_block.stateChanged.connect(
+                self.on_checkbox_title_block_changed
+                )
+            self.grid.addWidget(self.checkBox_title_block, 4, 1)
+
+            #- Set up a CheckBox - Ink
+            self.checkBox_ink = QCheckBox(self.label_cb_ink)
+            self.checkBox_ink.setToolTip(self.tooltip_ink)
+            self.checkBox_ink.setChecked(False)
+            self.checkBox_ink.stateChanged.connect(self.on_checkbox_ink_changed)
+            self.grid.addWidget(self.checkBox_ink, 5, 1)
+
+            #- Set up a DoubleSpinBox - Number of BOM rows
+            self.dsBox_BOM_rows = QDoubleSpinBox()
+            self.dsBox_BOM_rows.setToolTip(self.tooltip_bom)
+            self.dsBox_BOM_rows.setMinimum(0)
+            self.dsBox_BOM_rows.setMaximum(34) # default value for ISO A4
+            self.dsBox_BOM_rows.setDecimals(0) # no decimals
+            self.dsBox_BOM_rows.setValue(0)    # no BOM as default
+            self.grid.addWidget(self.dsBox_BOM_rows, 6, 1)
+            # Set contextual menu options for the DoubleSpinBox
+            #- Reset text field to default value (0)
+            self.BOM_action1 = QAction()
+            self.BOM_action1.setText(self.text_none)
+            self.BOM_action1.triggered.connect(self.onBOMAction1)
+            #- Set text field to maximum value
+            self.BOM_action2 = QAction()
+            self.BOM_action2.setText(self.text_maximum)
+            self.BOM_action2.triggered.connect(self.onBOMAction2)
+            #- Define RMB-menu and add options
+            self.dsBox_BOM_rows.setContextMenuPolicy(QtCore.Qt.ActionsContextMenu)
+            self.dsBox_BOM_rows.addAction(self.BOM_action1)
+            self.dsBox_BOM_rows.addAction(self.BOM_action2)
+
+            #- Set up a CheckBox - Page
+            self.checkBox_page = QCheckBox(self.label_cb_page)
+            self.checkBox_page.setToolTip(self.tooltip_page)
+            self.checkBox_page.setChecked(True)
+            self.checkBox_page.stateChanged.connect(self.on_checkbox_page_changed)
+            self.grid.addWidget(self.checkBox_page, 7, 1)
+
+            #- Set up a CheckBox - Symbol
+            self.checkBox_symbol = QCheckBox(self.label_cb_symbol)
+            self.checkBox_symbol.setToolTip(self.tooltip_symbol)
+            self.checkBox_symbol.setChecked(False)
+            self.checkBox_symbol.hide()
+            self.checkBox_symbol.stateChanged.connect(self.on_checkbox_symbol_changed)
+            self.grid.addWidget(self.checkBox_symbol, 8, 1)
+
+            #- Set up radio buttons - Title blocks
+            self.radio_button_BM_1 = QRadioButton("BM_1_min")
+            self.radio_button_BM_1.setToolTip(self.tool_tip_buttons)
+            self.radio_button_BM_1.setChecked(True)
             self.radio_button_BM_1.hide()
+            self.radio_button_BM_1.toggled.connect(
+                self.on_radio_button_toggled
+                )
+            self.grid.addWidget(self.radio_button_BM_1, 9, 0)
+
+            #- Set up a CheckBox - Merge the symbol into the template
+            self.checkBox_merge_symbol = QCheckBox(self.label_cb_merge_symbol)
+            self.checkBox_merge_symbol.setToolTip(self.tooltip_merge_symbol)
+            self.checkBox_merge_symbol.setChecked(False)
+            self.checkBox_merge_symbol.hide()
+            self.grid.addWidget(self.checkBox_merge_symbol, 9, 1)
+
+            self.radio_button_BM_2 = QRadioButton("BM_2")
+            self.radio_button_BM_2.setToolTip(self.tool_tip_buttons)
+            self.radio_button_BM_2.setChecked(False)
             self.radio_button_BM_2.hide()
+            self.radio_button_BM_2.toggled.connect(
+                self.on_radio_button_toggled
+                )
+            self.grid.addWidget(self.radio_button_BM_2, 10, 0)
+
+            self.radio_button_BM_3 = QRadioButton("BM_3_adv")
+            self.radio_button_BM_3.setToolTip(self.tool_tip_buttons)
+            self.radio_button_BM_3.setChecked(False)
             self.radio_button_BM_3.hide()
+            self.radio_button_BM_3.toggled.connect(
+                self.on_radio_button_toggled
+                )
+            self.grid.addWidget(self.radio_button_BM_3, 11, 0)
+
+            self.radio_button_BM_4 = QRadioButton("BM_4")
+            self.radio_button_BM_4.setToolTip(self.tool_tip_buttons)
+            self.radio_button_BM_4.setChecked(False)
             self.radio_button_BM_4.hide()
+            self.radio_button_BM_4.toggled.connect(
+                self.on_radio_button_toggled
+                )
+            self.grid.addWidget(self.radio_button_BM_4, 12, 0)
+
+            self.radio_button_BM_5 = QRadioButton("BM_5_max")
+            self.radio_button_BM_5.setToolTip(self.tool_tip_buttons)
+            self.radio_button_BM_5.setChecked(False)
             self.radio_button_BM_5.hide()
+            self.radio_button_BM_5.toggled.connect(
+                self.on_radio_button_toggled
+                )
+            self.grid.addWidget(self.radio_button_BM_5, 13, 0)
+
+            #- Set up a CheckBox - Texts to paths
+            self.checkBox_text_to_path = QCheckBox(self.label_cb_text_to_path)
+            self.checkBox_text_to_path.setToolTip(self.tooltip_text_to_path)
+            self.checkBox_text_to_path.setChecked(False)
+            self.grid.addWidget(self.checkBox_text_to_path, 14, 1)
+
+            #- Set up a DoubleSpinBox - Number of sheets
+            self.dsBox_sheets = QDoubleSpinBox()
+            self.dsBox_sheets.setToolTip(self.tooltip_sheets)
+            self.dsBox_sheets.setMinimum(1)
+            self.dsBox_sheets.setMaximum(999)
+            self.dsBox_sheets.setDecimals(0) # no decimals
+            self.dsBox_sheets.setValue(1)    # a single page as default
+            self.grid.addWidget(self.dsBox_sheets, 15, 1)
+
+            # Group the buttons
+            self.group = QButtonGroup()
+            self.group.addButton(self.radio_button_BM_1)
+            self.group.addButton(self.radio_button_BM_2)
+            self.group.addButton(self.radio_button_BM_3)
+            self.group.addButton(self.radio_button_BM_4)
+            self.group.addButton(self.radio_button_BM_5)
+
+            self.label_image = QLabel()
+            self.label_image.setScaledContents(True) #(False)
             self.label_image.hide()
-            self.result_symbol = False
-
-    def on_radio_button_toggled(self):
-        """Selects the title block symbol to be inserted"""
-        # get the radio button that sent the signal
-        for button in self.group.buttons():
-            if button.isChecked():
-                self.image_path = TITLE_BLOCKS[button.text()]
-                image = QPixmap(self.image_path)
-                self.label_image.setPixmap(image)
-                self.result_button = button.text()
-                if button.text().startswith("BM_1"):
-                    self.label_image.setFixedSize(400, 75)
-                    self.Symbol_size = (180, 36)
-                elif button.text().startswith("BM_2"):
-                    self.label_image.setFixedSize(400, 75)
-                    self.Symbol_size = (180, 36)
-                elif button.text().startswith("BM_5"):
-                    self.label_image.setFixedSize(400, 125)
-                    self.Symbol_size = (180, 60)
-                else:
-                    self.label_image.setFixedSize(400, 100)
-                    self.Symbol_size = (180, 48)
-            #print( button.text())
-        return
+            self.grid.addWidget(self.label_image, 19, 0, 1, -1)
+            #- All previews are rendered in the background, once a session
+            self.preview_keys = {}
+            for key, symbol_path in TITLE_BLOCKS.items():
+                self.preview_keys[key] = TemplaterPreviews.previewKey(symbol_path)
+            self.preview_loader = TemplaterPreviews.PreviewLoader()
+            self.preview_loader.finished.connect(self.showPreview)
+            self.selectSymbol("BM_1_min")
+            self.preview_loader.load(list(self.preview_keys.values()))
+
+            #- Every option of the sheet updates the live preview
+            self.sheet_preview = TemplaterPreviews.SheetPreview(
+                previewSvg, self.label_sheet_preview
+                )
+            self.coBox_format.currentTextChanged.connect(self.updatePreview)
+            for check_box in (self.checkBox_frame, self.checkBox_indices,
+                self.checkBox_tilt, self.checkBox_title_block, self.checkBox_ink
+                ):
+                check_box.stateChanged.connect(self.updatePreview)
+            self.dsBox_BOM_rows.valueChanged.connect(self.updatePreview)
+            self.updatePreview()
+
+            # Show the QGroupBox
+            self.form = self.groupBox
+
+        def setReplaceMode(self, page):
+            """Shows the stored options of the page's template"""
+            self.groupBox.setTitle(self.text_panel_replace)
+            options = storedOptions(page.Template) or dict(DEFAULT_OPTIONS)
+            #- The format resets the BOM rows, so it is set first
+            self.coBox_format.setCurrentText(options["format"])
+            self.checkBox_frame.setChecked(bool(options["frame"]))
+            self.checkBox_indices.setChecked(bool(options["indices"]))
+            self.checkBox_tilt.setChecked(bool(options["tilt"]))
+            self.checkBox_title_block.setChecked(bool(options["title_block"]))
+            self.checkBox_ink.setChecked(options["ink"] != "#000")
+            self.dsBox_BOM_rows.setValue(int(options["bom_rows"]))
+            self.checkBox_text_to_path.setChecked(bool(options["text_to_path"]))
+            #- A merged title block symbol is kept as it is
+            self.stored_merged_symbol = options["merged_symbol"]
+            #- A replacement adds neither pages nor symbols
+            for widget in (self.label_page, self.checkBox_page,
+                self.label_sheets, self.dsBox_sheets, self.label_symbol,
+                self.checkBox_symbol, self.label_warning
+                ):
+                widget.hide()
+            self.checkBox_symbol.setChecked(False)
+            self.checkBox_title_block.stateChanged.connect(
+                self.hideSymbolOptions
+                )
+            #- The smallest sheet holding the page's views
+            self.page_boxes = TemplaterLayout.viewBoxes(page)
+            self.checkBox_title_block.stateChanged.connect(
+                self.updateRecommendation
+                )
+            self.dsBox_BOM_rows.valueChanged.connect(self.updateRecommendation)
+            self.coBox_format.currentTextChanged.connect(
+                self.updateRecommendation
+                )
+            self.label_recommendation.show()
+            self.updateRecommendation()
+
+        def updateRecommendation(self, value = None):
+            """Shows the smallest sheet for the views of the replaced page"""
+            import TemplaterChangeFormatCmd
+            options = {
+                "format":self.coBox_format.currentText(),
+                "frame":self.checkBox_frame.isChecked(),
+                "title_block":self.checkBox_title_block.isChecked(),
+                "bom_rows":int(self.dsBox_BOM_rows.value())
+                }
+            self.label_recommendation.setText(
+                TemplaterChangeFormatCmd.recommendationText(
+                    TemplaterLayout.contentSize(self.page_boxes), options
+                    )
+                )
 
-    def accept(self):
-        """
-        This is triggered by the panel's OK button.
-        """
-        #- Close the dialog (variables will stay accessible)
-        FreeCADGui.Control.closeDialog()
-        #- Launch template creation and hand over values
-        createTemplate(
-            self.result_format,
-            self.checkBox_frame.isChecked(),
-            self.checkBox_indices.isChecked(),
-            self.checkBox_tilt.isChecked(),
-            self.checkBox_title_block.isChecked(),
-            self.result_ink,
-            self.dsBox_BOM_rows.value()
-            )
-        #- launch the integration of the template into the document
-        if self.checkBox_page.isChecked():
-            format = self.result_format  # For annotation purposes
-            symbol = self.checkBox_symbol.isChecked()
-            symbol_path = self.image_path  # to the selected title block
-            symbol_height = self.Symbol_size[1]
-            insertTemplate(format, symbol, symbol_path, symbol_height)
-        return
+        def hideSymbolOptions(self, value):
+            """Keeps the symbol options hidden in replace mode"""
+            self.label_symbol.hide()
+            self.checkBox_symbol.hide()
+
+        def setWindowTexts(self):
+
+            self.text_panel       = translate("Templater", "Template settings")
+            self.text_panel_replace = translate("Templater",
+                "Replace the template of the page"
+                )
+            self.text_format      = translate("Templater",
+                "Select the desired \n"
+                "sheet format",
+                )
+            self.text_frame       = translate("Templater",
+                "Does the drawing need a Frame?",
+                )
+            self.text_indices     = translate("Templater",
+                "Does the frame require zone indices?",
+                )
+            self.text_tilt        = translate("Templater",
+                "Should the upper and right indices be tilted?",
+                )
+            self.text_title_block = translate("Templater",
+                "Should the template integrate a title block?"
+                )
+            self.text_ink         = translate("Templater",
+                "Do text entries require a different color?"
+                )
+            self.text_bom         = translate("Templater",
+                "Enter the number of rows if the template \n"
+                "requires a bill of material?"
+                )
+            self.text_page        = translate("Templater",
+                "Should the created template be inserted in \n"
+                "the active document to add a new page?"
+                )
+            self.text_symbol      = translate("Templater",
+                "Should a symbol containing a title block \n"
+                "be added to the new page?"
+                )
+            self.text_text_to_path = translate("Templater",
+                "Should fixed texts be independent \n"
+                "of the installed fonts?"
+                )
+            self.text_sheets      = translate("Templater",
+                "How many sheets should be created?"
+                )
+            self.text_warning     = translate("Templater",
+                "Don't forget to save, close and reopen the file \n"
+                "before insering another template!"
+                )
+            self.tooltip_format   = translate("Templater",
+                "Selects a sheet format for the new page and\n"
+                "resets the number of BOM rows to 0, if changed"
+                )
+            self.label_cb_frame   = translate("Templater","Draw a Frame")
+            self.tooltip_frame    = translate("Templater",
+                "Adds a frame to the new page"
+                )
+            self.label_cb_indices = translate("Templater","Place zone indices")
+            self.tooltip_indices  = translate("Templater",
+                "Adds zone indices and separators to the frame"
+                )
+            self.label_cb_tilt    = translate("Templater","Tilt indices 90° ccw")
+            self.tooltip_tilt     = translate("Templater",
+                "Tilts upper and right indices to be readable from the right"
+                )
+            self.label_cb_title_block = translate("Templater","Add a title block")
+            self.tooltip_title_block  = translate("Templater",
+                "Adds a titleblock with some editable texts to the new page"
+                )
+            self.label_cb_ink     = translate("Templater","Change to ink-blue")
+            self.tooltip_ink      = translate("Templater",
+                "Colors editable texts in ink-blue"
+                )
+            self.tooltip_sheet_preview = translate("Templater",
+                "Preview of the sheet with the selected options"
+                )
+            self.tooltip_bom      = translate("Templater",
+                "Enter the number \n"
+                "of BOM rows or use \n"
+                "right mouse buton \n"
+                "to select \"None\" or \n\"Maximum\""
+                )
+            self.text_none        = translate("Templater", "None")
+            self.text_default     = translate("Templater", "Standard (2)")
+            self.text_maximum     = translate("Templater", "Maximum")
+            self.label_cb_page    = translate("Templater","Insert template")
+            self.tooltip_page     = translate("Templater",
+                "Inserts the saved template into the active document \n"
+                "to create a new page"
+                )
+            self.label_cb_symbol  = translate("Templater",
+                "Insert title block symbol"
+                )
+            self.tooltip_symbol   = translate("Templater",
+                "Inserts a title block as a symbols into the new page"
+                )
+            self.label_cb_text_to_path = translate("Templater",
+                "Convert texts to paths"
+                )
+            self.label_cb_merge_symbol = translate("Templater",
+                "Merge into template"
+                )
+            self.tooltip_merge_symbol  = translate("Templater",
+                "Draws the title block as part of the template \n"
+                "instead of adding a symbol to each page"
+                )
+            self.tooltip_text_to_path  = translate("Templater",
+                "Draws non-editable texts as outlines of the osifont"
+                )
+            self.tooltip_sheets   = translate("Templater",
+                "Creates a drawing set of this many pages \n"
+                "with numbered sheets in one step"
+                )
+            self.tool_tip_buttons = translate("Templater",
+                "Selects a template coded after one of Benjamin May's proposals"
+                )
+            self.text_cancel      = translate("Templater", "Cancel")
+            self.text_ok          = translate("Templater", "OK")
+
+        def onBOMAction1(self):
+            # Resets the number of BOM rows to 0
+            self.dsBox_BOM_rows.setValue(0)
+
+        def onBOMAction2(self):
+            # Sets the number of BOM rows to maximum
+            self.dsBox_BOM_rows.setValue(self.dsBox_BOM_rows.maximum())
+
+        def onCoBoxFormat(self, selected_text):
+            # Sets the format result and the number of BOM rows
+            self.result_format = selected_text
+            format_dict = {"ISO A0":125, "ISO A1":83, "ISO A2":54,
+                "ISO A3":34, "ISO A4":34, "ISO A4-":18, "ANSI A":31,
+                "ANSI B":31, "ANSI C":56, "ANSI D":78, "ANSI E":128,
+                "Arch A":35, "Arch B":35, "Arch C":61, "Arch D":86,
+                "Arch E":137, "Arch E1":111}
+            max_row = format_dict[selected_text]
+            self.dsBox_BOM_rows.setMaximum(max_row) # max. value for selected format
+            self.dsBox_BOM_rows.setValue(0)         # reset default value
+
+        def on_checkbox_frame_changed(self, value):
+            """Hides following options if no frame is needed (empty page)"""
+            if value:
+                self.label_indices.show()
+                self.checkBox_indices.show()
+                self.label_tilt.show()
+                self.checkBox_tilt.show()
+                self.label_title_block.show()
+                self.checkBox_title_block.show()
+                self.label_ink.show()
+                self.checkBox_ink.show()
+                self.label_BOM_rows.show()
+                self.dsBox_BOM_rows.show()
+                self.label_page.show()
+                self.checkBox_page.show()
+                self.label_sheets.show()
+                self.dsBox_sheets.show()
+                self.result_frame = True
+            else:
+                self.label_indices.hide()
+                self.checkBox_indices.hide()
+                self.label_tilt.hide()
+                self.checkBox_tilt.hide()
+                self.label_title_block.hide()
+                self.checkBox_title_block.hide()
+                self.label_ink.hide()
+                self.checkBox_ink.hide()
+                self.label_BOM_rows.hide()
+                self.dsBox_BOM_rows.hide()
+                self.label_page.hide()
+                self.checkBox_page.hide()
+                self.label_sheets.hide()
+                self.dsBox_sheets.hide()
+                self.result_ink = False
+
+        def on_checkbox_indices_changed(self, value):
+            """Hides the tilt option if no zone indices are needed"""
+            if value:
+                self.label_tilt.show()
+                self.checkBox_tilt.show()
+                self.result_indices = True
+            else:
+                self.label_tilt.hide()
+                self.checkBox_tilt.hide()
+                self.result_indices = False
+
+        def on_checkbox_tilt_changed(self, value):
+            """Toggles the tilt value"""
+            if value:
+                self.result_tilt = True
+            else:
+                self.result_tilt = False
+
+        def on_checkbox_title_block_changed(self, value):
+            """Hides ink and BOM options if no title block will be integrated"""
+            if value:
+                self.label_ink.show()
+                self.checkBox_ink.show()
+                self.label_BOM_rows.show()
+                self.dsBox_BOM_rows.show()
+                self.label_symbol.hide()
+                self.checkBox_symbol.hide()
+                self.checkBox_symbol.setChecked(False)
+                self.radio_button_BM_1.hide()
+                self.radio_button_BM_2.hide()
+                self.radio_button_BM_3.hide()
+                self.radio_button_BM_4.hide()
+                self.radio_button_BM_5.hide()
+                self.label_image.hide()
+                self.result_title_block = True
+            else:
+                self.label_ink.hide()
+                self.checkBox_ink.hide()
+                self.label_BOM_rows.hide()
+                self.dsBox_BOM_rows.hide()
+                self.label_symbol.show()
+                self.checkBox_symbol.show()
+                self.result_title_block = False
+
+        def on_checkbox_ink_changed(self, value):
+            """Toggles the color of the editable text entries"""
+            if value:
+                self.result_ink = "#00d"
+            else:
+                self.result_ink = "#000"
+
+        def on_checkbox_page_changed(self, value):
+            """Toggles if the created temlate will be inserted to create a page"""
+            if value:
+                self.label_sheets.show()
+                self.dsBox_sheets.show()
+                self.result_page = True
+            else:
+                self.label_sheets.hide()
+                self.dsBox_sheets.hide()
+                self.result_page = False
+
+        def on_checkbox_symbol_changed(self, value):
+            """Toggles if a symbol will be inserted into the created page"""
+            if value:
+                self.radio_button_BM_1.show()
+                self.radio_button_BM_2.show()
+                self.radio_button_BM_3.show()
+                self.radio_button_BM_4.show()
+                self.radio_button_BM_5.show()
+                self.checkBox_merge_symbol.show()
+                self.label_image.show()
+                self.result_symbol = True
+            else:
+                self.radio_button_BM_1.hide()
+                self.radio_button_BM_2.hide()
+                self.radio_button_BM_3.hide()
+                self.radio_button_BM_4.hide()
+                self.radio_button_BM_5.hide()
+                self.checkBox_merge_symbol.hide()
+                self.checkBox_merge_symbol.setChecked(False)
+                self.label_image.hide()
+                self.result_symbol = False
+
+        def selectSymbol(self, symbol_key):
+            """Selects a title block symbol and shows its preview"""
+            self.image_path = TITLE_BLOCKS[symbol_key]
+            self.Symbol_size = (
+                TemplaterSymbolLibrary.symbolSize(self.image_path)
+                or (180, SYMBOL_HEIGHTS[symbol_key])
+                )
+            self.preview_key = self.preview_keys[symbol_key]
+            self.label_image.setFixedSize(self.preview_key[2], self.preview_key[3])
+            self.showPreview(self.preview_key)
+
+        def showPreview(self, key):
+            """slot: shows a rendered preview if it is the selected one"""
+            if key != self.preview_key:
+                return
+            pixmap = TemplaterPreviews.previewPixmap(key)
+            if pixmap is None:
+                return  # still rendering, shown when finished
+            try:
+                self.label_image.setPixmap(pixmap)
+            except RuntimeError:
+                pass  # the panel was closed meanwhile
+
+        def on_radio_button_toggled(self):
+            """Selects the title block symbol to be inserted"""
+            # get the radio button that sent the signal
+            for button in self.group.buttons():
+                if button.isChecked():
+                    self.result_button = button.text()
+                    self.selectSymbol(button.text())
+            return
 
-    def reject(self):
-        '''
-        This is triggered by the panel's Cancel button.
-        But also prevents the closing of the panel
-        '''
-        FreeCADGui.Control.closeDialog()
+        def currentOptions(self):
+            """Returns the template options set in the panel"""
+            return {
+                "format":self.result_format,
+                "frame":self.checkBox_frame.isChecked(),
+                "indices":self.checkBox_indices.isChecked(),
+                "tilt":self.checkBox_tilt.isChecked(),
+                "title_block":self.checkBox_title_block.isChecked(),
+                "ink":self.result_ink,
+                "bom_rows":self.dsBox_BOM_rows.value(),
+                "text_to_path":self.checkBox_text_to_path.isChecked(),
+                "merged_symbol":None
+                }
+
+        def updatePreview(self, value = None):
+            """Requests a sheet preview of the current options"""
+            self.sheet_preview.request(self.currentOptions())
+
+        def accept(self):
+            """
+            This is triggered by the panel's OK button.
+            """
+            #- Close the dialog (variables will stay accessible)
+            FreeCADGui.Control.closeDialog()
+            self.sheet_preview.stop()
+            options = self.currentOptions()
+            merge_symbol = (self.checkBox_symbol.isChecked()
+                and self.checkBox_merge_symbol.isChecked()
+                )
+            if merge_symbol:
+                options["merged_symbol"] = self.result_button
+            #- Replace mode swaps the template of the existing page
+            if self.replace_page is not None:
+                options["merged_symbol"] = self.stored_merged_symbol
+                regenerateTemplate(self.replace_page, options)
+                return
+            #- Several sheets are created as a drawing set
+            number_of_sheets = int(self.dsBox_sheets.value())
+            if self.checkBox_page.isChecked() and number_of_sheets > 1:
+                sheet_spec = dict(options)
+                if self.checkBox_symbol.isChecked() and not merge_symbol:
+                    sheet_spec["symbol"] = self.result_button
+                createDrawingSet([sheet_spec] * number_of_sheets)
+                return
+            #- A page with standard options gets a prebuilt template
+            template_path = None
+            if self.checkBox_page.isChecked():
+                template_path = TemplaterTemplatePack.findPrebuilt(options)
+            if template_path is None:
+                #- Launch template creation and hand over values
+                template_path = file_path
+                createTemplate(template_path = template_path, **options)
+            #- launch the integration of the template into the document
+            if self.checkBox_page.isChecked():
+                format = self.result_format  # For annotation purposes
+                symbol = self.checkBox_symbol.isChecked() and not merge_symbol
+                symbol_path = self.image_path  # to the selected title block
+                symbol_height = self.Symbol_size[1]
+                insertTemplate(
+                    format, symbol, symbol_path, symbol_height, template_path,
+                    options
+                    )
+            return
+
+        def reject(self):
+            '''
+            This is triggered by the panel's Cancel button.
+            But also prevents the closing of the panel
+            '''
+            FreeCADGui.Control.closeDialog()
+            self.sheet_preview.stop()
 
     ##########################################################################################################
     # Command
@@ -773,3 +1369,46 @@ class TemplateTaskPanel():
             return True
 
     Gui.addCommand("Templater_NewTemplateMulti", NewTemplateCommandClass())
+
+    def selectedPage():
+        """Returns the selected page, the page of a selected view or False"""
+        for obj in Gui.Selection.getSelection():
+            if obj.isDerivedFrom(TemplaterPages.PAGE_TYPE):
+                return obj
+            if obj.isDerivedFrom("TechDraw::DrawView"):
+                return TemplaterPages.getPageOfView(obj)
+        return False
+
+    class ReplaceTemplateCommandClass():
+        """Replaces the template of a page keeping its editable texts"""
+
+        def GetResources(self):
+            return {
+                "Pixmap": os.path.join(
+                    icons_path, "Templater_ReplaceTemplate.svg"
+                    ),  # the name of an svg file available in the resources
+                "MenuText": QT_TRANSLATE_NOOP("Templater_ReplaceTemplate",
+                    "Replace Template"),
+                "ToolTip": QT_TRANSLATE_NOOP("Templater_ReplaceTemplate",
+                    "Replaces the template of the selected page\n"
+                    "with new options, editable texts are kept",
+                    ),
+                }
+
+        def Activated(self):
+            page = selectedPage()
+            if not page:
+                warning_text = translate("Templater",
+                    "Select a page or a view on a page first!"
+                    )
+                QMessageBox.warning(None, "", warning_text)
+                return
+            panel = TemplateTaskPanel(page)
+            FreeCADGui.Control.showDialog(panel)
+            # Further steps are launched from the OK option of the panel
+            return
+
+        def IsActive(self):
+            return FreeCAD.ActiveDocument is not None
+
+    Gui.addCommand("Templater_ReplaceTemplate", ReplaceTemplateCommandClass())
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2025 FBXL5 available on the forum:                      *
+# *   https://forum.freecad.org/memberlist.php?mode=viewprofile&u=26761     *
+# *                                                                         *
+# *   This file is part of FreeCAD.                                         *
+# *                                                                         *
+# *   FreeCAD is free software: you can redistribute it and/or modify it    *
+# *   under the terms of the GNU Lesser General Public License as           *
+# *   published by the Free Software Foundation, either version 3.0 of the  *
+# *   License, or (at your option) any later version.                       *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful, but        *
+# *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU      *
+# *   Lesser General Public License for more details.                       *
+# *                                                                         *
+# *   You should have received a copy of the GNU Lesser General Public      *
+# *   License along with FreeCAD. If not, see                               *
+# *   <https://www.gnu.org/licenses/>.                                      *
+# *                                                                         *
+# ***************************************************************************
+"""
+A pack of prebuilt standard templates (ISO A4 portrait/landscape to A0,
+with or without indices and title block) in Resources/templates.
+The pack is rendered once together with a manifest of the options, the
+Multi template tool loads a prebuilt file when the requested options match.
+
+Build it from the command line:
+  FreeCADCmd TemplaterTemplatePack.py
+or let the workbench build it in the background when it is activated.
+"""
+
+"""
+I have tried to follow this naming rule:
+ class names:    CamelCase
+ function names: mixedCase
+ constant names: ALL_CAPITAL + underscore
+ variable names: lower_case + underscore
+"""
+
+# imports and constants
+import json
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import FreeCAD
+import SvgToolkit
+import TemplaterTemplateMultiCmd
+
+PACK_PATH = os.path.join(SvgToolkit.mod_path, "Resources", "templates")
+MANIFEST_NAME = "manifest.json"
+#- Increase if the generated svg code changes, to rebuild existing packs
+PACK_VERSION = 3
+
+PACK_FORMATS = ("ISO A0", "ISO A1", "ISO A2", "ISO A3", "ISO A4", "ISO A4-")
+
+#- Cached manifest and the modification time it was read at
+loaded_manifest = {"mtime":None, "data":None}
+#- The background build started by startBuild
+build_thread = None
+
+def canonicalOptions(options):
+    """
+    Returns a complete option dictionary where options without effect
+    are reset to their defaults, e.g. tilt without indices
+    """
+    canonical = dict(TemplaterTemplateMultiCmd.DEFAULT_OPTIONS)
+    canonical.update(options)
+    canonical["frame"] = bool(canonical["frame"])
+    canonical["indices"] = bool(canonical["indices"])
+    canonical["tilt"] = bool(canonical["tilt"])
+    canonical["title_block"] = bool(canonical["title_block"])
+    canonical["bom_rows"] = int(canonical["bom_rows"])
+    canonical["text_to_path"] = bool(canonical["text_to_path"])
+    defaults = TemplaterTemplateMultiCmd.DEFAULT_OPTIONS
+    if not canonical["frame"]:
+        canonical["indices"] = False
+        canonical["title_block"] = False
+    if not canonical["indices"]:
+        canonical["tilt"] = False
+    if not canonical["title_block"]:
+        canonical["ink"] = defaults["ink"]
+        canonical["bom_rows"] = 0
+    if not canonical["merged_symbol"]:
+        canonical["merged_symbol"] = None
+    return canonical
+
+def packOptionSets():
+    """Returns the option sets of all templates in the pack"""
+    option_sets = []
+    for format in PACK_FORMATS:
+        for indices, tilt in ((False, False), (True, False), (True, True)):
+            for title_block in (True, False):
+                option_sets.append(canonicalOptions({
+                    "format":format,
+                    "frame":True,
+                    "indices":indices,
+                    "tilt":tilt,
+                    "title_block":title_block,
+                    "locale":None
+                    }))
+    return option_sets
+
+def currentLanguage():
+    """Returns the Gui language, fixed texts are translated into it"""
+    parameter_path = FreeCAD.ParamGet(
+        "User parameter:BaseApp/Preferences/General"
+        )
+    return parameter_path.GetString("Language")
+
+def buildSignature():
+    """
+    Settings that change the generated svg code besides the options,
+    a pack built with other settings is not used
+    """
+    return {
+        "pack_version":PACK_VERSION,
+        "language":currentLanguage(),
+        "projection_angle":SvgToolkit.projectionGroupAngle()
+        }
+
+def buildPack(pack_path = PACK_PATH):
+    """
+    Renders all templates of the pack and writes the manifest.
+    Returns the manifest data.
+    """
+    if not os.path.isdir(pack_path):
+        os.makedirs(pack_path)
+    manifest = buildSignature()
+    manifest["templates"] = []
+    for options in packOptionSets():
+        file_name = TemplaterTemplateMultiCmd.templateFileName(options)
+        TemplaterTemplateMultiCmd.createTemplate(
+            template_path = os.path.join(pack_path, file_name), **options
+            )
+        manifest["templates"].append({"file":file_name, "options":options})
+    m = open(os.path.join(pack_path, MANIFEST_NAME), "w", encoding = "utf-8")
+    json.dump(manifest, m, indent = 2)
+    m.close()
+    return manifest
+
+def readManifest(pack_path = PACK_PATH):
+    """Returns the manifest data, re-read only if the file has changed"""
+    manifest_path = os.path.join(pack_path, MANIFEST_NAME)
+    try:
+        mtime = os.stat(manifest_path).st_mtime_ns
+    except OSError:
+        return None
+    if loaded_manifest["mtime"] != mtime:
+        m = open(manifest_path, "r", encoding = "utf-8")
+        loaded_manifest["data"] = json.load(m)
+        m.close()
+        loaded_manifest["mtime"] = mtime
+    return loaded_manifest["data"]
+
+def isPackCurrent(pack_path = PACK_PATH):
+    """Checks if a pack exists and was built with the current settings"""
+    manifest = readManifest(pack_path)
+    if manifest is None:
+        return False
+    signature = buildSignature()
+    for key in signature:
+        if manifest.get(key) != signature[key]:
+            return False
+    return True
+
+def ensurePack(pack_path = PACK_PATH):
+    """
+    Builds the pack if it is missing or outdated, a read-only
+    installation just goes without a pack
+    """
+    if isPackCurrent(pack_path):
+        return True
+    try:
+        buildPack(pack_path)
+    except OSError:
+        return False
+    return True
+
+def startBuild(pack_path = PACK_PATH):
+    """
+    Builds a missing or outdated pack in a background thread, once at a
+    time. Until the manifest is written the pack is not used.
+    Returns the thread.
+    """
+    global build_thread
+    if build_thread is None or not build_thread.is_alive():
+        build_thread = threading.Thread(
+            target = ensurePack, args = (pack_path,),
+            name = "TemplaterPackBuild", daemon = True
+            )
+        build_thread.start()
+    return build_thread
+
+def findPrebuilt(options, pack_path = PACK_PATH):
+    """
+    Returns the path of a prebuilt template matching the options
+    or None if the options are not part of the pack
+    """
+    if options.get("locale") is not None:
+        return None
+    if not isPackCurrent(pack_path):
+        return None
+    requested = canonicalOptions(options)
+    for entry in readManifest(pack_path)["templates"]:
+        if entry["options"] == requested:
+            template_path = os.path.join(pack_path, entry["file"])
+            if os.path.exists(template_path):
+                return template_path
+            return None
+    return None
+
+if __name__ == "__main__":
+    manifest = buildPack()
+    print(len(manifest["templates"]), "templates written to", PACK_PATH)
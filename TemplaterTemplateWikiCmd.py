@@ -39,6 +39,8 @@ import FreeCAD
 import FreeCADGui
 import os
 import SvgToolkit
+import TemplaterCommand
+import TemplaterPages
 from PySide import QtCore
 from PySide.QtCore import QT_TRANSLATE_NOOP
 from PySide.QtGui import (QAction, QGroupBox, QMessageBox)
@@ -68,41 +70,20 @@ def getActiveDocument():
         #exit()
     return ado
 
-def existingPages(document):
-    """
-    Counts existing pages in the active document
-    """
-    number_of_pages = 0
-    for item in document.Objects:
-        if item.Name.startswith("Page"):
-            number_of_pages += 1
-    return number_of_pages
-
 def insertTemplate(active_doc, template_path):
     """
     Inserts a page and a template in the active document
     """
-    #- Count existing pages and add one for the new page number
-    page_mumber = existingPages(active_doc) + 1
-    #- Define the new page's name and the new template's name
-    #  (with only 2 trailing digits starting with 01)
-    if page_mumber < 10:
-        # insert leading zero
-        next = ("0" + str(page_mumber))
-    else:
-        next = str(page_mumber)
-    new_page = ("Page" + next)
-    new_template = ('Template' + next)
-    # add a page object to the active document
-    active_doc.addObject('TechDraw::DrawPage',new_page)
-    # add a template object to the active document
-    active_doc.addObject('TechDraw::DrawSVGTemplate',new_template)
-    # load the svg template into the template object
-    active_doc.getObject(new_template).Template = template_path
-    # add the template object to the page's object list
-    active_doc.getObject(new_page).Template = active_doc.getObject(new_template)
+    with TemplaterCommand.commandTransaction(
+        active_doc, "New template"
+        ) as pages:
+        #- Add a page with the lowest free number, e.g. Page03 and Template03
+        page_mumber, page_object, template_object = TemplaterPages.addPage(
+            active_doc, template_path
+            )
+        pages.append(page_object)
     # At this point the document received a new page with a new template
-    result = [page_mumber, new_page]
+    result = [page_mumber, page_object.Name]
     return result
 
 def createTitleBlock(file_path, sheet_width, sheet_height):
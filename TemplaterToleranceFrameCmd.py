@@ -36,7 +36,17 @@ I have tried to follow this naming rule:
 # imports and constants
 import FreeCAD
 import SvgToolkit
+import TemplaterCommand
+import TemplaterLayout
+import TemplaterPages
+import TemplaterMetrics
 import os     # built-in modules
+from SvgToolkit import (
+    levelOfIndentation,
+    svgPath,
+    svgRect,
+    svgText,
+    )
 from TechDrawTools import TDToolsUtil
 from PySide import QtCore
 from PySide.QtCore import QT_TRANSLATE_NOOP
@@ -49,6 +59,12 @@ icons_path = SvgToolkit.icons_path
 mod_path = SvgToolkit.mod_path
 file_path = os.path.join(mod_path, "Resources", "NewSymbol.svg")
 
+#- Text style of the frame cells, see createFrame()
+FONT_SIZE = 6.5
+FONT_FAMILY = "DIN Alternate"
+#- Space left and right of a cell's text
+CELL_PADDING = 3.0
+
 
 def getActiveDocument():
     """
@@ -61,23 +77,6 @@ def getActiveDocument():
     TDToolsUtil.displayMessage("AuxView", message)
     return False
 
-def getPageOfSelection(doc, active_view):
-    """
-    Retrieves the Page that holds the selected elements
-    """
-    #- Find an object starting with 'Page' that contains the selected object
-    for each in doc.Objects:
-        if each.Name.startswith("Page"):
-            for item in each.OutList: # Search items belonging to a Page object
-                if item.Name.startswith("ProjGroup"): # Look into projection groups
-                    for view in item.OutList: # Search views belonging to a ProjGroup object
-                        if view.Name == active_view.Name:
-                            return each
-                else:
-                    if item.Name == active_view.Name:
-                        return each
-    return False
-
 def ediText(entry_name, x, y, str_value, str_angle="0"):
     """
     Generates an svg-instruction to place an editable text element
@@ -141,39 +140,40 @@ def symbolObject(svg_path, symbol_name):
     active_doc = getActiveDocument()
     new_symbol = active_doc.addObject("TechDraw::DrawViewSymbol",symbol_name)
     #- Load SVG file
-    svg_file = open(svg_path, "r", encoding="utf-8")
-    svg_code = svg_file.read()
-    svg_file.close()
-    new_symbol.Symbol = svg_code
+    new_symbol.Symbol = SvgToolkit.readResource(svg_path)
     return new_symbol
 
-def insertSymbol(td_symbol):
+def insertSymbol(svg_path, symbol_name):
     """
-    Inserts a symbol in the active document
+    Creates a symbol object and inserts it into the page of the
+    selected view, both in one undo step
     """
-    Symbol_name = td_symbol.Name
     #- Retrieve the active document
     active_doc = getActiveDocument()
+    if not active_doc:
+        return
     #- Retrieve the selection view
     if TDToolsUtil.getSelView():
         active_view = TDToolsUtil.getSelView()
     else:
         return
     #- Retrieve the page that holds the view
-    active_page = getPageOfSelection(active_doc, active_view)
-    #- To see changes immediately
-    active_page.KeepUpdated = True
-    #- Add the symbol to the page
-    active_page.addView(td_symbol)
-    #- Add a view as owner to synchronise movements
-    td_symbol.Owner = active_view
-
-    Gui.runCommand("TechDraw_RedrawPage",0)
-    #- To no longer see changes immediately
-    active_page.KeepUpdated = False
+    active_page = TemplaterPages.getPageOfView(active_view)
+    if not active_page:
+        return
+    with TemplaterCommand.commandTransaction(
+        active_doc, "Feature frame", [active_page]
+        ):
+        td_symbol = symbolObject(svg_path, symbol_name)
+        #- Add the symbol to the page
+        active_page.addView(td_symbol)
+        #- Add a view as owner to synchronise movements
+        td_symbol.Owner = active_view
+        #- Next to the owner, clear of views, symbols and the title block
+        TemplaterLayout.placeNear(active_page, td_symbol, active_view)
 
     active_page.ViewObject.doubleClicked()
-    return
+    return td_symbol
 
 def createFrame(file_path, strings, cell_widths = [10]):
     """
@@ -187,10 +187,11 @@ def createFrame(file_path, strings, cell_widths = [10]):
         "style=\"fill:#fff;fill-opacity:1;stroke:#000;stroke-width:0.5;\n"
         )
     s.write(loi +
-        "stroke-linecap:round;stroke-linejoin:round;font-size:6.5;\n"
+        "stroke-linecap:round;stroke-linejoin:round;font-size:" +
+        str(FONT_SIZE) + ";\n"
         )
     s.write(loi +
-        "text-anchor:middle;font-family:DIN Alternate\">\n"
+        "text-anchor:middle;font-family:" + FONT_FAMILY + "\">\n"
         )
     loi = levelOfIndentation(4)
 
@@ -234,7 +235,16 @@ def createFrame(file_path, strings, cell_widths = [10]):
     s.write(loi + "</g>\n")
     s.close
 
-def createSymbol(
+def cellWidth(text):
+    """
+    Returns the outer width of a frame cell that fits the text,
+    at least the 10 mm of a square cell
+    """
+    text_width = TemplaterMetrics.textWidth(text, FONT_SIZE)
+    return max(10, round(text_width + CELL_PADDING, 1))
+
+def writeSymbol(
+    symbol_path,
     tolerance,
     value,
     reference1,
@@ -244,6 +254,7 @@ def createSymbol(
     First determines the length of the frame then calls external methods
     to build the head and outer body tags.
     (<svg>...</svg> to embed grouped elements)
+    Returns the symbol's width and height
     """
     #- String list for the frame
     strings = [tolerance, value, reference1, reference2, reference3]
@@ -251,42 +262,41 @@ def createSymbol(
     if (len(tolerance) == 1):
         widths = [10]
     else:
-        #- set default width values
-        width1 = 10
-        width2 = 10
-        width3 = 10
-        width4 = 10
-        width5 = 10
-        #- add extra length for string values
-        width2 += len(value) * 2.0
-        widths = [width1, width2]
+        #- cells are square unless their text needs more space
+        widths = [10, cellWidth(value)]
         if reference1 != "":
-            if len(reference1) > 1:
-                width3 += len(reference1) * 1.5
-            widths.append(width3)
+            widths.append(cellWidth(reference1))
             if reference2 != "":
-                if len(reference2) > 1:
-                    width4 += len(reference2) * 1.5
-                widths.append(width4)
+                widths.append(cellWidth(reference2))
                 if reference3 != "":
-                    if len(reference3) > 1:
-                        width5 += len(reference3) * 1.5
-                    widths.append(width5)
+                    widths.append(cellWidth(reference3))
     #- calculate the symbol length
     length = 0.5 # start with one line width
     for value in widths:
         length += (float(value) - 0.5) # Outer length minus one line width
-    symbol_width = str(length)
+    symbol_width = str(round(length, 2))
     symbol_height = "10"
 
-    SvgToolkit.createSvgFile(file_path)
-    SvgToolkit.startSvg(file_path, symbol_width, symbol_height)
-    createFrame(file_path, strings, widths)
-    SvgToolkit.endSvg(file_path)
+    SvgToolkit.createSvgFile(symbol_path)
+    SvgToolkit.startSvg(symbol_path, symbol_width, symbol_height)
+    createFrame(symbol_path, strings, widths)
+    SvgToolkit.endSvg(symbol_path)
     # At this point an SVG symbol file is created in the given directory
+    return (symbol_width, symbol_height)
+
+def createSymbol(
+    tolerance,
+    value,
+    reference1,
+    reference2,
+    reference3):
+    """
+    Writes the feature frame symbol file, then creates a symbol object
+    and inserts it into the page of the selected view
+    """
+    writeSymbol(file_path, tolerance, value, reference1, reference2, reference3)
     #- Create a symbol object and insert it into a drawig pages
-    frame_symbol = symbolObject(file_path, "FeatureFrame")
-    insertSymbol(frame_symbol)
+    insertSymbol(file_path, "FeatureFrame")
     return
 ##########################################################################################################
 # Gui code
@@ -294,12 +304,6 @@ def createSymbol(
 
 if SvgToolkit.isGuiLoaded():
     from FreeCAD import Gui
-    from SvgToolkit import (
-        levelOfIndentation,
-        svgPath,
-        svgRect,
-        svgText,
-        )
 
     ##########################################################################################################
     # View Provider
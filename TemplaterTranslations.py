@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2025 FBXL5 available on the forum:                      *
+# *   https://forum.freecad.org/memberlist.php?mode=viewprofile&u=26761     *
+# *                                                                         *
+# *   This file is part of FreeCAD.                                         *
+# *                                                                         *
+# *   FreeCAD is free software: you can redistribute it and/or modify it    *
+# *   under the terms of the GNU Lesser General Public License as           *
+# *   published by the Free Software Foundation, either version 3.0 of the  *
+# *   License, or (at your option) any later version.                       *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful, but        *
+# *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU      *
+# *   Lesser General Public License for more details.                       *
+# *                                                                         *
+# *   You should have received a copy of the GNU Lesser General Public      *
+# *   License along with FreeCAD. If not, see                               *
+# *   <https://www.gnu.org/licenses/>.                                      *
+# *                                                                         *
+# ***************************************************************************
+"""
+Cached translation tables for texts written into templates.
+Each locale is resolved once into a table {source text: translation}.
+The tables can be exported to and loaded from plain JSON, so headless runs
+without a Qt translator still produce localised templates.
+"""
+
+"""
+I have tried to follow this naming rule:
+ class names:    CamelCase
+ function names: mixedCase
+ constant names: ALL_CAPITAL + underscore
+ variable names: lower_case + underscore
+"""
+
+# imports and constants
+import json
+import os
+import threading
+import FreeCAD
+import SvgToolkit
+from PySide import QtCore
+
+translate = FreeCAD.Qt.translate
+
+CONTEXT = "Templater"
+
+#- Source texts to resolve when a table is built, see registerTexts()
+registered_texts = []
+#- Resolved tables, the key None stands for the running translator
+tables = {}
+tables_lock = threading.Lock()
+
+def registerTexts(texts):
+    """
+    Adds source texts that will be resolved whenever a table is built
+    """
+    for text in texts:
+        if text not in registered_texts:
+            registered_texts.append(text)
+
+def loadTranslator(locale):
+    """
+    Returns a QTranslator loaded with Templater_<locale>.qm or None
+    """
+    translator = QtCore.QTranslator()
+    qm_path = os.path.join(
+        SvgToolkit.translations_path, "Templater_" + locale + ".qm"
+        )
+    if os.path.exists(qm_path) and translator.load(qm_path):
+        return translator
+    return None
+
+def resolveTexts(texts, locale, translator = None):
+    """
+    Translates texts for a locale, the source text is kept if
+    no translation is available
+    """
+    resolved = {}
+    for text in texts:
+        if locale is None:
+            resolved[text] = translate(CONTEXT, text)
+        elif translator is not None:
+            resolved[text] = translator.translate(CONTEXT, text) or text
+        else:
+            resolved[text] = text
+    return resolved
+
+def translationTable(locale = None):
+    """
+    Returns the cached table of a locale, locale None uses the
+    translator of the running application.
+    A table is resolved once, texts registered later are added on demand.
+    """
+    with tables_lock:
+        table = tables.get(locale)
+        if table is None:
+            translator = None
+            if locale is not None:
+                translator = loadTranslator(locale)
+            table = resolveTexts(registered_texts, locale, translator)
+            tables[locale] = table
+        else:
+            missing = [text for text in registered_texts if text not in table]
+            if missing:
+                translator = None
+                if locale is not None:
+                    translator = loadTranslator(locale)
+                table.update(resolveTexts(missing, locale, translator))
+    return table
+
+def translateText(text, locale = None):
+    """Returns the cached translation of a single source text"""
+    table = translationTable(locale)
+    if text not in table:
+        registerTexts([text])
+        table = translationTable(locale)
+    return table[text]
+
+def exportTables(json_path, locales):
+    """
+    Writes the tables of the given locales into a JSON file
+    {locale: {source text: translation}}
+    """
+    data = {}
+    for locale in locales:
+        data[locale] = dict(translationTable(locale))
+    j = open(json_path, "w", encoding = "utf-8")
+    json.dump(data, j, ensure_ascii = False, indent = 2, sort_keys = True)
+    j.close()
+    return json_path
+
+def loadTables(json_path):
+    """
+    Reads tables from a JSON file written by exportTables().
+    Loaded entries replace resolved ones and are not resolved again.
+    Returns the list of loaded locales.
+    """
+    j = open(json_path, "r", encoding = "utf-8")
+    data = json.load(j)
+    j.close()
+    with tables_lock:
+        for locale in data:
+            table = tables.setdefault(locale, {})
+            table.update(data[locale])
+    return list(data)
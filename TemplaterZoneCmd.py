@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# ***************************************************************************
+# *                                                                         *
+# *   Copyright (c) 2025 FBXL5 available on the forum:                      *
+# *   https://forum.freecad.org/memberlist.php?mode=viewprofile&u=26761     *
+# *                                                                         *
+# *   This file is part of FreeCAD.                                         *
+# *                                                                         *
+# *   FreeCAD is free software: you can redistribute it and/or modify it    *
+# *   under the terms of the GNU Lesser General Public License as           *
+# *   published by the Free Software Foundation, either version 3.0 of the  *
+# *   License, or (at your option) any later version.                       *
+# *                                                                         *
+# *   FreeCAD is distributed in the hope that it will be useful, but        *
+# *   WITHOUT ANY WARRANTY; without even the implied warranty of            *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU      *
+# *   Lesser General Public License for more details.                       *
+# *                                                                         *
+# *   You should have received a copy of the GNU Lesser General Public      *
+# *   License along with FreeCAD. If not, see                               *
+# *   <https://www.gnu.org/licenses/>.                                      *
+# *                                                                         *
+# ***************************************************************************
+"""
+Reports the drawing zones ("C4") of the views and symbols on pages
+"""
+
+"""
+I have tried to follow this naming rule:
+ class names:    CamelCase
+ function names: mixedCase
+ constant names: ALL_CAPITAL + underscore
+ variable names: lower_case + underscore
+"""
+
+# imports and constants
+import FreeCAD
+import os     # built-in modules
+import SvgToolkit
+import TemplaterLayout
+import TemplaterPages
+from PySide.QtCore import QT_TRANSLATE_NOOP
+
+translate = FreeCAD.Qt.translate
+
+icons_path = SvgToolkit.icons_path
+
+def zoneText(pages):
+    """Returns a text listing the zone of every view on the pages"""
+    lines = []
+    for page in pages:
+        if page.Template is None:
+            continue
+        lines.append(page.Label)
+        if not TemplaterLayout.hasZones(page):
+            lines.append("    " + translate("Templater", "No zone indices"))
+            continue
+        for view, zone in TemplaterLayout.zoneReport(page):
+            lines.append("    {:6} {}".format(zone or "-", view.Label))
+    return "\n".join(lines)
+
+##########################################################################################################
+# Gui code
+##########################################################################################################
+
+if SvgToolkit.isGuiLoaded():
+    from FreeCAD import Gui
+    from PySide.QtGui import QMessageBox
+
+    ##########################################################################################################
+    # Command
+    ##########################################################################################################
+
+    class ZoneReportCommandClass():
+        """Lists the zones of the views on the selected or all pages"""
+
+        def GetResources(self):
+            return {
+                "Pixmap": os.path.join(
+                    icons_path, "Templater_ZoneReport.svg"
+                    ),  # the name of a svg file available in the resources
+                "MenuText": QT_TRANSLATE_NOOP("Templater_ZoneReport",
+                    "Zone Report"
+                    ),
+                "ToolTip": QT_TRANSLATE_NOOP("Templater_ZoneReport",
+                    "Lists the drawing zones of all views and symbols\n"
+                    "on the selected pages or on all pages",
+                    ),
+                }
+
+        def Activated(self):
+            active_doc = FreeCAD.activeDocument()
+            pages = [
+                obj for obj in Gui.Selection.getSelection()
+                if obj.isDerivedFrom(TemplaterPages.PAGE_TYPE)
+                ]
+            if not pages:
+                pages = TemplaterPages.pagesOf(active_doc)
+            report = zoneText(pages)
+            FreeCAD.Console.PrintMessage(report + "\n")
+            QMessageBox.information(None, translate("Templater", "Zones"), report)
+            return
+
+        def IsActive(self):
+            return FreeCAD.ActiveDocument is not None
+
+    Gui.addCommand("Templater_ZoneReport", ZoneReportCommandClass())
@@ -25,6 +25,8 @@ This script creates a title block for a template.
 
 # imports and constants
 import FreeCAD
+import TemplaterTranslations
+from PySide.QtCore import QT_TRANSLATE_NOOP
 from SvgToolkit import (
     levelOfIndentation,
     svgPath,
@@ -34,40 +36,59 @@ from SvgToolkit import (
 
 translate = FreeCAD.Qt.translate
 
-def fixed_texts():
-    """Creates a translated dictionary for title block annotations"""
-    fixed_texts = {
-        "drawn"        : translate("Templater", "Drawn:"),
-        "approved"     : translate("Templater", "Approved:"),
-        "name"         : translate("Templater", "Name:"),
-        "CAD_version"  : translate("Templater", "CAD version:"),
-        "date"         : translate("Templater", "Date:"),
-        "title"        : translate("Templater", "Title:"),
-        "part_number"  : translate("Templater", "Part number:"),
-        "scale"        : translate("Templater", "Scale:"),
-        "material"     : translate("Templater", "Material:"),
-        "mass"         : translate("Templater", "Mass:"),
-        "sheet_format" : translate("Templater", "Format:"),
-        "sheet_count"  : translate("Templater", "Sheet:"),
-        "owner"        : translate("Templater", "Owner:")
-        }
+#- Source texts of the title block annotations,
+#  translated through the cached tables of TemplaterTranslations
+FIXED_TEXTS = {
+    "drawn"        : QT_TRANSLATE_NOOP("Templater", "Drawn:"),
+    "approved"     : QT_TRANSLATE_NOOP("Templater", "Approved:"),
+    "name"         : QT_TRANSLATE_NOOP("Templater", "Name:"),
+    "CAD_version"  : QT_TRANSLATE_NOOP("Templater", "CAD version:"),
+    "date"         : QT_TRANSLATE_NOOP("Templater", "Date:"),
+    "title"        : QT_TRANSLATE_NOOP("Templater", "Title:"),
+    "part_number"  : QT_TRANSLATE_NOOP("Templater", "Part number:"),
+    "scale"        : QT_TRANSLATE_NOOP("Templater", "Scale:"),
+    "material"     : QT_TRANSLATE_NOOP("Templater", "Material:"),
+    "mass"         : QT_TRANSLATE_NOOP("Templater", "Mass:"),
+    "sheet_format" : QT_TRANSLATE_NOOP("Templater", "Format:"),
+    "sheet_count"  : QT_TRANSLATE_NOOP("Templater", "Sheet:"),
+    "owner"        : QT_TRANSLATE_NOOP("Templater", "Owner:")
+    }
+
+#- Source texts of the BOM annotations
+BOM_TEXTS = {
+    "position" : QT_TRANSLATE_NOOP("Templater", "Pos."),
+    "amount"   : QT_TRANSLATE_NOOP("Templater", "Amount"),
+    "unit"     : QT_TRANSLATE_NOOP("Templater", "Unit"),
+    "title"    : QT_TRANSLATE_NOOP("Templater", "Title"),
+    "number"   : QT_TRANSLATE_NOOP("Templater", "Part number"),
+    "material" : QT_TRANSLATE_NOOP("Templater", "Material"),
+    "mass"     : QT_TRANSLATE_NOOP("Templater", "Mass"),
+    "remark"   : QT_TRANSLATE_NOOP("Templater", "Remark")
+    }
+
+TemplaterTranslations.registerTexts(FIXED_TEXTS.values())
+TemplaterTranslations.registerTexts(BOM_TEXTS.values())
+
+def fixed_texts(locale = None):
+    """
+    Creates a translated dictionary for title block annotations
+    (locale None follows the running application)
+    """
+    table = TemplaterTranslations.translationTable(locale)
+    fixed_texts = {}
+    for key in FIXED_TEXTS:
+        fixed_texts[key] = table[FIXED_TEXTS[key]]
     return fixed_texts
 
-def bom_texts():
+def bom_texts(locale = None):
     """Creates a translated dictionary for BOM annotations"""
-    fixed_texts = {
-        "position" : translate("Templater", "Pos."),
-        "amount"   : translate("Templater", "Amount"),
-        "unit"     : translate("Templater", "Unit"),
-        "title"    : translate("Templater", "Title"),
-        "number"   : translate("Templater", "Part number"),
-        "material" : translate("Templater", "Material"),
-        "mass"     : translate("Templater", "Mass"),
-        "remark"   : translate("Templater", "Remark")
-        }
+    table = TemplaterTranslations.translationTable(locale)
+    fixed_texts = {}
+    for key in BOM_TEXTS:
+        fixed_texts[key] = table[BOM_TEXTS[key]]
     return fixed_texts
 
-def createTitleBlock(file_path, sheet_size, da_offsets):
+def createTitleBlock(file_path, sheet_size, da_offsets, locale = None):
     """
     Calls external methods to create a movable title block
     according to DIN EN ISO 7200
@@ -127,7 +148,7 @@ stroke-linecap:miter;stroke-miterlimit:4\">\n")
     t.write(loi + "style=\"font-size:2.0;text-anchor:start;fill:#000000;\
 font-family:osifont\">\n")
     loi = levelOfIndentation(6)
-    ft = fixed_texts()
+    ft = fixed_texts(locale)
     t.write(loi + svgText("  1.5", "-31  ", ft["drawn"]) + "\n")
     t.write(loi + svgText("  1.5", "-24  ", ft["approved"]) + "\n")
     t.write(loi + svgText("  1.5", "-11.5", ft["owner"]) + "\n")
@@ -279,7 +300,9 @@ font-family:osifont\">\n")
     t.write(loi + "</g>\n")
     t.close
 
-def createBOMLines(file_path, sheet_width, sheet_height,bom_rows, ink = "#000"):
+def createBOMLines(
+    file_path, sheet_width, sheet_height, bom_rows, ink = "#000", locale = None
+    ):
     """
     Calls external methods to create BOM lines
     """
@@ -332,7 +355,7 @@ round\">\n")
     t.write(loi + "style=\"font-family:osifont;font-size:3.5;text-anchor:\
 middle;fill:#000000\">\n")
     loi = levelOfIndentation(6)
-    bt = bom_texts()
+    bt = bom_texts(locale)
     t.write(loi + svgText(str(st_x +   5), str(st_y - 4), bt["position"])
         + "\n"
         )
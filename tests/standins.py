@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-3.0-or-later
+"""
+Stand-ins for FreeCAD, FreeCADGui and PySide, installed only if FreeCAD
+can't be imported. They let the tests import the workbench modules and
+run their pure helpers with any python 3. With FreeCAD's python the real
+modules are used.
+"""
+
+import os
+import sys
+import tempfile
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+class StandIn():
+    """Takes any arguments and has any attribute, e.g. a Qt class"""
+    def __init__(self, *arguments, **keywords):
+        pass
+
+    def __call__(self, *arguments, **keywords):
+        return StandIn()
+
+    def __getattr__(self, name):
+        return StandIn()
+
+class StandInModule(types.ModuleType):
+    """A module whose unknown names are StandIn, e.g. PySide.QtGui"""
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return StandIn
+
+class Parameters():
+    """The parameter group of ParamGet, every value is the default"""
+    def GetBool(self, name, default = False):
+        return default
+
+    def GetInt(self, name, default = 0):
+        return default
+
+    def GetFloat(self, name, default = 0.0):
+        return default
+
+    def GetString(self, name, default = ""):
+        return default
+
+def translate(context, text, *arguments):
+    return text
+
+def makeFreeCAD():
+    """Returns the FreeCAD stand-in, a console application without a Gui"""
+    data_dir = tempfile.mkdtemp(prefix = "TemplaterTests")
+    freecad = StandInModule("FreeCAD")
+    freecad.GuiUp = False
+    freecad.Qt = types.SimpleNamespace(translate = translate)
+    freecad.ParamGet = lambda path: Parameters()
+    freecad.activeDocument = lambda: None
+    freecad.ActiveDocument = None
+    freecad.addDocumentObserver = lambda observer: None
+    freecad.getUserAppDataDir = lambda: data_dir
+    freecad.getResourceDir = lambda: data_dir
+    return freecad
+
+def install():
+    """Installs the stand-ins unless FreeCAD can be imported"""
+    try:
+        import FreeCAD
+        return
+    except ImportError:
+        pass
+    sys.modules["FreeCAD"] = makeFreeCAD()
+    sys.modules["FreeCADGui"] = StandInModule("FreeCADGui")
+    pyside = StandInModule("PySide")
+    pyside.__path__ = []
+    sys.modules["PySide"] = pyside
+    for name in ("QtCore", "QtGui", "QtWidgets", "QtSvg"):
+        module = StandInModule("PySide." + name)
+        setattr(pyside, name, module)
+        sys.modules["PySide." + name] = module
+    sys.modules["PySide.QtCore"].QT_TRANSLATE_NOOP = translate
+
+install()
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-3.0-or-later
+"""
+Tests of the table reading of TemplaterFillCmd
+"""
+
+import unittest
+
+import standins
+import TemplaterFillCmd
+
+class TableToRowsTests(unittest.TestCase):
+
+    def testEmptyTable(self):
+        self.assertEqual(TemplaterFillCmd.tableToRows([]), {})
+
+    def testRows(self):
+        table = [
+            ["Page", " Title ", "Author"],
+            ["Page01", "Shaft", "FB"],
+            [" Sheet 2 ", "Hub", ""]
+            ]
+        self.assertEqual(TemplaterFillCmd.tableToRows(table), {
+            "Page01": {"Title":"Shaft", "Author":"FB"},
+            "Sheet 2": {"Title":"Hub", "Author":""}
+            })
+
+    def testEmptyPageCellsAndNamesAreSkipped(self):
+        table = [
+            ["Page", "Title", ""],
+            ["", "Lost", "x"],
+            [],
+            ["Page02", "Kept", "y"]
+            ]
+        self.assertEqual(
+            TemplaterFillCmd.tableToRows(table), {"Page02": {"Title":"Kept"}}
+            )
+
+    def testShortRows(self):
+        table = [["Page", "Title", "Author"], ["Page03", "Only title"]]
+        self.assertEqual(
+            TemplaterFillCmd.tableToRows(table), {"Page03": {"Title":"Only title"}}
+            )
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-3.0-or-later
+"""
+Tests of TemplaterLayout with stand-in page objects, they run with any
+python 3 or with FreeCAD's python:
+python -m unittest discover tests
+"""
+
+import json
+import unittest
+
+import standins
+import TemplaterLayout
+
+VIEW_TYPES = ("TechDraw::DrawViewSymbol", "TechDraw::DrawView")
+
+class StandIn():
+    """A document object with the properties the layout functions read"""
+    def __init__(self, name, types, **properties):
+        self.Name = name
+        self.TypeId = types[0]
+        self.types = types
+        self.InList = []
+        self.PropertiesList = []
+        self.__dict__.update(properties)
+
+    def isDerivedFrom(self, type_id):
+        return type_id in self.types
+
+def symbolSvg(width, height):
+    return '<svg viewBox="0 0 {} {}"></svg>'.format(width, height)
+
+def makePage(indices = True):
+    """
+    Returns an A3 page of a Templater template with a title block
+    symbol owned by the page
+    """
+    document = StandIn("Doc", ("App::Document",))
+    template = StandIn(
+        "Template01", ("TechDraw::DrawSVGTemplate",), Width = 420, Height = 297,
+        TemplaterOptions = json.dumps({"format":"ISO A3", "indices":indices})
+        )
+    template.PropertiesList.append("TemplaterOptions")
+    page = StandIn(
+        "Page01", ("TechDraw::DrawPage",), Document = document,
+        Template = template, Views = []
+        )
+    #- Like TemplaterTemplateMultiCmd.insertSymbol creates it
+    title_block = StandIn(
+        "TitleBlock", VIEW_TYPES, X = 320.0, Y = 28.0, Scale = 1.0,
+        Rotation = 0.0, Symbol = symbolSvg(180, 36), Owner = page
+        )
+    page.Views.append(title_block)
+    return page, title_block
+
+class OwnerTests(unittest.TestCase):
+
+    def setUp(self):
+        TemplaterLayout.occupancy_grids.clear()
+
+    def testPositionOfSymbolOwnedByPage(self):
+        page, title_block = makePage()
+        self.assertEqual(TemplaterLayout.pagePosition(title_block), (320.0, 28.0))
+
+    def testPositionOfSymbolOwnedByView(self):
+        page, title_block = makePage()
+        owner = StandIn("Symbol", VIEW_TYPES, X = 100.0, Y = 150.0)
+        frame = StandIn("FeatureFrame", VIEW_TYPES, X = 5.0, Y = -3.0, Owner = owner)
+        self.assertEqual(TemplaterLayout.pagePosition(frame), (105.0, 147.0))
+
+    def testOwnedSymbolIsNotPlaceable(self):
+        page, title_block = makePage()
+        owner = StandIn("Symbol", VIEW_TYPES, X = 100.0, Y = 150.0)
+        frame = StandIn("FeatureFrame", VIEW_TYPES, X = 5.0, Y = -3.0, Owner = owner)
+        page.Views.extend([owner, frame])
+        self.assertEqual(
+            [view.Name for view in TemplaterLayout.placeableViews(page)],
+            ["TitleBlock", "Symbol"]
+            )
+
+    def testZoneReportWithTitleBlock(self):
+        page, title_block = makePage()
+        report = dict(
+            (view.Name, zone) for view, zone in TemplaterLayout.zoneReport(page)
+            )
+        self.assertTrue(report["TitleBlock"])
+
+    def testZoneReportWithoutIndices(self):
+        page, title_block = makePage(indices = False)
+        self.assertEqual(TemplaterLayout.zoneReport(page), [])
+
+    def testZoneReportOfForeignTemplate(self):
+        page, title_block = makePage()
+        page.Template.PropertiesList.remove("TemplaterOptions")
+        self.assertEqual(TemplaterLayout.zoneReport(page), [])
+
+    def testPlaceNearWithTitleBlock(self):
+        page, title_block = makePage()
+        owner = StandIn(
+            "Symbol", VIEW_TYPES, X = 200.0, Y = 150.0, Scale = 1.0,
+            Rotation = 0.0, Symbol = symbolSvg(40, 20)
+            )
+        frame = StandIn(
+            "FeatureFrame", VIEW_TYPES, X = 0.0, Y = 0.0, Scale = 1.0,
+            Rotation = 0.0, Symbol = symbolSvg(20, 10), Owner = owner
+            )
+        page.Views.extend([owner, frame])
+        self.assertTrue(TemplaterLayout.placeNear(page, frame, owner))
+        frame_box = TemplaterLayout.viewBox(frame)
+        for other in (owner, title_block):
+            self.assertFalse(
+                TemplaterLayout.boxesOverlap(frame_box, TemplaterLayout.viewBox(other))
+                )
+
+    def testOccupancyGridFollowsTheSheet(self):
+        page, title_block = makePage()
+        grid = TemplaterLayout.occupancyGrid(page)
+        self.assertIs(TemplaterLayout.occupancyGrid(page), grid)
+        page.Template.Width, page.Template.Height = (594, 420)
+        grid = TemplaterLayout.occupancyGrid(page)
+        self.assertEqual(grid.area, (20, 10, 584.0, 410.0))
+        page.Template.TemplaterOptions = json.dumps(
+            {"format":"ISO A2", "bom_rows":3}
+            )
+        self.assertIsNot(TemplaterLayout.occupancyGrid(page), grid)
+
+class MapPositionTests(unittest.TestCase):
+
+    def testProportional(self):
+        old_area = (20, 10, 410, 287)
+        new_area = (20, 10, 584, 410)
+        self.assertEqual(
+            TemplaterLayout.mapPosition(215, 148.5, old_area, new_area),
+            (302.0, 210.0)
+            )
+
+    def testAnchoredKeepsTheDistanceToTheNearestCorner(self):
+        old_area = (20, 10, 410, 287)
+        new_area = (20, 10, 584, 410)
+        self.assertEqual(
+            TemplaterLayout.mapPosition(50, 30, old_area, new_area, True),
+            (50, 30)
+            )
+        self.assertEqual(
+            TemplaterLayout.mapPosition(400, 280, old_area, new_area, True),
+            (574, 403)
+            )
+
+class ZoneGridTests(unittest.TestCase):
+
+    def testZonesOfA3(self):
+        grid = TemplaterLayout.ZoneGrid(420, 297)
+        self.assertEqual(grid.zoneAt(25, 280), "A1")
+        self.assertEqual(grid.zoneAt(210, 148.5), "D4")
+        self.assertEqual(grid.zoneAt(405, 15), "F8")
+
+    def testOutsideTheDrawingArea(self):
+        grid = TemplaterLayout.ZoneGrid(420, 297)
+        self.assertFalse(grid.zoneAt(5, 5))
+        self.assertFalse(grid.zoneAt(415, 150))
+
+    def testA4HasNoZones(self):
+        self.assertFalse(TemplaterLayout.ZoneGrid(210, 297).zoneAt(100, 150))
+
+class RecommendFormatTests(unittest.TestCase):
+
+    def testSmallestSheetOfAllFamilies(self):
+        self.assertEqual(TemplaterLayout.recommendFormat((100, 80)), "ANSI A")
+
+    def testFamilies(self):
+        self.assertEqual(
+            TemplaterLayout.recommendFormat((100, 80), families = ("ISO",)),
+            "ISO A4"
+            )
+
+    def testTitleBlockNeedsRoom(self):
+        self.assertEqual(
+            TemplaterLayout.recommendFormat((170, 250), families = ("ISO",)),
+            "ISO A3"
+            )
+        self.assertEqual(
+            TemplaterLayout.recommendFormat(
+                (170, 250), title_block = False, families = ("ISO",)
+                ),
+            "ISO A4"
+            )
+
+    def testOnlyOfferedFormats(self):
+        for size in ((100, 80), (300, 100), (100, 300), (800, 500)):
+            self.assertIn(
+                TemplaterLayout.recommendFormat(size),
+                TemplaterLayout.SvgToolkit.SHEET_FORMATS
+                )
+
+    def testTooLarge(self):
+        self.assertFalse(TemplaterLayout.recommendFormat((5000, 100)))
+
+class OccupancyGridTests(unittest.TestCase):
+
+    def testFreeAnchor(self):
+        grid = TemplaterLayout.OccupancyGrid((0, 0, 200, 200))
+        self.assertEqual(
+            grid.nearestFree((20, 10), (90, 90, 110, 110)), (100.0, 100.0)
+            )
+
+    def testNextToAnOccupiedAnchor(self):
+        grid = TemplaterLayout.OccupancyGrid((0, 0, 200, 200))
+        anchor = (80, 80, 120, 120)
+        grid.add(anchor)
+        spot = grid.nearestFree((20, 10), anchor)
+        box = TemplaterLayout.boxAround(spot[0], spot[1], (20, 10))
+        self.assertFalse(TemplaterLayout.boxesOverlap(box, anchor))
+        #- Right beside the anchor, not somewhere far away
+        self.assertLessEqual(TemplaterLayout.boxGap(box, anchor), 10)
+
+    def testFullArea(self):
+        grid = TemplaterLayout.OccupancyGrid((0, 0, 50, 50))
+        grid.add((0, 0, 50, 50))
+        self.assertFalse(grid.nearestFree((20, 10), (20, 20, 30, 30)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-3.0-or-later
+"""
+Tests of the option handling of TemplaterTemplatePack
+"""
+
+import unittest
+
+import standins
+import TemplaterTemplatePack
+
+class CanonicalOptionsTests(unittest.TestCase):
+
+    def canonical(self, **options):
+        return TemplaterTemplatePack.canonicalOptions(options)
+
+    def testDefaults(self):
+        self.assertEqual(
+            self.canonical(),
+            TemplaterTemplatePack.TemplaterTemplateMultiCmd.DEFAULT_OPTIONS
+            )
+
+    def testTiltWithoutIndices(self):
+        self.assertFalse(self.canonical(indices = False, tilt = True)["tilt"])
+
+    def testWithoutFrame(self):
+        options = self.canonical(frame = False, ink = "#00d", bom_rows = 4)
+        self.assertFalse(options["indices"])
+        self.assertFalse(options["title_block"])
+        self.assertEqual(options["ink"], "#000")
+        self.assertEqual(options["bom_rows"], 0)
+
+    def testTypes(self):
+        options = self.canonical(bom_rows = 3.0, text_to_path = 1)
+        self.assertIs(options["bom_rows"], 3)
+        self.assertIs(options["text_to_path"], True)
+
+    def testNoMergedSymbol(self):
+        self.assertIsNone(self.canonical(merged_symbol = "")["merged_symbol"])
+
+    def testEqualTemplatesGetEqualOptions(self):
+        self.assertEqual(
+            self.canonical(frame = False, tilt = False),
+            self.canonical(frame = False, tilt = True, indices = True)
+            )
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-3.0-or-later
+"""
+Tests of the page numbering of TemplaterPages
+"""
+
+import unittest
+
+import standins
+import TemplaterPages
+
+class FirstFreeNumberTests(unittest.TestCase):
+
+    def testNoPages(self):
+        self.assertEqual(TemplaterPages.firstFreeNumber([]), 1)
+
+    def testWithoutGap(self):
+        self.assertEqual(TemplaterPages.firstFreeNumber([1, 2, 3]), 4)
+
+    def testGap(self):
+        self.assertEqual(TemplaterPages.firstFreeNumber([1, 2, 4, 5]), 3)
+        self.assertEqual(TemplaterPages.firstFreeNumber([2, 3]), 1)
+
+    def testLongList(self):
+        numbers = list(range(1, 1001))
+        numbers.remove(700)
+        self.assertEqual(TemplaterPages.firstFreeNumber(numbers), 700)
+
+    def testPageNames(self):
+        self.assertEqual(TemplaterPages.pageNames(7), ("Page07", "Template07"))
+        self.assertEqual(TemplaterPages.pageNumber("Page123"), 123)
+        self.assertIsNone(TemplaterPages.pageNumber("Page"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-3.0-or-later
+"""
+Tests of the JSON-RPC dispatching of TemplaterServer
+"""
+
+import unittest
+
+import standins
+import TemplaterServer
+
+class DispatchTests(unittest.TestCase):
+
+    def setUp(self):
+        self.server = TemplaterServer.RenderServer(workers = 1)
+
+    def tearDown(self):
+        self.server.executor.shutdown()
+
+    def dispatch(self, method, params = None, request_id = 1):
+        request = {"jsonrpc":"2.0", "id":request_id, "method":method}
+        if params is not None:
+            request["params"] = params
+        return self.server.dispatch(request)
+
+    def errorCode(self, reply):
+        return reply["error"]["code"]
+
+    def testPing(self):
+        self.assertEqual(
+            self.dispatch("ping"), {"jsonrpc":"2.0", "id":1, "result":"pong"}
+            )
+
+    def testInvalidRequest(self):
+        reply = self.server.dispatch(["ping"])
+        self.assertEqual(self.errorCode(reply), TemplaterServer.INVALID_REQUEST)
+
+    def testUnknownMethod(self):
+        reply = self.dispatch("createDrawing")
+        self.assertEqual(self.errorCode(reply), TemplaterServer.METHOD_NOT_FOUND)
+
+    def testUnknownParameter(self):
+        reply = self.dispatch("createTemplate", {"colour":"#00d"})
+        self.assertEqual(self.errorCode(reply), TemplaterServer.INVALID_PARAMS)
+
+    def testUnknownFormat(self):
+        reply = self.dispatch("createTemplate", {"format":"XYZ"})
+        self.assertEqual(self.errorCode(reply), TemplaterServer.INVALID_PARAMS)
+
+    def testParamsNoObject(self):
+        reply = self.dispatch("createTemplate", ["ISO A3"])
+        self.assertEqual(self.errorCode(reply), TemplaterServer.INVALID_PARAMS)
+
+    def testNotification(self):
+        self.assertIsNone(
+            self.server.dispatch({"jsonrpc":"2.0", "method":"ping"})
+            )
+
+    def testCreateTemplate(self):
+        reply = self.dispatch(
+            "createTemplate", {"format":"ISO A3", "ink":"#00d"}, "a3"
+            )
+        self.assertEqual(reply["id"], "a3")
+        svg = reply["result"]["svg"]
+        self.assertTrue(svg.startswith("<?xml"))
+        self.assertIn("420", svg)
+        self.assertTrue(svg.endswith("</svg>"))
+
+if __name__ == "__main__":
+    unittest.main()